@@ -1,5 +1,6 @@
 import zipfile
 from fastapi import FastAPI, HTTPException, Depends, status, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
@@ -10,9 +11,12 @@ import logging
 from pathlib import Path
 
 from pydantic import BaseModel
-from common.jira_util import export_issues_to_csv, count_issues_in_project
+from common.jira_util import count_issues_in_project
+from common.batch_export import batches_export
 import db_import
 from main import QueryConfig
+from common.ruleset_manager import RULESET_MANAGER
+from common.rule_profiler import RULE_PROFILER
 import psycopg2
 import os
 
@@ -54,6 +58,7 @@ class QueryRequest(BaseModel):
     fields: Optional[List[str]] = None
     batch_size: Optional[int] = 1000
     filename: Optional[str] = None
+    resume: Optional[bool] = False
 
 
 class QueryResponse(BaseModel):
@@ -386,10 +391,15 @@ async def execute_query(
         if base_filename.lower().endswith('.csv'):
             base_filename = base_filename[:-4]
 
-        # Get query statistics
-        result = count_issues_in_project(
+        # Jira calls and the batch retries (time.sleep backoff) block, so
+        # they run in the threadpool instead of on the event loop.
+        # Get query statistics; the count sizes the export batches, so it
+        # must not come from the count cache
+        result = await run_in_threadpool(
+            count_issues_in_project,
             query_request.jql_query,
-            str(config.CONFIG_FILE)
+            str(config.CONFIG_FILE),
+            use_cache=False
         )
 
         if result is None:
@@ -408,36 +418,25 @@ async def execute_query(
                 exported_files=[]
             )
 
-        exported_files = []
-        # Export tickets in batches
-        for batch in range(0, records, batch_size):
-            # Delete existing CSV files with the same base filename
-            for existing_file in config.DATA_DIR.glob(f'{base_filename.lower()}*.csv'):
-                try:
-                    existing_file.unlink()
-                    logger.info(f"Deleted existing file: {existing_file}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete file {existing_file}: {str(e)}")
-            output_file = config.DATA_DIR / \
-                f'{base_filename}_batch_{batch // batch_size + 1}.csv'
-
-            success, count = export_issues_to_csv(
-                query_request.jql_query,
-                str(config.CONFIG_FILE),
-                fields,
-                str(output_file),
-                max_results=batch_size,
-                start_at=batch
-            )
-
-            if not success:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to export batch starting at {batch}"
-                )
+        # Export tickets in batches; with resume, batches completed intact
+        # by the previous run of the same query are kept
+        success, exported_files = await run_in_threadpool(
+            batches_export,
+            query_request.jql_query,
+            str(config.CONFIG_FILE),
+            fields,
+            config.DATA_DIR,
+            base_filename,
+            records,
+            batch_size,
+            query_request.resume
+        )
 
-            exported_files.append(str(output_file))
-            logger.info(f"Exported {count:,} tickets to {output_file}")
+        if not success:
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to export some batches; retry with resume enabled"
+            )
 
         return QueryResponse(
             total_issues=total,
@@ -603,6 +602,29 @@ async def import_data_task(
 
 
 
+@app.on_event("startup")
+def ruleset_manager_start():
+    """Compile the ruleset before serving and reload it in the background on change"""
+    RULESET_MANAGER.start()
+
+
+@app.on_event("shutdown")
+def ruleset_manager_stop():
+    RULESET_MANAGER.stop()
+
+
+@app.get("/api/rules/status")
+async def rules_status(current_user: User = Depends(get_current_user)):
+    """Active ruleset version, its compile time and reload history"""
+    return RULESET_MANAGER.status()
+
+
+@app.get("/api/rules/profile")
+async def rules_profile(current_user: User = Depends(get_current_user)):
+    """Per-rule and per-condition evaluation statistics (RULE_PROFILING=true)"""
+    return RULE_PROFILER.report()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -0,0 +1,80 @@
+"""
+Benchmark stage-date and transition lookups over issue changelogs: one
+JSONPath walk of the histories per query vs the single-pass ChangelogIndex.
+
+Run from the repository root:
+    python -m benchmarks.changelog_index_benchmark
+"""
+
+import time
+
+from benchmarks.synthetic_issues import synthetic_cr_issues_build
+from common.changelog_index import jira_timestamp_parse
+from common.config_registry import CR_STATUSES_FILE, config_json_get
+from common.json_util import parse_json_v2
+from common.jira_util_v2 import date_of_stage_get, transitions_details_get
+from common.status_index import status_index_get
+
+TOTAL_ISSUES = 300
+TRANSITIONS = 30
+
+
+def scan_last_change_date(histories, field_name, current_stage):
+    # Per-query walk the indexer replaced
+    created_date = None
+    for history in histories:
+        for item in parse_json_v2("$.items", history):
+            if parse_json_v2("$.field", item) == field_name and \
+                    parse_json_v2("$.toString", item) in current_stage:
+                created_date = jira_timestamp_parse(parse_json_v2("$.created", history))
+    return created_date
+
+
+def scan_transitions(histories, field_name, current_stage):
+    transitions = []
+    for history in histories:
+        for item in parse_json_v2("$.items", history):
+            if parse_json_v2("$.field", item) == field_name:
+                to_status = parse_json_v2("$.toString", item)
+                if to_status in current_stage:
+                    transitions.append({
+                        "from_status": parse_json_v2("$.fromString", item),
+                        "to_status": to_status,
+                        "date": jira_timestamp_parse(
+                            parse_json_v2("$.created", history)).strftime("%Y-%m-%d")
+                    })
+    return transitions
+
+
+def run(issues, stages, date_get, transitions_get):
+    started = time.perf_counter()
+    results = []
+    for issue in issues:
+        histories = issue["changelog"]["histories"]
+        for stage in stages:
+            results.append(date_get(histories, stage))
+            results.append(transitions_get(histories, stage))
+    return results, time.perf_counter() - started
+
+
+def main() -> None:
+    issues = synthetic_cr_issues_build(TOTAL_ISSUES, transitions=TRANSITIONS)
+    status_index = status_index_get()
+    stages = [status_index.jira_statuses_get(stage)
+              for stage in sorted(set(config_json_get(CR_STATUSES_FILE).values()))]
+    print(f"{TOTAL_ISSUES} issues, {TRANSITIONS} changelog entries, {len(stages)} stages")
+
+    scanned, scan_time = run(
+        issues, stages,
+        lambda histories, stage: (lambda date: date and date.strftime("%Y-%m-%d"))(
+            scan_last_change_date(histories, 'status', stage)),
+        lambda histories, stage: scan_transitions(histories, 'status', stage))
+    indexed, index_time = run(issues, stages, date_of_stage_get, transitions_details_get)
+    print(f"per-query scan:  {scan_time * 1000 / TOTAL_ISSUES:.2f} ms/issue")
+    print(f"changelog index: {index_time * 1000 / TOTAL_ISSUES:.2f} ms/issue "
+          f"({scan_time / index_time:.1f}x)")
+    print(f"identical results: {scanned == indexed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark per-row vs bulk enrichment in csv_util.add_analysis_columns_to_csv.
+
+Run from the repository root:
+    python -m benchmarks.csv_enrichment_benchmark
+"""
+
+import csv
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.jira_stub_server import JiraStubServer
+from common import csv_util, jira_util
+from common.issue_cache import IssueCache
+
+TOTAL_ROWS = 500
+LATENCY = 0.02
+CHUNK_SIZES = [50, 100]
+PARSING_PATHS = {
+    "key": "$.key",
+    "bom_decision": ["$.fields[*].status[*].name"],
+    "bom_approval_date": ["$.fields[*].updated"],
+}
+
+
+def workspace_prepare(directory: Path) -> None:
+    """Lay out the config files add_analysis_columns_to_csv reads, relative to cwd."""
+    (directory / "config").mkdir()
+    (directory / "config-pattern").mkdir()
+    (directory / "config" / "jira_team_accounts.json").write_text(json.dumps(
+        {"team_accounts": [{"IT CM": {"account": "bench", "token": "bench"}}]}))
+    (directory / "config-pattern" / jira_util.PARSING_PATHS_FILE).write_text(
+        json.dumps(PARSING_PATHS))
+    with open(directory / "input.csv", "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["key", "summary"])
+        for number in range(1, TOTAL_ROWS + 1):
+            writer.writerow([f"BO-{number}", f"Synthetic issue {number}"])
+
+
+def run(server: JiraStubServer, label: str, output_file: str, **kwargs) -> None:
+    server.request_count = 0
+    started = time.perf_counter()
+    csv_util.add_analysis_columns_to_csv("./", "input.csv", output_file, **kwargs)
+    elapsed = time.perf_counter() - started
+    print(f"{label}: {elapsed:.2f}s, {TOTAL_ROWS / elapsed:.0f} rows/sec, "
+          f"{server.request_count} requests")
+
+
+def main() -> None:
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            JiraStubServer(TOTAL_ROWS, LATENCY) as server:
+        jira_util.JIRA_URL = server.url
+        # Start the per-row path from a cold issue cache
+        jira_util.ISSUE_CACHE = IssueCache(Path(tmp_dir) / "issue_cache.sqlite")
+        workspace_prepare(Path(tmp_dir))
+        os.chdir(tmp_dir)
+        try:
+            print(f"{TOTAL_ROWS} rows, {LATENCY * 1000:.0f} ms per request")
+            run(server, "per-row", "per_row.csv", bulk=False)
+            for chunk_size in CHUNK_SIZES:
+                run(server, f"bulk chunk_size={chunk_size}", f"bulk_{chunk_size}.csv",
+                    chunk_size=chunk_size)
+            same = Path("per_row.csv").read_text() == Path(f"bulk_{CHUNK_SIZES[0]}.csv").read_text()
+            print(f"identical output: {same}")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
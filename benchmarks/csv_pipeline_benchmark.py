@@ -0,0 +1,94 @@
+"""
+Benchmark the original per-step csv_util passes (benchmarks/csv_util_per_step.py)
+chained file to file vs one fused csv_stages_run pass.
+
+Run from the repository root:
+    python -m benchmarks.csv_pipeline_benchmark
+"""
+
+import contextlib
+import csv
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks import csv_util_per_step
+from common import csv_util
+
+TOTAL_ROWS = 20000
+PER_STEP_FUNCTIONS = {
+    "validation": csv_util_per_step.add_validation_column_to_csv,
+    "modified_day": csv_util_per_step.add_modified_day_column_to_csv,
+    "deliquency": csv_util_per_step.add_deliquency_column_to_csv,
+    "review": csv_util_per_step.add_review_column_to_csv,
+    "violated_rules": csv_util_per_step.violated_rules_to_csv,
+}
+CHAINS = [
+    ["validation", "modified_day", "violated_rules"],
+    ["validation", "review", "violated_rules"],
+]
+COLUMNS = ["key", "requestor", "assignee", "bom_decision", "biz_benefits", "biz_priority",
+           "biz_division", "bizexpect_timeline", "updated_date", "system_name",
+           "age_till_cutoff_time", "biz_status", "end_date", "start_date", "estimated_efforts",
+           "bom_approval_date", "created", "resolutiondate"]
+
+
+def input_write(path: Path, total: int, seed: int = 5) -> None:
+    rng = random.Random(seed)
+
+    def date():
+        return f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}"
+
+    def maybe(value):
+        return rng.choice([value, "Not Available"])
+
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        for number in range(total):
+            writer.writerow([
+                f"CR-{number}", "requestor", rng.choice(["requestor", "assignee"]),
+                rng.choice(["Approved", "Approved by Department", "Deferred"]),
+                maybe("benefits"), maybe("High"), maybe("Operations"), maybe("Q3"),
+                date(), "SYSTEM", rng.randint(0, 200), rng.choice(["Open", "Closed"]),
+                maybe(date()), maybe(date()), maybe("10"), maybe(date()), date(),
+                date() + "T10:00:00.000+0700"])
+
+
+def chained_run(output_path: str, stage_names) -> str:
+    # Each original step reads the previous step's file; returns the last file name
+    input_file = "input.csv"
+    for number, stage_name in enumerate(stage_names):
+        if stage_name == "modified_day":
+            # Always writes <input>_modified.csv
+            result = PER_STEP_FUNCTIONS[stage_name](output_path, input_file)
+        else:
+            result = PER_STEP_FUNCTIONS[stage_name](output_path, input_file, f"chained_{number}.csv")
+        input_file = result["file_name"]
+    return input_file
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = f"{tmp_dir}/"
+        input_write(Path(tmp_dir) / "input.csv", TOTAL_ROWS)
+        print(f"{TOTAL_ROWS} rows")
+        for stage_names in CHAINS:
+            # fields_validate prints every requestor-pending row
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                chained_file = chained_run(output_path, stage_names)
+                chained = time.perf_counter() - started
+                started = time.perf_counter()
+                csv_util.csv_stages_run(output_path, "input.csv", "fused.csv", stage_names)
+                fused = time.perf_counter() - started
+            same = (Path(tmp_dir) / chained_file).read_text() == \
+                (Path(tmp_dir) / "fused.csv").read_text()
+            print(f"{' -> '.join(stage_names)}: chained {chained:.2f}s, fused {fused:.2f}s "
+                  f"({chained / fused:.1f}x), identical output: {same}")
+
+
+if __name__ == "__main__":
+    main()
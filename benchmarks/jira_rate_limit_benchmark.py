@@ -0,0 +1,72 @@
+"""
+Benchmark several concurrent exporters against a throttling Jira stand-in.
+
+The stand-in answers 429 with Retry-After once its request budget is
+exceeded; the shared AdaptiveRateLimiter should keep every result complete
+while aggregate throughput stays close to the server's limit. Each 429
+halves the rate and pauses every caller for about a second, so the long-run
+average sits below the limit: with TOTAL_ISSUES = 20000 one run measured
+37.5 pages/sec against 40 req/s (32.5 with an increase step of 1 instead of
+JIRA_RATE_LIMIT_INCREASE's 4). The default short run also spends the
+server's initial burst allowance, so it can read at or slightly above the
+limit.
+
+Run from the repository root:
+    python -m benchmarks.jira_rate_limit_benchmark
+"""
+
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.jira_stub_server import JiraStubServer
+from common import jira_util
+
+TOTAL_ISSUES = 6000
+PAGE_SIZE = 50
+SERVER_RATE_LIMIT = 40.0
+EXPORTERS = 3
+EXPORTER_CONCURRENCY = 8
+# Start well above the server limit so the limiter has to back off
+INITIAL_CLIENT_RATE = 80.0
+
+
+def credentials_file_write(directory: str) -> str:
+    config_file = Path(directory) / "jira_team_accounts.json"
+    config_file.write_text(json.dumps(
+        {"team_accounts": [{"IT CM": {"account": "bench", "token": "bench"}}]}))
+    return str(config_file)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            JiraStubServer(TOTAL_ISSUES, 0.01, PAGE_SIZE, rate_limit=SERVER_RATE_LIMIT) as server:
+        jira_util.JIRA_URL = server.url
+        jira_util.JIRA_RATE_LIMITER.rate = INITIAL_CLIENT_RATE
+        jira_util.JIRA_RATE_LIMITER.burst = INITIAL_CLIENT_RATE
+        config_file = credentials_file_write(tmp_dir)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=EXPORTERS) as executor:
+            results = list(executor.map(
+                lambda _: jira_util.get_jira_issues(
+                    "project = BO", config_file,
+                    max_results=PAGE_SIZE, concurrency=EXPORTER_CONCURRENCY),
+                range(EXPORTERS)
+            ))
+        elapsed = time.perf_counter() - started
+
+        pages = EXPORTERS * TOTAL_ISSUES // PAGE_SIZE
+        complete = all(len(issues) == total == TOTAL_ISSUES for issues, total in results)
+        print(f"{EXPORTERS} exporters x {EXPORTER_CONCURRENCY} workers, "
+              f"server limit {SERVER_RATE_LIMIT:.0f} req/s")
+        print(f"{pages} pages in {elapsed:.1f}s = {pages / elapsed:.1f} pages/sec, "
+              f"complete={complete}")
+        print(f"server: {server.request_count} requests, {server.throttled_count} throttled")
+        print(f"limiter: {jira_util.JIRA_RATE_LIMITER.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Local stand-in for the Jira REST endpoints used by common.jira_util.
+
+Serves a synthetic issue set with a fixed per-request latency so benchmarks
+can measure client-side behaviour without touching a real Jira instance.
+"""
+
+import csv
+import io
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+def synthetic_issues_build(total: int) -> List[Dict]:
+    """Build ``total`` minimal issues shaped like Jira search results."""
+    return [
+        {
+            "id": str(10000 + i),
+            "key": f"BO-{i + 1}",
+            "fields": {
+                "summary": f"Synthetic issue {i + 1}",
+                "status": {"name": "Closed"},
+                "created": "2024-08-07T10:00:00.000+0700",
+                "updated": "2024-09-01T10:00:00.000+0700",
+            },
+        }
+        for i in range(total)
+    ]
+
+
+class JiraStubServer:
+    """
+    Threaded HTTP server answering Jira REST calls from memory.
+
+    With ``rate_limit`` set, requests beyond that many per second (bursts up
+    to ``rate_limit`` allowed) are answered with 429 and a Retry-After header.
+    """
+
+    def __init__(self, total_issues: int = 1000, latency: float = 0.05, max_page_size: int = 100,
+                 rate_limit: Optional[float] = None, retry_after: int = 1):
+        self.issues = synthetic_issues_build(total_issues)
+        self.issues_by_key = {issue["key"]: issue for issue in self.issues}
+        self.attachments: Dict[str, bytes] = {}
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.request_count = 0
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.throttled_count = 0
+        self._tokens = rate_limit or 0.0
+        self._tokens_updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "JiraStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "JiraStubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def admit(self) -> bool:
+        """Take a token from the server-side bucket; False means throttle."""
+        if self.rate_limit is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate_limit,
+                               self._tokens + (now - self._tokens_updated) * self.rate_limit)
+            self._tokens_updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.throttled_count += 1
+            return False
+
+    def search_page(self, params: Dict[str, List[str]]) -> Dict:
+        start_at = int(params.get("startAt", ["0"])[0])
+        max_results = min(int(params.get("maxResults", ["50"])[0]), self.max_page_size)
+        issues = self.issues
+        # Only ``key in (...)`` is understood; any other JQL matches everything
+        key_filter = re.search(r"key\s+in\s*\(([^)]*)\)", params.get("jql", [""])[0], re.I)
+        if key_filter:
+            keys = {key.strip() for key in key_filter.group(1).split(",")}
+            issues = [issue for issue in issues if issue["key"] in keys]
+        return {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(issues),
+            "issues": issues[start_at:start_at + max_results],
+        }
+
+    def attachment_add(self, issue_key: str, filename: str, content: bytes) -> Dict:
+        """Attach ``content`` to an issue; served under /secure/attachment/."""
+        attachment_id = str(20000 + len(self.attachments))
+        self.attachments[attachment_id] = content
+        attachment = {
+            "id": attachment_id,
+            "filename": filename,
+            "size": len(content),
+            "content": f"{self.url}/secure/attachment/{attachment_id}/{filename}",
+        }
+        fields = self.issues_by_key[issue_key]["fields"]
+        fields.setdefault("attachment", []).append(attachment)
+        return attachment
+
+    def csv_export(self, params: Dict[str, List[str]]) -> bytes:
+        start_at = int(params.get("pager/start", ["0"])[0])
+        limit = int(params.get("tempMax", ["1000"])[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["Summary", "Issue key", "Issue id", "Status", "Created"])
+        for issue in self.issues[start_at:start_at + limit]:
+            fields = issue["fields"]
+            writer.writerow([
+                f"{fields['summary']}\nsecond line, with \"quotes\"",
+                issue["key"],
+                issue["id"],
+                fields["status"]["name"],
+                fields["created"],
+            ])
+        return buffer.getvalue().encode("utf-8")
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.request_count += 1
+                if not stub.admit():
+                    body = b'{"errorMessages": ["Rate limit exceeded"]}'
+                    self.send_response(429)
+                    self.send_header("Retry-After", str(stub.retry_after))
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                time.sleep(stub.latency)
+                parsed = urlparse(self.path)
+                params = parse_qs(parsed.query)
+                if parsed.path.endswith("/search"):
+                    self._json_send(200, stub.search_page(params))
+                elif "/issue/" in parsed.path:
+                    issue = stub.issues_by_key.get(parsed.path.rsplit("/", 1)[-1])
+                    if issue is None:
+                        self._json_send(404, {"errorMessages": ["Issue does not exist"]})
+                    else:
+                        self._json_send(200, issue)
+                elif parsed.path.startswith("/secure/attachment/"):
+                    attachment_id = parsed.path.split("/")[3]
+                    self._body_send(200, "application/octet-stream", stub.attachments[attachment_id])
+                elif parsed.path.endswith("SearchRequest.csv"):
+                    self._body_send(200, "application/csv", stub.csv_export(params))
+                else:
+                    self._json_send(404, {"errorMessages": [f"Unknown path {parsed.path}"]})
+
+            def _json_send(self, status_code: int, payload: Dict) -> None:
+                self._body_send(status_code, "application/json", json.dumps(payload).encode("utf-8"))
+
+            def _body_send(self, status_code: int, content_type: str, body: bytes) -> None:
+                self.send_response(status_code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
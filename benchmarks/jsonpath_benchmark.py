@@ -0,0 +1,61 @@
+"""
+Benchmark per-issue field extraction with and without the compiled JSONPath
+cache in common.json_util.
+
+Run from the repository root:
+    python -m benchmarks.jsonpath_benchmark
+"""
+
+import time
+
+from jsonpath_ng import parse
+
+from benchmarks.synthetic_issues import PARSING_PATHS, synthetic_cr_issues_build
+from common import issue_field_handler_v2, json_util
+from common.issue_field_handler_v2 import perform_operation
+from common.json_util import parse_json_v2
+
+TOTAL_ISSUES = 300
+
+
+def issue_extract(issue):
+    row = [perform_operation(item, issue, PARSING_PATHS[item]) for item in PARSING_PATHS]
+    for history in parse_json_v2("$.changelog.histories", issue):
+        row.append(parse_json_v2("$.created", history))
+        row.append(parse_json_v2("$.items[0].toString", history))
+    return row
+
+
+def run(issues):
+    started = time.perf_counter()
+    rows = [issue_extract(issue) for issue in issues]
+    return rows, time.perf_counter() - started
+
+
+def main() -> None:
+    issues = synthetic_cr_issues_build(TOTAL_ISSUES)
+    modules = (json_util, issue_field_handler_v2)
+    jsonpath_compile = json_util.jsonpath_compile
+
+    # Before: every lookup re-parses its path string
+    for module in modules:
+        module.jsonpath_compile = parse
+    try:
+        uncached_rows, uncached = run(issues)
+    finally:
+        for module in modules:
+            module.jsonpath_compile = jsonpath_compile
+
+    jsonpath_compile.cache_clear()
+    cached_rows, cached = run(issues)
+
+    print(f"{TOTAL_ISSUES} issues, {len(PARSING_PATHS)} parsing paths, changelog of "
+          f"{len(issues[0]['changelog']['histories'])} entries")
+    print(f"uncached: {uncached * 1000 / TOTAL_ISSUES:.2f} ms/issue")
+    print(f"cached:   {cached * 1000 / TOTAL_ISSUES:.2f} ms/issue "
+          f"({uncached / cached:.1f}x), {jsonpath_compile.cache_info()}")
+    print(f"identical rows: {uncached_rows == cached_rows}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark generic JSONPath extraction vs compiled parsing-paths extractors.
+
+Run from the repository root:
+    python -m benchmarks.parsing_paths_benchmark
+"""
+
+import time
+
+from benchmarks.synthetic_issues import PARSING_PATHS, synthetic_cr_issues_build
+from common.issue_field_handler_v2 import issue_row_extractor_compile, perform_operation
+from common.json_util import parse_json_v2, row_extractor_compile
+
+TOTAL_ISSUES = 2000
+RAW_PATHS = {item: path for item, path in PARSING_PATHS.items() if isinstance(path, str)}
+
+
+def timed(label, issues, row_extract):
+    started = time.perf_counter()
+    rows = [row_extract(issue) for issue in issues]
+    elapsed = time.perf_counter() - started
+    print(f"{label}: {TOTAL_ISSUES / elapsed:,.0f} issues/sec")
+    return rows, elapsed
+
+
+def main() -> None:
+    issues = synthetic_cr_issues_build(TOTAL_ISSUES)
+    print(f"{TOTAL_ISSUES} issues, {len(PARSING_PATHS)} parsing paths")
+
+    generic, generic_time = timed(
+        "perform_operation per field", issues,
+        lambda issue: [perform_operation(item, issue, PARSING_PATHS[item]) for item in PARSING_PATHS])
+    compiled, compiled_time = timed(
+        "issue_row_extractor_compile", issues, issue_row_extractor_compile(PARSING_PATHS))
+    print(f"  {generic_time / compiled_time:.1f}x, identical rows: {generic == compiled}")
+
+    generic, generic_time = timed(
+        "parse_json_v2 per path", issues,
+        lambda issue: [parse_json_v2(path, issue) for path in RAW_PATHS.values()])
+    compiled, compiled_time = timed(
+        "row_extractor_compile", issues, row_extractor_compile(RAW_PATHS))
+    print(f"  {generic_time / compiled_time:.1f}x, identical rows: {generic == compiled}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark rule evaluation row by row (rules_exec) vs batch evaluation
+(rules_batch_exec) over reminder inputs.
+
+Run from the repository root:
+    python -m benchmarks.rules_batch_benchmark
+"""
+
+import random
+import time
+
+import pandas as pd
+
+from services.ruleengine_exec import rules_batch_exec, rules_exec
+
+TOTAL_ROWS = 20000
+
+
+def reminder_rows_build(total, seed=11):
+    # Half closing-ticket inputs, half supplement-info inputs, as the extractors send them
+    rng = random.Random(seed)
+    rows = []
+    for number in range(total):
+        if number % 2:
+            expected = rng.randint(-5, 30)
+            rows.append({
+                'p_days_since_approval': rng.randint(-5, 30),
+                'p_days_since_expected_date': expected,
+                'result_of_modulus': expected % 3
+            })
+        else:
+            review = rng.randint(0, 30)
+            rows.append({'p_days_since_start_review': review, 'result_of_modulus': review % 2})
+    return rows
+
+
+def timed(label, run):
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    print(f"{label}: {elapsed * 1e6 / TOTAL_ROWS:.1f} us/row")
+    return result, elapsed
+
+
+def main() -> None:
+    rows = reminder_rows_build(TOTAL_ROWS)
+    frame = pd.DataFrame(rows)
+    rules_exec(rows[0])  # compile outside the timings
+
+    single, single_time = timed("rules_exec per row", lambda: [rules_exec(row) for row in rows])
+    batch, batch_time = timed("rules_batch_exec (list)", lambda: rules_batch_exec(rows))
+    batch_frame, frame_time = timed("rules_batch_exec (DataFrame)", lambda: rules_batch_exec(frame))
+    print(f"  list {single_time / batch_time:.1f}x, DataFrame {single_time / frame_time:.1f}x")
+    print(f"identical results: {single == batch}, "
+          f"{batch_frame['pattern_result'].tolist() == [row['pattern_result'] for row in single]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Synthetic change-request issues with custom fields and changelogs, shaped
+like the Jira responses the extractors in common/ parse.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+STATUS_FLOW = [
+    "Open", "In Review", "Approved", "In Development", "UAT",
+    "In progress of Deployment", "Deployed", "Done",
+]
+
+PARSING_PATHS = {
+    "key": "$.key",
+    "summary": "$.fields[*].summary",
+    "created": "$.fields[*].created",
+    "updated": "$.fields[*].updated",
+    "status": "$.fields[*].status[*].name",
+    "requestor": "$.fields[*].reporter.emailAddress",
+    "assignee": "$.fields[*].assignee.emailAddress",
+    "changerequesttype": [
+        "$.fields[*].customfield_13805[*].value",
+        "$.fields[*].customfield_13806[*].value",
+        "$.fields[*].customfield_13807[*].value",
+    ],
+    "biz_benefits": [
+        "$.fields[*].customfield_13824",
+        "$.fields[*].customfield_13867",
+    ],
+    "biz_priority": [
+        "$.fields[*].customfield_13825[*].value",
+        "$.fields[*].customfield_13870[*].value",
+    ],
+    "bom_decision": [
+        "$.fields[*].customfield_13890[*].value",
+        "$.fields[*].customfield_13895[*].value",
+    ],
+    "bom_approval_date": [
+        "$.fields[*].customfield_13893",
+        "$.fields[*].customfield_13898",
+    ],
+    "start_date": [
+        "$.fields[*].customfield_13822",
+        "$.fields[*].customfield_14090",
+    ],
+    "end_date": [
+        "$.fields[*].customfield_13823",
+        "$.fields[*].duedate",
+    ],
+    "delay_reason_type": [
+        "$.fields[*].customfield_14032.value",
+    ],
+    "histories": "$.changelog.histories",
+}
+
+
+def jira_timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0700")
+
+
+def changelog_build(created: datetime, transitions: int, rng: random.Random) -> Dict:
+    histories = []
+    moment = created
+    for number in range(transitions):
+        moment += timedelta(hours=rng.randint(1, 72))
+        items = [{
+            "field": "status",
+            "fieldtype": "jira",
+            "fromString": STATUS_FLOW[number % len(STATUS_FLOW)],
+            "toString": STATUS_FLOW[(number + 1) % len(STATUS_FLOW)],
+        }]
+        if rng.random() < 0.5:
+            items.append({
+                "field": "assignee",
+                "fieldtype": "jira",
+                "fromString": f"user{rng.randint(1, 9)}",
+                "toString": f"user{rng.randint(1, 9)}",
+            })
+        histories.append({
+            "id": str(100000 + number),
+            "author": {"displayName": f"User {rng.randint(1, 9)}"},
+            "created": jira_timestamp(moment),
+            "items": items,
+        })
+    return {"startAt": 0, "maxResults": transitions, "total": transitions, "histories": histories}
+
+
+def synthetic_cr_issues_build(total: int, transitions: int = 12, seed: int = 7) -> List[Dict]:
+    """
+    Build ``total`` change-request issues with a ``transitions``-entry changelog.
+
+    Roughly a third of the optional custom fields are left empty so the
+    "Not Available" and fallback branches are exercised.
+    """
+    rng = random.Random(seed)
+    base = datetime(2024, 8, 1, 9, 0)
+    issues = []
+    for number in range(1, total + 1):
+        created = base + timedelta(hours=number)
+        filled = rng.random() > 0.33
+        fields = {
+            "summary": f"Change request {number}",
+            "created": jira_timestamp(created),
+            "updated": jira_timestamp(created + timedelta(days=3)),
+            "status": {"name": STATUS_FLOW[number % len(STATUS_FLOW)]},
+            "reporter": {"emailAddress": f"reporter{number % 17}@example.com",
+                         "accountId": f"acc-{number % 17}"},
+            "assignee": {"emailAddress": f"dev{number % 5}@example.com"} if filled else None,
+            "customfield_13805": {"value": "Enhancement"} if filled else None,
+            "customfield_13824": "Saves 2 FTE per month" if filled else None,
+            "customfield_13825": {"value": "High"},
+            "customfield_13890": {"value": "Approved"} if filled else None,
+            "customfield_13893": "2024-09-15" if filled else None,
+            "customfield_13822": None,
+            "customfield_14090": "2024-09-20" if filled else None,
+            "customfield_13823": "2024-10-20" if filled else None,
+            "duedate": "2024-10-25",
+            "customfield_14032": {"value": "Vendor delay"} if not filled else None,
+        }
+        issues.append({
+            "id": str(10000 + number),
+            "key": f"BO-{number}",
+            "fields": fields,
+            "changelog": changelog_build(created, transitions, rng),
+        })
+    return issues
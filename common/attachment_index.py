@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = ".attachments_index.jsonl"
+
+
+class AttachmentIndex:
+    """
+    Append-only record of attachments fully downloaded into a directory.
+
+    One JSON line is appended per completed download, after the file has been
+    renamed into place, so a crash can only ever lose the record of a file
+    (which is then downloaded again), never mark a partial file as complete.
+    Entries are keyed by attachment id, since filenames repeat across issues;
+    the last line for an id wins. Each entry also records the file's path
+    relative to the directory, so an attachment keeps the path it was first
+    stored at across runs.
+    """
+
+    def __init__(self, output_path: Path):
+        self.index_file = Path(output_path) / INDEX_FILE_NAME
+        self._entries: Dict[str, Dict] = {}
+        # Relative path -> id of the attachment whose content is stored there
+        self._owners: Dict[str, str] = {}
+        # Attachment id -> path handed out by path_claim during this run
+        self._claims: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-append
+                        continue
+                    if "id" not in entry:
+                        continue
+                    entry["id"] = str(entry["id"])
+                    # Entries written before paths were recorded are flat files
+                    entry.setdefault("path", entry.get("filename"))
+                    self._entries[entry["id"]] = entry
+                    if entry["path"]:
+                        self._owners[entry["path"]] = entry["id"]
+        except FileNotFoundError:
+            pass
+
+    def path_claim(self, attachment: Dict, directory: str = "") -> str:
+        """
+        Reserve the path, relative to the index directory, to store an attachment at.
+
+        An attachment already recorded keeps its path, as long as no other
+        attachment has been written there since. Otherwise it gets
+        ``directory/<filename>``, or ``directory/<id>_<filename>`` when that
+        name is taken by a different attachment, so files sharing a name
+        never overwrite each other.
+        """
+        attachment_id = str(attachment['id'])
+        with self._lock:
+            path = self._claims.get(attachment_id)
+            if path is not None:
+                return path
+            entry = self._entries.get(attachment_id)
+            if entry is not None and self._owners.get(entry["path"]) == attachment_id:
+                path = entry["path"]
+            else:
+                path = os.path.join(directory, attachment['filename'])
+                if self._owners.get(path, attachment_id) != attachment_id:
+                    path = os.path.join(directory, f"{attachment_id}_{attachment['filename']}")
+                self._owners[path] = attachment_id
+            self._claims[attachment_id] = path
+            return path
+
+    def is_complete(self, attachment: Dict, file_path: Path) -> bool:
+        """Check whether ``file_path`` already holds this attachment in full."""
+        with self._lock:
+            entry = self._entries.get(str(attachment['id']))
+        if entry is None:
+            return False
+        expected_size = attachment.get('size', entry.get("size"))
+        try:
+            return os.path.getsize(file_path) == expected_size == entry.get("size")
+        except OSError:
+            return False
+
+    def record(self, attachment: Dict, issue_key: str, size: int, path: str) -> None:
+        """Record a completed download stored at ``path``, relative to the index directory."""
+        entry = {
+            "filename": attachment['filename'],
+            "id": str(attachment['id']),
+            "size": size,
+            "issue_key": issue_key,
+            "path": path
+        }
+        with self._lock:
+            self._entries[entry["id"]] = entry
+            self._owners[path] = entry["id"]
+            with open(self.index_file, 'a', encoding='utf-8') as file:
+                file.write(json.dumps(entry) + "\n")
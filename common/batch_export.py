@@ -0,0 +1,227 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from common.jira_util import export_issues_to_csv
+
+logger = logging.getLogger(__name__)
+
+BATCH_RETRIES = 3
+BATCH_BACKOFF_SECONDS = 2.0
+
+
+def delta_sets_get(data_dir: Path, query_type: str) -> List[int]:
+    """
+    Sequence numbers of the delta sets exported for a query type, ascending.
+
+    Each incremental run writes its own ``jira_{query_type}_tickets_delta_{n}``
+    set; db_import applies them after the full export in this order.
+    """
+    pattern = re.compile(
+        rf'^jira_{re.escape(query_type)}_tickets_delta_(\d+)_(?:batch_\d+\.csv|manifest\.json)$')
+    sequences = set()
+    for path in Path(data_dir).glob(f'jira_{query_type}_tickets_delta_*'):
+        match = pattern.match(path.name)
+        if match:
+            sequences.add(int(match.group(1)))
+    return sorted(sequences)
+
+
+def batch_set_remove(data_dir: Path, file_prefix: str) -> None:
+    """Remove the batch files and manifest of one export."""
+    files = list(Path(data_dir).glob(f'{file_prefix}_batch_*.csv'))
+    files.append(Path(data_dir) / f'{file_prefix}_manifest.json')
+    for file in files:
+        try:
+            file.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to remove file {file}: {str(e)}")
+
+
+def file_checksum(file_path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExportManifest:
+    """
+    Checkpoint of a batched export run.
+
+    Records, per batch, its offset, output file, row count and checksum once
+    the batch completes, so an interrupted or partially failed run can be
+    resumed by re-fetching only the batches that are missing, failed, or whose
+    file no longer matches its checksum.
+    """
+
+    def __init__(self, manifest_file: Path, jql: str, batch_size: int, records: int):
+        self.manifest_file = Path(manifest_file)
+        self.jql = jql
+        self.batch_size = batch_size
+        self.records = records
+        self.batches: Dict[str, Dict] = {}
+
+    @classmethod
+    def load(cls, manifest_file: Path) -> Optional["ExportManifest"]:
+        """Load a manifest from disk, or None if there is no readable one."""
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            manifest = cls(manifest_file, data["jql"], data["batch_size"], data["records"])
+            manifest.batches = data.get("batches", {})
+            return manifest
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable export manifest %s: %s", manifest_file, str(e))
+            return None
+
+    def matches(self, jql: str, batch_size: int, records: int) -> bool:
+        """Check whether this manifest describes the same export."""
+        return (self.jql, self.batch_size, self.records) == (jql, batch_size, records)
+
+    def batch_done(self, batch_number: int) -> bool:
+        """Check whether a batch completed and its file is still intact."""
+        batch = self.batches.get(str(batch_number))
+        if not batch or batch.get("status") != "completed":
+            return False
+        output_file = Path(batch["file"])
+        return output_file.exists() and file_checksum(output_file) == batch.get("checksum")
+
+    def batch_completed(self, batch_number: int, offset: int, output_file: Path, rows: int) -> None:
+        self.batches[str(batch_number)] = {
+            "status": "completed",
+            "offset": offset,
+            "file": str(output_file),
+            "rows": rows,
+            "checksum": file_checksum(output_file),
+            "completed_at": datetime.now().isoformat(timespec='seconds')
+        }
+        self.save()
+
+    def batch_failed(self, batch_number: int, offset: int, output_file: Path) -> None:
+        self.batches[str(batch_number)] = {
+            "status": "failed",
+            "offset": offset,
+            "file": str(output_file)
+        }
+        self.save()
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        part_file = f"{self.manifest_file}.part"
+        with open(part_file, 'w', encoding='utf-8') as file:
+            json.dump({
+                "jql": self.jql,
+                "batch_size": self.batch_size,
+                "records": self.records,
+                "batches": self.batches
+            }, file, indent=2)
+        os.replace(part_file, self.manifest_file)
+
+
+def export_batch_with_retry(
+    jql: str,
+    config_file: str,
+    fields: List[str],
+    output_file: Path,
+    batch_size: int,
+    offset: int,
+    retries: int = BATCH_RETRIES,
+    backoff: float = BATCH_BACKOFF_SECONDS
+) -> Tuple[bool, int]:
+    """Export one batch, retrying with exponential backoff on failure."""
+    for attempt in range(retries + 1):
+        success, count = export_issues_to_csv(
+            jql,
+            config_file,
+            fields,
+            str(output_file),
+            max_results=batch_size,
+            start_at=offset
+        )
+        if success:
+            return True, count
+        if attempt < retries:
+            delay = backoff * (2 ** attempt)
+            logger.warning("Batch at offset %d failed; retrying in %.0fs (%d/%d)",
+                           offset, delay, attempt + 1, retries)
+            time.sleep(delay)
+    return False, 0
+
+
+def batches_export(
+    jql: str,
+    config_file: str,
+    fields: List[str],
+    data_dir: Path,
+    file_prefix: str,
+    records: int,
+    batch_size: int,
+    resume: bool = False
+) -> Tuple[bool, List[str]]:
+    """
+    Export ``records`` issues in batches, checkpointing each completed batch.
+
+    Batches are written to ``{file_prefix}_batch_{n}.csv`` in ``data_dir`` and
+    tracked in ``{file_prefix}_manifest.json``. Without ``resume``, or when
+    the stored manifest describes a different query, batch size or total,
+    existing batch files are removed and the export starts over. With
+    ``resume``, batches already completed with an intact file are skipped.
+    A failing batch does not stop the remaining ones.
+
+    Returns:
+        Tuple of (True if every batch completed, batch files in order)
+    """
+    manifest_file = data_dir / f'{file_prefix}_manifest.json'
+    manifest = ExportManifest.load(manifest_file) if resume else None
+    if manifest is not None and not manifest.matches(jql, batch_size, records):
+        logger.info(f"Export of {file_prefix} changed since the last run; starting over")
+        manifest = None
+
+    if manifest is None:
+        existing_files = list(data_dir.glob(f'{file_prefix}_batch_*.csv'))
+        if existing_files:
+            logger.info(f"Removing {len(existing_files)} existing {file_prefix} files")
+            for file in existing_files:
+                try:
+                    file.unlink()
+                except Exception as e:
+                    logger.warning(f"Failed to remove file {file}: {str(e)}")
+        manifest = ExportManifest(manifest_file, jql, batch_size, records)
+        manifest.save()
+
+    all_succeeded = True
+    exported_files = []
+    for offset in range(0, records, batch_size):
+        batch_number = offset // batch_size + 1
+        output_file = data_dir / f'{file_prefix}_batch_{batch_number}.csv'
+        exported_files.append(str(output_file))
+
+        if manifest.batch_done(batch_number):
+            logger.info(f"Skipping completed batch {batch_number} ({output_file})")
+            continue
+
+        success, count = export_batch_with_retry(
+            jql, config_file, fields, output_file, batch_size, offset)
+        if not success:
+            logger.error(f"Failed to export {file_prefix} batch starting at {offset}")
+            manifest.batch_failed(batch_number, offset, output_file)
+            all_succeeded = False
+            continue
+
+        manifest.batch_completed(batch_number, offset, output_file, count)
+        logger.info(f"Exported {count:,} tickets to {output_file}")
+
+    return all_succeeded, exported_files
@@ -0,0 +1,116 @@
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Collection, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+JIRA_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+CHANGELOG_INDEX_CACHE_SIZE = 256
+
+
+def jira_timestamp_parse(timestamp: str) -> datetime:
+    """
+    Parse a Jira timestamp such as 2024-08-01T09:00:00.000+0700, dropping the
+    offset: the result is the wall time Jira recorded.
+    """
+    try:
+        return datetime.strptime(timestamp, JIRA_TIMESTAMP_FORMAT + '%z').replace(tzinfo=None)
+    except ValueError:
+        return datetime.strptime(timestamp, JIRA_TIMESTAMP_FORMAT)
+
+
+class FieldChange(NamedTuple):
+    """One change of a field in an issue's changelog."""
+    timestamp: Any
+    from_string: Any
+    to_string: Any
+
+    @property
+    def created(self) -> Optional[datetime]:
+        """When the change was made, or None if its history has no valid ``created``."""
+        try:
+            return jira_timestamp_parse(self.timestamp)
+        except (TypeError, ValueError):
+            logger.debug("Skipping changelog entry with invalid created %r", self.timestamp)
+            return None
+
+
+class ChangelogIndex:
+    """
+    Per-field change timelines of one issue, built in a single pass.
+
+    The ``histories`` array of an issue changelog is scanned once; every
+    item is filed under its field as a FieldChange with the history's raw
+    ``created`` and the from/to values. Timelines keep changelog order, as
+    the per-query scans did, so stage-date and transition queries only read
+    the timeline of the field they ask about. Timestamps are parsed only for
+    the changes a query returns; a change whose ``created`` is missing or
+    malformed is skipped.
+    """
+
+    def __init__(self, histories: List[Dict]):
+        timelines: Dict[Any, List[FieldChange]] = {}
+        for history in histories:
+            created = history.get("created")
+            for item in history.get("items") or ():
+                timelines.setdefault(item.get("field", 0), []).append(
+                    FieldChange(created, item.get("fromString", 0), item.get("toString", 0)))
+        self._timelines = timelines
+
+    def timeline_get(self, field_name: str) -> List[FieldChange]:
+        """Changes of a field, in changelog order."""
+        return list(self._timelines.get(field_name, ()))
+
+    def last_change_date_get(self, field_name: str, to_values: Collection) -> Optional[datetime]:
+        """When the field was last changed to one of ``to_values``, or None."""
+        for change in reversed(self._timelines.get(field_name, ())):
+            if change.to_string in to_values:
+                created = change.created
+                if created is not None:
+                    return created
+        return None
+
+    def transitions_get(self, field_name: str, to_values: Collection) -> List[Dict[str, Any]]:
+        """Every change of the field to one of ``to_values``, in changelog order."""
+        transitions = []
+        for change in self._timelines.get(field_name, ()):
+            if change.to_string not in to_values:
+                continue
+            created = change.created
+            if created is not None:
+                transitions.append({
+                    "from_status": change.from_string,
+                    "to_status": change.to_string,
+                    "date": created.strftime("%Y-%m-%d")
+                })
+        return transitions
+
+
+# Keyed by id(); the histories list is kept alive with its index so the id
+# cannot be reused while the entry is cached.
+_INDEX_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+def changelog_index_get(histories: List[Dict]) -> ChangelogIndex:
+    """
+    ChangelogIndex of a histories array, reused while the same array is queried.
+
+    Extraction asks several stage and transition questions of the same
+    issue in a row; only the first one pays for the scan.
+    """
+    key = id(histories)
+    with _INDEX_CACHE_LOCK:
+        entry = _INDEX_CACHE.get(key)
+        if entry is not None and entry[0] is histories and entry[1] == len(histories):
+            _INDEX_CACHE.move_to_end(key)
+            return entry[2]
+    index = ChangelogIndex(histories)
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[key] = (histories, len(histories), index)
+        _INDEX_CACHE.move_to_end(key)
+        while len(_INDEX_CACHE) > CHANGELOG_INDEX_CACHE_SIZE:
+            _INDEX_CACHE.popitem(last=False)
+    return index
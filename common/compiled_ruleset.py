@@ -0,0 +1,689 @@
+import collections.abc
+import itertools
+import logging
+import threading
+import math
+import operator
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import rule_engine
+
+from common.config_registry import config_json_get
+from common.json_util import parse_json_v2
+from common.conditions_enum import equation_operators, logical_operators
+from common.rule_engine_util import rule_prepare
+from common.rule_profiler import RULE_PROFILER, RuleProfiler
+from common.util import cfg_read
+from domain.conditions.condition_obj import Condition
+
+logger = logging.getLogger(__name__)
+
+NO_ACTION = '-'
+MISSING = object()
+CONDITION_ERROR = object()
+
+# Comparisons evaluated as NumPy masks in batch evaluation
+VECTOR_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+_RULESET_VERSIONS = itertools.count(1)
+
+
+def symbol_resolve(thing: Any, name: str) -> Any:
+    """
+    rule_engine resolver for dict rows that skips "did you mean" suggestions.
+
+    Reminder rows routinely lack the attributes of other rules' conditions;
+    the default resolver spends most of an evaluation ranking suggestions
+    for an error that is only ever treated as "no match".
+    """
+    if not isinstance(thing, collections.abc.Mapping) or name not in thing:
+        raise rule_engine.errors.SymbolResolutionError(name, thing=thing)
+    return thing[name]
+
+
+RULE_CONTEXT = rule_engine.Context(resolver=symbol_resolve)
+
+
+class CompiledRule(NamedTuple):
+    """A rule with its condition string compiled once into a rule_engine.Rule."""
+    rule_id: str
+    rule_name: str
+    priority: int
+    condition: Optional[str]
+    matcher: Optional[rule_engine.Rule]
+    action_result: str
+    rule_point: float
+    weight: float
+    # (attribute, operator, constant) comparisons joined by ``mode`` ("and"/"or"),
+    # or None when the condition cannot be evaluated as masks
+    clauses: Optional[Tuple[Tuple[str, str, float], ...]] = None
+    mode: Optional[str] = None
+    # Indices into the ruleset's ConditionGraph, in config order
+    condition_nodes: Optional[Tuple[int, ...]] = None
+
+
+def is_number(value: Any) -> bool:
+    """Whether rule_engine compares the value as a plain number."""
+    return type(value) in (int, float) and not (type(value) is float and math.isnan(value))
+
+
+def rule_conditions_get(rule: Mapping[str, Any], conditions: Sequence[Condition]
+                        ) -> Tuple[List[Condition], str]:
+    """Conditions a rule references, in the order rule_prepare inlines them, and its mode."""
+    rule_conditions = rule.get("conditions") or {}
+    if rule.get("type") == 'complex':
+        condition_ids = rule_conditions.get("items") or ()
+        mode = logical_operators(rule_conditions.get("mode"))
+    else:
+        condition_ids = (rule_conditions.get("item"),)
+        mode = "and"
+    return [cond for condition_id in condition_ids
+            for cond in conditions if cond.condition_id == condition_id], mode
+
+
+def condition_text(cond: Condition) -> str:
+    return str(cond.attribute) + " " + str(equation_operators(cond.equation)) + " " + str(cond.constant)
+
+
+def rule_clauses_get(rule_conditions: Sequence[Condition], mode: str,
+                     condition: Optional[str]) -> Optional[Tuple[Tuple[str, str, float], ...]]:
+    """
+    Comparisons of a rule as (attribute, operator, constant) clauses.
+
+    Only numeric constants and the VECTOR_OPERATORS qualify. The clauses are
+    rendered back and must reproduce the condition string rule_prepare
+    built, otherwise the rule is left to rule_engine.
+    """
+    clauses = []
+    for cond in rule_conditions:
+        op = equation_operators(cond.equation)
+        if op not in VECTOR_OPERATORS or not is_number(cond.constant) \
+                or not isinstance(cond.attribute, str):
+            return None
+        clauses.append((cond.attribute, op, cond.constant))
+    rendered = f' {mode} '.join(f"{attr} {op} {constant}" for attr, op, constant in clauses)
+    if not clauses or rendered != condition:
+        return None
+    return tuple(clauses)
+
+
+class ConditionNode:
+    """
+    One distinct condition of a ruleset, shared by every rule referencing it.
+
+    Numeric comparisons on plain numbers are evaluated in Python; anything
+    else goes through the condition compiled on its own by rule_engine. The
+    outcome is True, False or CONDITION_ERROR (the attribute is missing or
+    cannot be compared), which stops a rule the way rule_engine's exception
+    did. ``cost`` is a static estimate used to order evaluation.
+    """
+
+    __slots__ = ("index", "condition_ids", "text", "attribute", "compare", "constant",
+                 "matcher", "cost", "evaluations", "passed", "errors", "reused")
+
+    def __init__(self, index: int, cond: Condition):
+        self.index = index
+        self.condition_ids = [cond.condition_id]
+        self.text = condition_text(cond)
+        op = equation_operators(cond.equation)
+        self.attribute = cond.attribute
+        self.constant = cond.constant
+        self.compare = VECTOR_OPERATORS.get(op) \
+            if is_number(cond.constant) and isinstance(cond.attribute, str) else None
+        self.matcher = None
+        try:
+            self.matcher = rule_engine.Rule(self.text, context=RULE_CONTEXT)
+        except Exception as e:
+            logger.warning("Condition %s does not compile: %s", cond.condition_id, e)
+        self.cost = 1 if self.compare is not None else 10
+        self.evaluations = 0
+        self.passed = 0
+        self.errors = 0
+        self.reused = 0
+
+    def outcome_get(self, data: Mapping[str, Any]) -> Any:
+        """Outcome for ``data``; the counters are updated by outcome_record."""
+        if self.compare is not None and isinstance(data, dict):
+            value = data.get(self.attribute, MISSING)
+            if value is MISSING:
+                return CONDITION_ERROR
+            if is_number(value):
+                return self.compare(value, self.constant)
+        if self.matcher is None:
+            return CONDITION_ERROR
+        try:
+            return self.matcher.matches(data) == True
+        except Exception:
+            return CONDITION_ERROR
+
+    def outcome_record(self, outcome: Any) -> None:
+        # Called with the owning ruleset's counters lock held
+        self.evaluations += 1
+        if outcome is CONDITION_ERROR:
+            self.errors += 1
+        else:
+            self.passed += outcome
+
+    def error_describe(self, data: Mapping[str, Any]) -> str:
+        """Why the condition evaluates to CONDITION_ERROR for ``data``."""
+        if self.matcher is None:
+            return "ConditionError: condition does not compile"
+        try:
+            self.matcher.matches(data)
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        return "ConditionError: no error on re-evaluation"
+
+    def report(self) -> Dict[str, Any]:
+        evaluations = self.evaluations
+        return {
+            "condition_ids": list(self.condition_ids),
+            "condition": self.text,
+            "evaluations": evaluations,
+            "reused": self.reused,
+            "passed": self.passed,
+            "errors": self.errors,
+            "hit_rate": self.passed / evaluations if evaluations else None,
+        }
+
+
+class ConditionGraph:
+    """
+    Distinct conditions of a ruleset and the rules that depend on them.
+
+    Conditions with the same text are merged into one ConditionNode, so a
+    row evaluates each of them at most once however many rules use it.
+    """
+
+    def __init__(self):
+        self.nodes: List[ConditionNode] = []
+        self._by_text: Dict[str, ConditionNode] = {}
+        self.rule_nodes: List[Optional[Tuple[int, ...]]] = []
+
+    def node_get(self, cond: Condition) -> int:
+        text = condition_text(cond)
+        node = self._by_text.get(text)
+        if node is None:
+            node = self._by_text[text] = ConditionNode(len(self.nodes), cond)
+            self.nodes.append(node)
+        elif cond.condition_id not in node.condition_ids:
+            node.condition_ids.append(cond.condition_id)
+        return node.index
+
+    def rule_add(self, rule_conditions: Sequence[Condition], mode: str,
+                 condition: Optional[str]) -> Optional[Tuple[int, ...]]:
+        """
+        Node indices of a rule in config order, or None if the rule has to be
+        matched as a whole (its condition string is not its conditions joined
+        by ``mode``).
+        """
+        rendered = f' {mode} '.join(condition_text(cond) for cond in rule_conditions)
+        if not rule_conditions or mode not in ("and", "or") or rendered != condition:
+            self.rule_nodes.append(None)
+            return None
+        indices = tuple(self.node_get(cond) for cond in rule_conditions)
+        self.rule_nodes.append(indices)
+        return indices
+
+
+def rule_compile(rule: Mapping[str, Any], conditions: Sequence[Condition],
+                 graph: Optional[ConditionGraph] = None) -> CompiledRule:
+    """
+    Inline a rule's conditions (see rule_prepare) and compile the result.
+
+    A condition that rule_engine cannot compile leaves the rule without a
+    matcher; such a rule never fires, as it did when compiled per call.
+    With a ``graph`` the rule's conditions are also added to it.
+    """
+    prepared = rule_prepare(conditions, rule)
+    matcher = None
+    try:
+        matcher = rule_engine.Rule(prepared["condition"], context=RULE_CONTEXT)
+    except Exception as e:
+        logger.warning("Rule %s does not compile and will never fire: %s", rule.get("id"), e)
+    rule_conditions, mode = rule_conditions_get(rule, conditions)
+    clauses = None
+    condition_nodes = None
+    if matcher is not None:
+        clauses = rule_clauses_get(rule_conditions, mode, prepared["condition"])
+        if graph is not None:
+            condition_nodes = graph.rule_add(rule_conditions, mode, prepared["condition"])
+    elif graph is not None:
+        graph.rule_nodes.append(None)
+    return CompiledRule(
+        rule_id=rule.get("id"),
+        rule_name=prepared["rule_name"],
+        priority=prepared["priority"],
+        condition=prepared["condition"],
+        matcher=matcher,
+        action_result=str(prepared["action_result"]),
+        rule_point=float(prepared["rule_point"]),
+        weight=float(prepared["weight"]),
+        clauses=clauses,
+        mode=mode if clauses is not None or condition_nodes is not None else None,
+        condition_nodes=condition_nodes
+    )
+
+
+class CompiledRuleset:
+    """
+    Rules, conditions and action patterns compiled once for repeated evaluation.
+
+    Rules keep their config order, which is also the order of the characters
+    in ``pattern_result``. Their conditions form a ConditionGraph: evaluate()
+    computes each distinct condition at most once per row and reuses the
+    outcome in every rule that references it. ``inclusive`` rules test their
+    cheapest, most shared conditions first (see conditions_order_tune) and
+    stop at the first one that fails; ``exclusive`` rules keep config order,
+    which decides whether a missing attribute is reached, and stop at the
+    first outcome that is not False. ``version`` increases with every
+    compiled ruleset in the process; ``compile_seconds`` is how long
+    compiling took. Hit counters are only kept while RULE_PROFILER is
+    enabled, and are updated under a lock once per row.
+    """
+
+    def __init__(self, rules: Sequence[CompiledRule], patterns: Mapping[str, str],
+                 compile_seconds: float = 0.0, graph: Optional[ConditionGraph] = None):
+        self.rules: Tuple[CompiledRule, ...] = tuple(rules)
+        self.patterns: Dict[str, str] = dict(patterns or {})
+        self.version = next(_RULESET_VERSIONS)
+        self.compile_seconds = compile_seconds
+        self.conditions: Tuple[ConditionNode, ...] = tuple(graph.nodes) if graph else ()
+        self.rule_evaluations = [0] * len(self.rules)
+        self.rule_matches = [0] * len(self.rules)
+        self._counters_lock = threading.Lock()
+        self._evaluation_orders: List[Optional[Tuple[int, ...]]] = []
+        self.conditions_order_tune(observed=False)
+
+    def conditions_order_tune(self, observed: bool = True) -> None:
+        """
+        Order the conditions of ``inclusive`` rules, most likely to fail first.
+
+        Without observations (or before any) conditions are ordered by cost,
+        then by how many rules share them. With ``observed`` the pass rate
+        recorded so far by each condition comes first, so rules short-circuit
+        as early as possible on the traffic seen.
+        """
+        shared = [0] * len(self.conditions)
+        for rule in self.rules:
+            for index in set(rule.condition_nodes or ()):
+                shared[index] += 1
+
+        pass_rates = [0.0] * len(self.conditions)
+        if observed:
+            with self._counters_lock:
+                pass_rates = [node.passed / node.evaluations if node.evaluations else 0.0
+                              for node in self.conditions]
+
+        def order_key(index: int):
+            return pass_rates[index], self.conditions[index].cost, -shared[index], index
+
+        orders = []
+        for rule in self.rules:
+            if rule.condition_nodes is None or rule.mode != "and":
+                orders.append(rule.condition_nodes)
+            else:
+                orders.append(tuple(sorted(set(rule.condition_nodes), key=order_key)))
+        self._evaluation_orders = orders
+
+    def rule_match(self, rule: CompiledRule, data: Mapping[str, Any]) -> bool:
+        if rule.matcher is None:
+            return False
+        try:
+            return rule.matcher.matches(data) == True
+        except Exception:
+            # Missing attributes and type errors count as no match
+            return False
+
+    def rule_match_explain(self, rule: CompiledRule, data: Mapping[str, Any]
+                           ) -> Tuple[bool, Optional[str]]:
+        """rule_match, plus the error message when the rule raised."""
+        if rule.matcher is None:
+            return False, "RuleError: rule does not compile"
+        try:
+            return rule.matcher.matches(data) == True, None
+        except Exception as e:
+            return False, f"{type(e).__name__}: {e}"
+
+    def condition_profile(self, node: ConditionNode, data: Mapping[str, Any],
+                          profiler: RuleProfiler) -> Any:
+        started = time.perf_counter()
+        outcome = node.outcome_get(data)
+        seconds = time.perf_counter() - started
+        error = None
+        if outcome is CONDITION_ERROR:
+            error = node.error_describe(data) \
+                if profiler.first_error_needed("condition", node.text) else ""
+        profiler.condition_record(node.text, seconds, outcome is True, error)
+        return outcome
+
+    def evaluate(self, data: Mapping[str, Any], record: bool = True) -> Dict[str, Any]:
+        """
+        Evaluate every rule against one row, see rules_exec for the result.
+
+        Hit counters and the profile are only updated while RULE_PROFILER
+        is enabled, and never with ``record`` False, for checks that are not
+        real traffic.
+        """
+        profiler = RULE_PROFILER if record and RULE_PROFILER.enabled else None
+        nodes = self.conditions
+        outcomes = [MISSING] * len(nodes)
+        total_points = 0.0
+        results = []
+        reused = []
+        matches = []
+        for position, rule in enumerate(self.rules):
+            if profiler is not None:
+                started = time.perf_counter()
+                error = None
+            order = self._evaluation_orders[position]
+            if order is None:
+                if profiler is None:
+                    matched = self.rule_match(rule, data)
+                else:
+                    matched, error = self.rule_match_explain(rule, data)
+            else:
+                # "and": every outcome is True; "or": the first outcome that
+                # is not False is True
+                matched = rule.mode == "and"
+                for index in order:
+                    outcome = outcomes[index]
+                    if outcome is MISSING:
+                        if profiler is None:
+                            outcome = nodes[index].outcome_get(data)
+                        else:
+                            outcome = self.condition_profile(nodes[index], data, profiler)
+                        outcomes[index] = outcome
+                    elif profiler is not None:
+                        reused.append(index)
+                    if outcome is not (rule.mode == "and"):
+                        matched = outcome is True
+                        if outcome is CONDITION_ERROR and profiler is not None:
+                            error = f"{nodes[index].text}: " + nodes[index].error_describe(data) \
+                                if profiler.first_error_needed("rule", rule.rule_id) else ""
+                        break
+            if profiler is not None:
+                profiler.rule_record(rule.rule_id, time.perf_counter() - started, matched, error)
+                matches.append(matched)
+            if matched:
+                total_points += rule.rule_point * rule.weight
+                results.append(rule.action_result)
+            else:
+                results.append(NO_ACTION)
+        if profiler is not None:
+            self.counters_record(outcomes, reused, matches)
+        pattern_result = "".join(results)
+        return {
+            "total_points": total_points,
+            "pattern_result": pattern_result,
+            "action_recommendation": self.patterns.get(pattern_result)
+        }
+
+    def counters_record(self, outcomes: Sequence[Any], reused: Sequence[int],
+                        matches: Sequence[bool]) -> None:
+        """Add one row's condition outcomes, reused outcomes and rule matches to the hit counters."""
+        with self._counters_lock:
+            for node, outcome in zip(self.conditions, outcomes):
+                if outcome is not MISSING:
+                    node.outcome_record(outcome)
+            for index in reused:
+                self.conditions[index].reused += 1
+            for position, matched in enumerate(matches):
+                self.rule_evaluations[position] += 1
+                self.rule_matches[position] += matched
+
+    def condition_report(self) -> Dict[str, Any]:
+        """
+        Hit rates recorded by evaluate() while profiling is enabled, to tune
+        condition and rule order.
+
+        Per condition: evaluations, outcomes served from the per-row cache
+        (``reused``), passes, errors and ``hit_rate`` (passes / evaluations);
+        per rule: evaluations, matches and the order its conditions run in.
+        """
+        with self._counters_lock:
+            return {
+                "version": self.version,
+                "conditions": [node.report() for node in self.conditions],
+                "rules": [
+                    {
+                        "rule_id": rule.rule_id,
+                        "evaluations": self.rule_evaluations[position],
+                        "matches": self.rule_matches[position],
+                        "hit_rate": self.rule_matches[position] / self.rule_evaluations[position]
+                        if self.rule_evaluations[position] else None,
+                        "condition_order": [self.conditions[index].text for index in order]
+                        if order is not None else None,
+                    }
+                    for position, (rule, order) in enumerate(zip(self.rules, self._evaluation_orders))
+                ],
+            }
+
+    def evaluate_batch(self, rows: Union[Iterable[Mapping[str, Any]], pd.DataFrame]
+                       ) -> Union[List[Dict[str, Any]], pd.DataFrame]:
+        """
+        Evaluate every rule against many rows at once.
+
+        ``rows`` is a list of dicts or a DataFrame, in which NaN/None cells
+        count as missing attributes. Rules made of numeric comparisons are
+        evaluated as NumPy masks, honouring rule_engine's left-to-right
+        short-circuiting: a missing attribute only prevents a match once
+        evaluation reaches it. Rows whose values are not plain numbers, and
+        rules that are not simple comparisons, go through rule_engine row by
+        row. Returns one evaluate() result per row: a list of dicts, or a
+        DataFrame with the same index for DataFrame input.
+        """
+        frame = rows if isinstance(rows, pd.DataFrame) else None
+        records = None if frame is not None else list(rows)
+        size = len(frame) if frame is not None else len(records)
+        columns: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        row_dicts: Dict[int, Mapping[str, Any]] = {}
+
+        def row_get(position: int) -> Mapping[str, Any]:
+            if records is not None:
+                return records[position]
+            if position not in row_dicts:
+                # to_dict converts NumPy scalars to the Python types rule_engine expects
+                record = frame.iloc[position:position + 1].to_dict('records')[0]
+                row_dicts[position] = {
+                    name: value for name, value in record.items()
+                    if not (value is None or (type(value) is float and math.isnan(value)))}
+            return row_dicts[position]
+
+        def column_get(attribute: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            # (values, present, numeric) of one attribute across all rows
+            if attribute not in columns:
+                if records is not None:
+                    raw = [record.get(attribute, MISSING) for record in records]
+                    present = np.fromiter((value is not MISSING for value in raw), bool, size)
+                elif attribute in frame.columns:
+                    raw = frame[attribute].tolist()
+                    present = frame[attribute].notna().to_numpy()
+                else:
+                    raw = [MISSING] * size
+                    present = np.zeros(size, bool)
+                numeric = np.fromiter((is_number(value) for value in raw), bool, size)
+                values = np.array([value if ok else 0.0 for value, ok in zip(raw, numeric)], float)
+                columns[attribute] = (values, present, numeric)
+            return columns[attribute]
+
+        profiler = RULE_PROFILER if RULE_PROFILER.enabled else None
+        total_points = np.zeros(size)
+        actions = []
+        for rule in self.rules:
+            if profiler is not None:
+                started = time.perf_counter()
+            if rule.matcher is None:
+                matched = np.zeros(size, bool)
+            elif rule.clauses is None:
+                matched = np.fromiter(
+                    (self.rule_match(rule, row_get(position)) for position in range(size)), bool, size)
+            else:
+                # "and": every clause holds. "or": some clause holds and every
+                # clause before it resolved (a missing attribute raises).
+                matched = np.full(size, rule.mode == "and")
+                reached = np.ones(size, bool)
+                scalar = np.zeros(size, bool)
+                for attribute, op, constant in rule.clauses:
+                    values, present, numeric = column_get(attribute)
+                    scalar |= present & ~numeric
+                    outcome = present & VECTOR_OPERATORS[op](values, constant)
+                    if rule.mode == "and":
+                        matched &= outcome
+                    else:
+                        matched |= reached & outcome
+                        reached &= present
+                for position in np.flatnonzero(scalar):
+                    matched[position] = self.rule_match(rule, row_get(position))
+            if profiler is not None:
+                profiler.rule_batch_record(
+                    rule.rule_id, size, int(matched.sum()), time.perf_counter() - started)
+            total_points += np.where(matched, rule.rule_point * rule.weight, 0.0)
+            actions.append(np.where(matched, rule.action_result, NO_ACTION))
+
+        patterns = ["".join(pattern) for pattern in zip(*actions)] if actions else [""] * size
+        recommendations = [self.patterns.get(pattern) for pattern in patterns]
+        if frame is not None:
+            return pd.DataFrame({
+                "total_points": total_points,
+                "pattern_result": patterns,
+                "action_recommendation": recommendations
+            }, index=frame.index)
+        return [
+            {
+                "total_points": float(points),
+                "pattern_result": pattern,
+                "action_recommendation": recommendation
+            }
+            for points, pattern, recommendation in zip(total_points.tolist(), patterns, recommendations)
+        ]
+
+
+class RuleDecisionCache:
+    """
+    Bounded LRU cache of ruleset results, keyed by ruleset version and input.
+
+    Reminder inputs are a handful of small integers, so a run sees only a
+    few hundred distinct rows. The key is the ruleset ``version`` plus the
+    row's (name, type, value) items in name order (1, 1.0 and True stay
+    distinct); rows with unhashable values are evaluated without caching.
+    When a newer ruleset version is seen the entries of the old one are
+    dropped. Callers get a copy of the cached result.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_get(ruleset: CompiledRuleset, data: Mapping[str, Any]) -> tuple:
+        return (ruleset.version,) + tuple(
+            (name, type(value), value) for name, value in sorted(data.items()))
+
+    def evaluate(self, ruleset: CompiledRuleset, data: Mapping[str, Any]) -> Dict[str, Any]:
+        """ruleset.evaluate(data), served from the cache when the same row was seen."""
+        key = self.key_get(ruleset, data)
+        with self._lock:
+            if ruleset.version > self._version:
+                self._entries.clear()
+                self._version = ruleset.version
+            try:
+                result = self._entries.get(key)
+            except TypeError:
+                # Unhashable attribute values
+                self.bypassed += 1
+                key = None
+            else:
+                if result is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return dict(result)
+                self.misses += 1
+        result = ruleset.evaluate(data)
+        if key is None:
+            return result
+        with self._lock:
+            if ruleset.version >= self._version:
+                self._entries[key] = dict(result)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self._version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else None,
+            }
+
+
+def ruleset_compile(rules_set: Sequence[Mapping[str, Any]],
+                    conditions_set: Sequence[Mapping[str, Any]],
+                    patterns: Mapping[str, str]) -> CompiledRuleset:
+    """Compile rules_set/conditions_set/patterns config nodes into a CompiledRuleset."""
+    started = time.perf_counter()
+    conditions = [Condition(**item) for item in conditions_set]
+    graph = ConditionGraph()
+    rules = [rule_compile(rule, conditions, graph) for rule in rules_set]
+    ruleset = CompiledRuleset(rules, patterns, time.perf_counter() - started, graph)
+    logger.info("Compiled ruleset v%s: %s rules, %s distinct conditions in %.1f ms",
+                ruleset.version, len(rules), len(graph.nodes), ruleset.compile_seconds * 1000)
+    return ruleset
+
+
+_COMPILED: Optional[Tuple[Any, Any, CompiledRuleset]] = None
+_COMPILED_LOCK = threading.Lock()
+
+
+def ruleset_get() -> CompiledRuleset:
+    """
+    CompiledRuleset of the RULE and CONDITIONS files named in config.ini.
+
+    The files are served by the config registry, which re-reads them when
+    they change on disk; the ruleset is recompiled only when one of the
+    snapshots is replaced.
+    """
+    global _COMPILED
+    rules_cfg = config_json_get(cfg_read("RULE", "file_name"))
+    conditions_cfg = config_json_get(cfg_read("CONDITIONS", "file_name"))
+    compiled = _COMPILED
+    if compiled is not None and compiled[0] is rules_cfg and compiled[1] is conditions_cfg:
+        return compiled[2]
+    with _COMPILED_LOCK:
+        compiled = _COMPILED
+        if compiled is None or compiled[0] is not rules_cfg or compiled[1] is not conditions_cfg:
+            ruleset = ruleset_compile(
+                parse_json_v2("$.rules_set", rules_cfg),
+                parse_json_v2("$.conditions_set", conditions_cfg),
+                parse_json_v2("$.patterns", rules_cfg))
+            compiled = (rules_cfg, conditions_cfg, ruleset)
+            _COMPILED = compiled
+    return compiled[2]
@@ -0,0 +1,139 @@
+import configparser
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CR_STATUSES_FILE = "config-pattern/jira_cr_statuses_obj.json"
+CONFIG_INI_FILE = "config/config.ini"
+
+
+class FrozenDict(dict):
+    """Read-only dict used for config snapshots."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config snapshots are read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self):
+        return id(self)
+
+
+def frozen_copy(value: Any) -> Any:
+    """Deep copy parsed config into read-only dicts and tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((key, frozen_copy(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(frozen_copy(item) for item in value)
+    return value
+
+
+def json_config_parse(file_path: str) -> Any:
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def ini_config_parse(file_path: str) -> Dict[str, Dict[str, str]]:
+    """Parse an ini file into {section: {option: value}}, options lower-cased."""
+    parser = configparser.ConfigParser()
+    with open(file_path, 'r', encoding='utf-8') as file:
+        parser.read_file(file)
+    sections = {section: dict(parser[section].items()) for section in parser.sections()}
+    sections[parser.default_section] = dict(parser.defaults())
+    return sections
+
+
+class ConfigRegistry:
+    """
+    Process-wide cache of parsed config files.
+
+    Each file is parsed once and served as an immutable snapshot (read-only
+    dicts and tuples). Every lookup compares the file's mtime and size with
+    the snapshot's and re-parses the file when it changed; ``reload`` forces
+    it. Callbacks registered with ``on_reload`` run whenever a file is
+    re-parsed, so state derived from a config can be rebuilt.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+        self._reload_hooks: List[Callable[[str], None]] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def _get(self, kind: str, file_path: str, parser: Callable[[str], Any]) -> Any:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = (kind, path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+        snapshot = frozen_copy(parser(path))
+        with self._lock:
+            reloaded = key in self._entries
+            self._entries[key] = (version, snapshot)
+            self.loads += 1
+            hooks = list(self._reload_hooks) if reloaded else []
+        if reloaded:
+            logger.info("Reloaded config %s", file_path)
+        for hook in hooks:
+            hook(path)
+        return snapshot
+
+    def json_get(self, file_path: str) -> Any:
+        """Snapshot of a JSON config file."""
+        return self._get("json", file_path, json_config_parse)
+
+    def ini_get(self, file_path: str) -> Dict[str, Dict[str, str]]:
+        """Snapshot of an ini config file as {section: {option: value}}."""
+        return self._get("ini", file_path, ini_config_parse)
+
+    def reload(self, file_path: Optional[str] = None) -> None:
+        """Drop the snapshot of one file, or of all files, and run the reload hooks."""
+        with self._lock:
+            if file_path is None:
+                paths = {path for _, path in self._entries}
+                self._entries.clear()
+            else:
+                paths = {os.path.abspath(file_path)}
+                for key in [key for key in self._entries if key[1] in paths]:
+                    del self._entries[key]
+            hooks = list(self._reload_hooks)
+        for path in paths:
+            for hook in hooks:
+                hook(path)
+
+    def on_reload(self, hook: Callable[[str], None]) -> None:
+        """Register a callback run with the absolute path of a reloaded file."""
+        with self._lock:
+            self._reload_hooks.append(hook)
+
+    def stats(self) -> Dict[str, int]:
+        """Report how many reads were served from cache vs parsed from disk."""
+        with self._lock:
+            return {
+                "cache_hits": self.hits,
+                "loads": self.loads,
+                "files": len(self._entries),
+            }
+
+
+CONFIG_REGISTRY = ConfigRegistry()
+
+
+def config_json_get(file_path: str) -> Any:
+    """Snapshot of a JSON config file from the shared registry."""
+    return CONFIG_REGISTRY.json_get(file_path)
+
+
+def config_ini_get(file_path: str = CONFIG_INI_FILE) -> Dict[str, Dict[str, str]]:
+    """Snapshot of an ini config file from the shared registry."""
+    return CONFIG_REGISTRY.ini_get(file_path)
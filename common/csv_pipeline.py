@@ -0,0 +1,129 @@
+import logging
+from csv import DictReader, DictWriter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# row_transform(row, number) -> a row, None to drop it, or a list of rows.
+# ``number`` is 1 + the rows the stage has emitted so far.
+RowTransform = Callable[[Dict[str, Any], int], Any]
+
+
+class CsvRowStage:
+    """
+    One row-at-a-time step of a CSV transform, with the columns it adds.
+
+    ``columns`` are (offset, name) insertions applied in order to the
+    incoming header, the offset counted from its original length, so a stage
+    lays out its columns exactly as the step it replaces did.
+    ``fieldnames`` instead replaces the header outright, for stages that
+    emit rows of a different shape.
+    """
+
+    def __init__(self, name: str, row_transform: RowTransform,
+                 columns: Sequence[Tuple[int, str]] = (),
+                 fieldnames: Optional[Sequence[str]] = None):
+        self.name = name
+        self.row_transform = row_transform
+        self.columns = tuple(columns)
+        self.fieldnames = list(fieldnames) if fieldnames is not None else None
+
+    def fieldnames_get(self, incoming: Sequence[str]) -> List[str]:
+        """Header of the stage's output given the header it reads."""
+        if self.fieldnames is not None:
+            return list(self.fieldnames)
+        headers = list(incoming)
+        total_column = len(headers)
+        for offset, column_name in self.columns:
+            headers.insert(total_column + offset, column_name)
+        return headers
+
+    def __repr__(self) -> str:
+        return f"CsvRowStage({self.name!r})"
+
+
+def csv_pipeline_fieldnames_get(fieldnames: Sequence[str],
+                                stages: Sequence[CsvRowStage]) -> List[List[str]]:
+    """Header after each stage, in stage order."""
+    headers = []
+    for stage in stages:
+        fieldnames = stage.fieldnames_get(fieldnames)
+        headers.append(fieldnames)
+    return headers
+
+
+def csv_pipeline_run(input_file: str, output_file: str, stages: Sequence[CsvRowStage],
+                     intermediate_files: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    """
+    Run a chain of row stages over a CSV in a single streaming pass.
+
+    The input is read once with one DictReader; every row goes through the
+    stages in order and whatever survives the last stage is written with one
+    DictWriter. Values are handed from stage to stage as Python objects
+    rather than re-parsed text. ``intermediate_files`` maps stage names to
+    paths that also get that stage's output, header included, as the
+    separate per-step files used to.
+
+    Returns the rows read, the rows written and the rows each stage emitted.
+    """
+    if not stages:
+        raise ValueError("CSV pipeline has no stages")
+    intermediate_files = dict(intermediate_files or {})
+    unknown = set(intermediate_files) - {stage.name for stage in stages}
+    if unknown:
+        raise ValueError(f"No pipeline stage named: {', '.join(sorted(unknown))}")
+    handles = []
+    try:
+        read_obj = open(input_file, 'r')
+        handles.append(read_obj)
+        csv_reader = DictReader(read_obj)
+        headers = csv_pipeline_fieldnames_get(csv_reader.fieldnames or [], stages)
+        transforms = [stage.row_transform for stage in stages]
+        # One writer per stage output that is kept, None for the rest
+        writers: List[Optional[DictWriter]] = []
+        for stage, stage_headers in zip(stages, headers):
+            path = intermediate_files.get(stage.name)
+            if path is None:
+                writers.append(None)
+                continue
+            write_obj = open(path, 'w', newline='')
+            handles.append(write_obj)
+            writers.append(DictWriter(write_obj, fieldnames=stage_headers))
+            writers[-1].writeheader()
+        write_obj = open(output_file, 'w', newline='')
+        handles.append(write_obj)
+        csv_writer = DictWriter(write_obj, fieldnames=headers[-1])
+        csv_writer.writeheader()
+        emitted = [0] * len(stages)
+        rows_read = 0
+        for row in csv_reader:
+            rows_read += 1
+            rows = [row]
+            for index, row_transform in enumerate(transforms):
+                stage_rows = []
+                for stage_row in rows:
+                    result = row_transform(stage_row, emitted[index] + 1)
+                    if result is None:
+                        continue
+                    if isinstance(result, list):
+                        stage_rows.extend(result)
+                        emitted[index] += len(result)
+                    else:
+                        stage_rows.append(result)
+                        emitted[index] += 1
+                if writers[index] is not None:
+                    writers[index].writerows(stage_rows)
+                rows = stage_rows
+                if not rows:
+                    break
+            csv_writer.writerows(rows)
+    finally:
+        for handle in handles:
+            handle.close()
+    logger.debug("CSV pipeline %s: %d rows read, %d written",
+                 [stage.name for stage in stages], rows_read, emitted[-1])
+    return {
+        "rows_read": rows_read,
+        "rows_written": emitted[-1],
+        "stages": {stage.name: count for stage, count in zip(stages, emitted)},
+    }
@@ -9,11 +9,13 @@ import os
 
 import pytz
 
-from common.jira_util import issue_data_extract
+from common.jira_util import ISSUE_KEY_CHUNK_SIZE, issue_data_extract, issues_data_extract_bulk
 from common.biz_cal import *
 
 from common.util import biz_days_btwn_days_calculate
 from common.json_util import read_json_file
+from common.config_registry import config_json_get
+from common.csv_pipeline import CsvRowStage, csv_pipeline_run
 import rule_engine
 
 
@@ -73,29 +75,8 @@ def add_numbering_column_to_csv(input_file, output_file):
 
 
 def add_validation_column_to_csv(output_path, input_file, output_file):
-    """ Append a column in existing csv using csv.reader / csv.writer classes"""
-    # Open the input_file in read mode and output_file in write mode
-    with open(f"{output_path}{input_file}", 'r') as read_obj, open(f"{output_path}{output_file}", 'w', newline='') as write_obj:
-        # Create a csv.reader object from the input file object
-        csv_reader = DictReader(read_obj)
-        headers = csv_reader.fieldnames
-        # headers = []
-        total_column = len(headers)
-        headers.insert(total_column, "validation_result")
-        headers.insert(total_column+1, "numbering")
-        headers.insert(total_column+2, "no_of_errors")
-        # Create a csv.writer object from the output file object
-        csv_writer = DictWriter(write_obj, fieldnames=headers)
-        # Read each row of the input csv file as list
-        counter = 1
-        csv_writer.writeheader()
-        for row in csv_reader:
-            # Pass the list / row in the transform function to add column text for this row
-            row.update({"numbering": counter})
-            row = fields_validate(row)
-            counter += 1
-            # Write the updated row / list to the output file
-            csv_writer.writerow(row)
+    """ Append validation_result, numbering and no_of_errors columns"""
+    csv_pipeline_run(f"{output_path}{input_file}", f"{output_path}{output_file}", [VALIDATION_STAGE])
     return {
         "output_path": f"{output_path}",
         "file_name": f"{output_file}"
@@ -103,31 +84,11 @@ def add_validation_column_to_csv(output_path, input_file, output_file):
 
 
 def add_modified_day_column_to_csv(output_path, input_file, p_output_file=""):
-    """ Append a column in existing csv using csv.reader / csv.writer classes"""
-    # Open the input_file in read mode and output_file in write mode
+    """ Append modified_date and numbering columns"""
     output_file = ""
     if p_output_file == "":
         output_file = f"{input_file.replace('.csv','')}_modified.csv"
-    with open(f"{output_path}{input_file}", 'r') as read_obj, open(f"{output_path}{output_file}", 'w', newline='') as write_obj:
-        # Create a csv.reader object from the input file object
-        csv_reader = DictReader(read_obj)
-        headers = csv_reader.fieldnames
-        # headers = []
-        total_column = len(headers)
-        headers.insert(total_column, "modified_date")
-        headers.insert(total_column+1, "numbering")
-        # Create a csv.writer object from the output file object
-        csv_writer = DictWriter(write_obj, fieldnames=headers)
-        # Read each row of the input csv file as list
-        counter = 1
-        csv_writer.writeheader()
-        for row in csv_reader:
-            # Pass the list / row in the transform function to add column text for this row
-            row.update({"numbering": counter})
-            row = modified_date_add(row, "modified_date")
-            counter += 1
-            # Write the updated row / list to the output file
-            csv_writer.writerow(row)
+    csv_pipeline_run(f"{output_path}{input_file}", f"{output_path}{output_file}", [MODIFIED_DAY_STAGE])
     return {
         "output_path": f"{output_path}",
         "file_name": f"{output_file}"
@@ -135,41 +96,22 @@ def add_modified_day_column_to_csv(output_path, input_file, p_output_file=""):
 
 
 def add_deliquency_column_to_csv(output_path, input_file, output_file):
-    """ Append a column in existing csv using csv.reader / csv.writer classes"""
-    # Open the input_file in read mode and output_file in write mode
-    with open(f"{output_path}{input_file}", 'r') as read_obj, open(f"{output_path}{output_file}", 'w', newline='') as write_obj:
-        # Create a csv.reader object from the input file object
-        csv_reader = DictReader(read_obj)
-        headers = csv_reader.fieldnames
-        # headers = []
-        total_column = len(headers)
-        headers.insert(total_column+5, "suggested_start_date")
-        headers.insert(total_column+6, "suggested_end_date")
-        # headers.insert(total_column+7, "remarks")
-        headers.insert(total_column+2, "deliquency_90days")
-        headers.insert(total_column+3, "deliquency_bomc")
-        headers.insert(total_column+4, "age_since_approval_date")
-        headers.insert(total_column+1, "numbering")
-        # Create a csv.writer object from the output file object
-        csv_writer = DictWriter(write_obj, fieldnames=headers)
-        # Read each row of the input csv file as list
-        counter = 1
-        csv_writer.writeheader()
-        for row in csv_reader:
-            # Pass the list / row in the transform function to add column text for this row
-            if row["bom_decision"] in ["Approved", "Approved by Department"]:
-                row.update({"numbering": counter})
-                row = deliquency_row_add(row)
-                counter += 1
-                csv_writer.writerow(row)
+    """ Keep approved CRs and append their suggested dates and delinquency flags"""
+    csv_pipeline_run(f"{output_path}{input_file}", f"{output_path}{output_file}", [DELIQUENCY_STAGE])
     return {
         "output_path": f"{output_path}",
         "file_name": f"{output_file}"
     }
 
 
-def add_analysis_columns_to_csv(output_path, input_file, output_file):
-    """ Append a column in existing csv using csv.reader / csv.writer classes"""
+def add_analysis_columns_to_csv(output_path, input_file, output_file, bulk=True, chunk_size=ISSUE_KEY_CHUNK_SIZE):
+    """ Append a column in existing csv using csv.reader / csv.writer classes
+
+    With bulk (the default) the BOM decision and approval date of every row
+    are fetched up front in chunks of chunk_size keys; rows whose issue the
+    bulk fetch did not return fall back to a per-row lookup.
+    """
+    filters = ['bom_decision', 'bom_approval_date']
     # Open the input_file in read mode and output_file in write mode
     with open(f"{output_path}{input_file}", 'r') as read_obj, open(f"{output_path}{output_file}", 'w', newline='') as write_obj:
         # Create a csv.reader object from the input file object
@@ -180,17 +122,22 @@ def add_analysis_columns_to_csv(output_path, input_file, output_file):
         headers.insert(total_column+2, "bom_decision")
         headers.insert(total_column+3, "bom_approval_date")
         headers.insert(total_column+1, "numbering")
+        rows = list(csv_reader)
+        enriched = {}
+        if bulk:
+            enriched = issues_data_extract_bulk(
+                [row["key"] for row in rows], "IT CM", filters, chunk_size)
         # Create a csv.writer object from the output file object
         csv_writer = DictWriter(write_obj, fieldnames=headers)
         # Read each row of the input csv file as list
         counter = 1
         parsed_data = None
         csv_writer.writeheader()
-        for row in csv_reader:
-            # print(row)
+        for row in rows:
             # Pass the list / row in the transform function to add column text for this row
-            parsed_data = issue_data_extract(
-                row["key"], "IT CM", ['bom_decision', 'bom_approval_date'])
+            parsed_data = enriched.get(row["key"])
+            if parsed_data is None:
+                parsed_data = issue_data_extract(row["key"], "IT CM", filters)
             # if row["bom_decision"] in ["Approved", "Approved by Department"]:
             row.update({"numbering": counter})
             row.update({"bom_decision": parsed_data[0]})
@@ -205,35 +152,8 @@ def add_analysis_columns_to_csv(output_path, input_file, output_file):
 
 
 def add_review_column_to_csv(output_path, input_file, output_file):
-    """ Append a column in existing csv using csv.reader / csv.writer classes"""
-    # Open the input_file in read mode and output_file in write mode
-    with open(f"{output_path}{input_file}", 'r') as read_obj, open(f"{output_path}{output_file}", 'w', newline='') as write_obj:
-        # Create a csv.reader object from the input file object
-        csv_reader = DictReader(read_obj)
-        headers = csv_reader.fieldnames
-        # headers = []
-        total_column = len(headers)
-        headers.insert(total_column+5, "suggested_start_date")
-        headers.insert(total_column+6, "suggested_end_date")
-        headers.insert(total_column+7, "result")
-        headers.insert(total_column+8, "efforts_review")
-        headers.insert(total_column+2, "deliquency_90days")
-        headers.insert(total_column+3, "deliquency_bomc")
-        headers.insert(total_column+4, "age_since_approval_date")
-        headers.insert(total_column+1, "numbering")
-        # Create a csv.writer object from the output file object
-        csv_writer = DictWriter(write_obj, fieldnames=headers)
-        # Read each row of the input csv file as list
-        counter = 1
-        csv_writer.writeheader()
-        for row in csv_reader:
-            # Pass the list / row in the transform function to add column text for this row
-            if row["bom_decision"] in ["Approved", "Approved by Department"]:
-                row.update({"numbering": counter})
-                row = review_row_add(row)
-                print("row:", row)
-                counter += 1
-                csv_writer.writerow(row)
+    """ Keep approved CRs and append delinquency flags plus completion and efforts reviews"""
+    csv_pipeline_run(f"{output_path}{input_file}", f"{output_path}{output_file}", [REVIEW_STAGE])
     return {
         "output_path": f"{output_path}",
         "file_name": f"{output_file}"
@@ -241,38 +161,33 @@ def add_review_column_to_csv(output_path, input_file, output_file):
 
 
 def violated_rules_to_csv(output_path, input_file, output_file):
-    with open(f"{output_path}{input_file}", 'r') as read_obj, open(f"{output_path}{output_file}", 'w', newline='') as write_obj:
-        # Create a csv.reader object from the input file object
-        csv_reader = DictReader(read_obj)
-        # headers = csv_reader.fieldnames
-        headers = ["key", "biz_division",
-                   "system_name", "error_code", "error_msg", "updated_date"]
-        # headers = []
-        # Create a csv.writer object from the output file object
-        csv_writer = DictWriter(write_obj, fieldnames=headers)
-        # Read each row of the input csv file as list
-        counter = 1
-        csv_writer.writeheader()
-        row = {}
-        for row_reader in csv_reader:
-            str = row_reader["validation_result"]
-            arr = str.split(";")
-            if len(arr) > 0 and arr[0] != "Cleaned":
-                for i in range(len(arr)):
-                    err_code = arr[i].split(":")[0]
-                    row.update({"key": row_reader["key"]})
-                    row.update({"biz_division": row_reader["biz_division"]})
-                    row.update({"system_name": row_reader["system_name"]})
-                    row.update({"error_code": err_code})
-                    row.update({"error_msg": arr[i]})
-                    row.update({"updated_date": row_reader["updated_date"]})
-                    # print(row)
-                    csv_writer.writerow(row)
-            # row.update({"numbering": counter})
-            # row = fields_validate(row)
-            # counter += 1
-            # Write the updated row / list to the output file
-            # csv_writer.writerow(row)
+    """ One row per violated rule of each validated row"""
+    csv_pipeline_run(f"{output_path}{input_file}", f"{output_path}{output_file}", [VIOLATED_RULES_STAGE])
+    return {
+        "output_path": f"{output_path}",
+        "file_name": f"{output_file}"
+    }
+
+
+def csv_stages_run(output_path, input_file, output_file, stage_names, intermediate_files=None):
+    """ Run several of CSV_STAGES over a file in one pass
+
+    Args:
+        output_path: directory prefix of every file name, as for the add_*_to_csv steps
+        input_file: file the first stage reads
+        output_file: file the last stage writes
+        stage_names: CSV_STAGES keys in run order, e.g. ["validation", "violated_rules"]
+        intermediate_files: optional stage name -> file name of stage outputs to keep
+
+    Returns:
+        dict: output_path and file_name of the output, as the add_*_to_csv steps
+    """
+    stages = [CSV_STAGES[stage_name] for stage_name in stage_names]
+    intermediate_files = {
+        stage_name: f"{output_path}{file_name}"
+        for stage_name, file_name in (intermediate_files or {}).items()}
+    csv_pipeline_run(f"{output_path}{input_file}", f"{output_path}{output_file}",
+                     stages, intermediate_files)
     return {
         "output_path": f"{output_path}",
         "file_name": f"{output_file}"
@@ -390,7 +305,7 @@ def data_insert(output_path, input_file, output_file, mode):
         if mode == "w":
             csv_writer.writeheader()
         current_date = datetime.datetime.now()
-        it_sys_list = read_json_file(
+        it_sys_list = config_json_get(
             "./config-pattern/it_systems_list.json")["it_systems_list"]
         # print(it_sys_list)
         print(len(it_sys_list))
@@ -682,6 +597,81 @@ def deliquency_bomc_check(status, approval_status, efforts, diff_days):
         return 0
 
 
+APPROVED_DECISIONS = ["Approved", "Approved by Department"]
+
+
+def validation_stage_row(row, number):
+    row.update({"numbering": number})
+    return fields_validate(row)
+
+
+def modified_day_stage_row(row, number):
+    row.update({"numbering": number})
+    return modified_date_add(row, "modified_date")
+
+
+def deliquency_stage_row(row, number):
+    if row["bom_decision"] not in APPROVED_DECISIONS:
+        return None
+    row.update({"numbering": number})
+    return deliquency_row_add(row)
+
+
+def review_stage_row(row, number):
+    if row["bom_decision"] not in APPROVED_DECISIONS:
+        return None
+    row.update({"numbering": number})
+    row = review_row_add(row)
+    # print("row:", row)
+    return row
+
+
+def violated_rules_stage_row(row_reader, number):
+    rows = []
+    arr = row_reader["validation_result"].split(";")
+    if len(arr) > 0 and arr[0] != "Cleaned":
+        for error_msg in arr:
+            rows.append({
+                "key": row_reader["key"],
+                "biz_division": row_reader["biz_division"],
+                "system_name": row_reader["system_name"],
+                "error_code": error_msg.split(":")[0],
+                "error_msg": error_msg,
+                "updated_date": row_reader["updated_date"]
+            })
+    return rows
+
+
+# Row stages of the add_*_to_csv steps; the column offsets reproduce the
+# header layout each step has always written.
+VALIDATION_STAGE = CsvRowStage(
+    "validation", validation_stage_row,
+    columns=[(0, "validation_result"), (1, "numbering"), (2, "no_of_errors")])
+MODIFIED_DAY_STAGE = CsvRowStage(
+    "modified_day", modified_day_stage_row,
+    columns=[(0, "modified_date"), (1, "numbering")])
+DELIQUENCY_STAGE = CsvRowStage(
+    "deliquency", deliquency_stage_row,
+    columns=[(5, "suggested_start_date"), (6, "suggested_end_date"),
+             (2, "deliquency_90days"), (3, "deliquency_bomc"),
+             (4, "age_since_approval_date"), (1, "numbering")])
+REVIEW_STAGE = CsvRowStage(
+    "review", review_stage_row,
+    columns=[(5, "suggested_start_date"), (6, "suggested_end_date"),
+             (7, "result"), (8, "efforts_review"),
+             (2, "deliquency_90days"), (3, "deliquency_bomc"),
+             (4, "age_since_approval_date"), (1, "numbering")])
+VIOLATED_RULES_STAGE = CsvRowStage(
+    "violated_rules", violated_rules_stage_row,
+    fieldnames=["key", "biz_division", "system_name", "error_code", "error_msg", "updated_date"])
+
+CSV_STAGES = {
+    stage.name: stage
+    for stage in (VALIDATION_STAGE, MODIFIED_DAY_STAGE, DELIQUENCY_STAGE,
+                  REVIEW_STAGE, VIOLATED_RULES_STAGE)
+}
+
+
 def add_column_in_csv_2(input_file, output_file, transform_row, tansform_column_names):
     """ Append a column in existing csv using csv.reader / csv.writer classes"""
     # Open the input_file in read mode and output_file in write mode
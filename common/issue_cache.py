@@ -0,0 +1,201 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+FieldsSpec = Union[str, list, tuple, set, None]
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS issues (
+    issue_key TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    validated_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (issue_key, variant)
+)
+"""
+
+
+def issue_variant_get(fields: FieldsSpec = None, expand: Optional[str] = None) -> str:
+    """Identify which representation of an issue (fields and expansions) is cached."""
+    if isinstance(fields, (list, tuple, set)):
+        fields = ",".join(sorted(fields))
+    return f"{fields or '*all'}|{expand or ''}"
+
+
+class IssueCache:
+    """
+    On-disk cache of full Jira issue JSON, keyed by issue key and the issue's
+    ``fields.updated`` timestamp.
+
+    Payloads are stored zlib-compressed in SQLite, one row per issue key and
+    representation (requested fields and expansions). An entry is served
+    without asking Jira while it was confirmed current less than
+    ``revalidate_after`` seconds ago; older entries have to be revalidated
+    against ``fields.updated``, one key at a time or many keys at once with
+    :meth:`validate`. Once the payloads exceed ``max_bytes`` the least
+    recently used entries are evicted. The database is opened on first use.
+    """
+
+    def __init__(self, db_file: Union[str, Path], max_bytes: int = 256 * 1024 * 1024,
+                 revalidate_after: float = 300.0):
+        self.db_file = Path(db_file)
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.changed = 0
+        self.evictions = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+            self._conn.execute(CREATE_TABLE_SQL)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS issues_accessed ON issues (accessed_at)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, issue_key: str, variant: str, fresh_only: bool = True) -> Optional[Dict]:
+        """
+        Get a cached issue.
+
+        Args:
+            issue_key: Issue key
+            variant: Representation, from issue_variant_get
+            fresh_only: Only return it if confirmed current within
+                ``revalidate_after``; pass False right after :meth:`validate`
+
+        Returns:
+            Issue JSON, or None if it is not cached or needs revalidation
+        """
+        now = time.time()
+        validated_since = now - self.revalidate_after if fresh_only else float('-inf')
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload FROM issues WHERE issue_key = ? AND variant = ? "
+                "AND validated_at >= ?",
+                (issue_key, variant, validated_since)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE issues SET accessed_at = ? WHERE issue_key = ? AND variant = ?",
+                (now, issue_key, variant))
+            conn.commit()
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def updated_get(self, issue_key: str, variant: str) -> Optional[str]:
+        """Get the ``fields.updated`` of a cached issue, fresh or not."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT updated FROM issues WHERE issue_key = ? AND variant = ?",
+                (issue_key, variant)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, issue_key: str, variant: str, issue: Dict) -> None:
+        """Store a freshly downloaded issue and evict past the size cap."""
+        payload = zlib.compress(json.dumps(issue).encode('utf-8'))
+        updated = issue.get('fields', {}).get('updated') or ''
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO issues "
+                "(issue_key, variant, updated, payload, size, validated_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (issue_key, variant, updated, payload, len(payload), now, now))
+            self.misses += 1
+            self._evict(conn)
+            conn.commit()
+
+    def validate(self, updated_by_key: Dict[str, Optional[str]]) -> int:
+        """
+        Revalidate cached issues against their current ``fields.updated``.
+
+        Entries whose timestamp still matches are marked current; entries of
+        issues that changed, or that Jira no longer returns (``None``), are
+        dropped.
+
+        Args:
+            updated_by_key: Mapping of issue key to its current ``fields.updated``
+
+        Returns:
+            Number of cached entries confirmed current
+        """
+        now = time.time()
+        confirmed = 0
+        with self._lock:
+            conn = self._connection()
+            for issue_key, updated in updated_by_key.items():
+                if updated is not None:
+                    cursor = conn.execute(
+                        "UPDATE issues SET validated_at = ? WHERE issue_key = ? AND updated = ?",
+                        (now, issue_key, updated))
+                    confirmed += cursor.rowcount
+                    updated_filter = "AND updated != ?"
+                    params = (issue_key, updated)
+                else:
+                    updated_filter = ""
+                    params = (issue_key,)
+                cursor = conn.execute(
+                    f"DELETE FROM issues WHERE issue_key = ? {updated_filter}", params)
+                self.changed += cursor.rowcount
+            conn.commit()
+            self.revalidated += confirmed
+        return confirmed
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM issues").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT issue_key, variant, size FROM issues ORDER BY accessed_at").fetchall()
+        for issue_key, variant, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM issues WHERE issue_key = ? AND variant = ?",
+                         (issue_key, variant))
+            total -= size
+            self.evictions += 1
+
+    def invalidate(self, issue_key: Optional[str] = None) -> None:
+        """Drop every representation of one issue, or the whole cache."""
+        with self._lock:
+            conn = self._connection()
+            if issue_key is None:
+                conn.execute("DELETE FROM issues")
+            else:
+                conn.execute("DELETE FROM issues WHERE issue_key = ?", (issue_key,))
+            conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Report hit/miss/revalidation/eviction counters and the cache size."""
+        with self._lock:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM issues").fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "changed": self.changed,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": size,
+            }
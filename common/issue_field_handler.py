@@ -1,7 +1,6 @@
 import datetime
-from atlassian import Jira
 import json
-from jsonpath_ng import jsonpath, parse
+from common.json_util import jsonpath_compile
 
 from json_util_v2 import read_json_file
 
@@ -13,7 +12,7 @@ def invalid_field(path_pattern, json_data):
 def single_value_handler(path_pattern, json_data):
     gotdata = None
     # print(path_pattern)
-    status_jsonpath_expr = parse(path_pattern)
+    status_jsonpath_expr = jsonpath_compile(path_pattern)
     value = status_jsonpath_expr.find(json_data)
     if len(value) > 0:
         gotdata = value[0].value
@@ -44,7 +43,7 @@ def list_of_values_handler(path_pattern, json_data):
     # print(path_pattern)
     if isinstance(path_pattern, list):
         for item in path_pattern:
-            status_jsonpath_expr = parse(item)
+            status_jsonpath_expr = jsonpath_compile(item)
             value = status_jsonpath_expr.find(json_data)
             if len(value) > 0:
                 gotdata = value[0].value
@@ -152,10 +151,11 @@ def perform_operation(chosen_field, json_data, path_pattern):
 
 
 def jira_cr_extract(jql):
-    jira = Jira(
-        url='https://fecredit.atlassian.net',
-        username='khoa.nguyen.24@fecredit.com.vn',
-        password='AEqPCgn5b5BSOArR0Aqu612D')  # password is a generated Token
+    # Imported here: common.jira_util imports this module
+    from common.jira_util import JIRA_DEFAULT_TEAM, jira_acct_get
+    jira = jira_acct_get(JIRA_DEFAULT_TEAM)
+    if jira is None:
+        return []
     issues = jira.jql_get_list_of_tickets(jql)
     json_object = json.dumps(issues, indent=4)
     json_data = json.loads(json_object)
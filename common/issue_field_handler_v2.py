@@ -1,8 +1,7 @@
 from dataclasses import replace
 import datetime
-from atlassian import Jira
 import json
-from jsonpath_ng import parse
+from common.json_util import JSONPATH_NOT_FOUND, jsonpath_compile, jsonpath_first_compile
 
 
 def invalid_field(path_pattern, json_data):
@@ -12,7 +11,7 @@ def invalid_field(path_pattern, json_data):
 def single_value_handler(path_pattern, json_data):
     gotdata = None
     # print(path_pattern)
-    status_jsonpath_expr = parse(path_pattern)
+    status_jsonpath_expr = jsonpath_compile(path_pattern)
     value = status_jsonpath_expr.find(json_data)
     if len(value) > 0:
         gotdata = value[0].value
@@ -45,9 +44,9 @@ def latest_comment_extract(input_json_data):
     comments = input_json_data.get("comments")
     # comment_jsonpath_expr = parse("$.body")
     # parsing path for getting author of comment
-    comment_author_jsonpath_expr = parse("$.author.displayName")
+    comment_author_jsonpath_expr = jsonpath_compile("$.author.displayName")
     # parsing path for getting updated date of comment 20/06/2022
-    comment_updated_jsonpath_expr = parse("$.updated")
+    comment_updated_jsonpath_expr = jsonpath_compile("$.updated")
     gotdata = None
     if len(comments) > 0:
         # comment = comment_jsonpath_expr.find(
@@ -80,91 +79,15 @@ def list_of_values_handler(path_pattern, json_data):
     # print(path_pattern)
     if isinstance(path_pattern, list):
         for item in path_pattern:
-            status_jsonpath_expr = parse(item)
+            status_jsonpath_expr = jsonpath_compile(item)
             value = status_jsonpath_expr.find(json_data)
             if len(value) > 0:
-                gotdata = value[0].value
-                if item in get_change_request_types():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_biz_benefits():
-                    gotdata = not_avail_value_assign(gotdata)
-                    gotdata = biz_benefits_check(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_pega_biz_benefits():
-                    gotdata = not_avail_value_assign(gotdata)
-                    gotdata = biz_benefits_check(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_biz_priority():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_biz_division():
-                    # print(item)
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_bizexpect_timeline():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_proposed_to_bom():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_bom_decision():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_bom_approval_date():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_bom_proposed_date():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                # Added on 19/10/2022
-                if item in get_estimated_efforts():
-                    gotdata = not_avail_value_assign(gotdata)
-                    # This logic is handling the case that there are more than 2 fields exsiting in a JIRA project
-                    if gotdata == "Not Available":
-                        pass
-                    else:
-                        return gotdata
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_start_date():
-                    gotdata = not_avail_value_assign(gotdata)
-                    # This logic is handling the case that there are more than 2 fields exsiting in a JIRA project
-                    # if item == "$.fields[*].customfield_13059":
-                    #     print(item, not_avail_value_assign(gotdata))
-                    if gotdata == "Not Available":
-                        pass
-                    else:
-                        return gotdata
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_end_date():
-                    gotdata = not_avail_value_assign(gotdata)
-                    # This logic is handling the case that there are more than 2 fields exsiting in a JIRA project
-                    if gotdata == "Not Available":
-                        pass
-                    else:
-                        return gotdata
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_delay_reason_type():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
-                if item in get_delay_reason_dtl():
-                    gotdata = not_avail_value_assign(gotdata)
-                # else:
-                #     gotdata = not_avail_value_assign(gotdata)
+                gotdata, done = path_value_postprocess(
+                    value[0].value, PATH_POSTPROCESSORS.get(item, ()))
+                # A field can exist in more than one JIRA project; the first
+                # available value of such a field wins
+                if done:
+                    return gotdata
             else:
                 gotdata = not_avail_value_assign(gotdata)
     return gotdata
@@ -329,59 +252,200 @@ def not_avail_value_assign(gotdata):
         gotdata = "Not Available"
     return gotdata
 
+# Postprocessing applied to a value found at a list-of-values path
+NOT_AVAILABLE_STEP = "not_available"
+BIZ_BENEFITS_STEP = "biz_benefits_check"
+FIRST_AVAILABLE_STEP = "first_available"
+POSTPROCESSING_STEPS = {
+    NOT_AVAILABLE_STEP: not_avail_value_assign,
+    BIZ_BENEFITS_STEP: biz_benefits_check,
+    FIRST_AVAILABLE_STEP: None,
+}
+
+# Path -> ordered postprocessing steps, built once at import time
+PATH_POSTPROCESSORS = {}
+
+
+def path_postprocessors_register(paths, steps):
+    """Register the postprocessing of values found at custom field paths.
+
+    Steps are appended in order after any already registered for a path:
+    NOT_AVAILABLE_STEP maps empty values to "Not Available",
+    BIZ_BENEFITS_STEP blanks the unfilled benefits template and
+    FIRST_AVAILABLE_STEP makes list_of_values_handler return the value
+    unless it is "Not Available". Register before compiling extractors.
+    """
+    steps = tuple(steps)
+    for step in steps:
+        if step not in POSTPROCESSING_STEPS:
+            raise ValueError(f"Unknown postprocessing step: {step}")
+    for path in paths:
+        PATH_POSTPROCESSORS[path] = PATH_POSTPROCESSORS.get(path, ()) + steps
+
+
+def path_value_postprocess(gotdata, steps):
+    """Apply a path's postprocessing steps to a value found at it.
+
+    Returns:
+        Tuple of (value, True if no later path should be looked at)
+    """
+    for step in steps:
+        if step == FIRST_AVAILABLE_STEP:
+            if gotdata != "Not Available":
+                return gotdata, True
+        else:
+            gotdata = POSTPROCESSING_STEPS[step](gotdata)
+    return gotdata, False
+
+
+for field_paths, field_steps in (
+    (get_change_request_types(), (NOT_AVAILABLE_STEP,)),
+    (get_biz_benefits(), (NOT_AVAILABLE_STEP, BIZ_BENEFITS_STEP)),
+    (get_pega_biz_benefits(), (NOT_AVAILABLE_STEP, BIZ_BENEFITS_STEP)),
+    (get_biz_priority(), (NOT_AVAILABLE_STEP,)),
+    (get_biz_division(), (NOT_AVAILABLE_STEP,)),
+    (get_bizexpect_timeline(), (NOT_AVAILABLE_STEP,)),
+    (get_proposed_to_bom(), (NOT_AVAILABLE_STEP,)),
+    (get_bom_decision(), (NOT_AVAILABLE_STEP,)),
+    (get_bom_approval_date(), (NOT_AVAILABLE_STEP,)),
+    (get_bom_proposed_date(), (NOT_AVAILABLE_STEP,)),
+    # Added on 19/10/2022
+    (get_estimated_efforts(), (NOT_AVAILABLE_STEP, FIRST_AVAILABLE_STEP)),
+    (get_start_date(), (NOT_AVAILABLE_STEP, FIRST_AVAILABLE_STEP)),
+    (get_end_date(), (NOT_AVAILABLE_STEP, FIRST_AVAILABLE_STEP)),
+    (get_delay_reason_type(), (NOT_AVAILABLE_STEP,)),
+    (get_delay_reason_dtl(), (NOT_AVAILABLE_STEP,)),
+):
+    path_postprocessors_register(field_paths, field_steps)
+
+
 # The better way:
 
 
+FIELD_OPERATIONS = {
+    "key": single_value_handler,
+    "summary": single_value_handler,
+    "biz_benefits": list_of_values_handler,
+    "changerequesttype": list_of_values_handler,
+    "biz_priority": list_of_values_handler,
+    "biz_division": list_of_values_handler,
+    "bizexpect_timeline": list_of_values_handler,
+    "created": single_value_handler,
+    "updated": single_value_handler,
+    "status": single_value_handler,
+    "requestor": single_value_handler,
+    "valid": single_value_handler,
+    "proposed_to_bom": list_of_values_handler,
+    "it_recommendation": single_value_handler,
+    "proposed_date": single_value_handler,
+    "bom_approval": single_value_handler,
+    "approval_date": single_value_handler,
+    "comments": single_value_handler,
+    "bom_decision": list_of_values_handler,
+    "bom_approval_date": list_of_values_handler,
+    "bom_proposed_date": list_of_values_handler,
+    "assignee": single_value_handler,
+    "timeoriginalestimate": single_value_handler,
+    "estimated_efforts": list_of_values_handler,
+    "start_date": list_of_values_handler,
+    "end_date": list_of_values_handler,
+    "delay_reason_type": list_of_values_handler,
+    "delay_reason_dtl": list_of_values_handler,
+    "resolutiondate": single_value_handler,
+    "histories": single_value_handler,
+    "changelog": single_value_handler,
+    "accountId": single_value_handler,
+    "expectedDate": single_value_handler,
+}
+
+
+def field_operation_register(chosen_field, handler=list_of_values_handler):
+    """Register the handler perform_operation uses for a new parsing-paths field."""
+    FIELD_OPERATIONS[chosen_field] = handler
+
+
 def perform_operation(chosen_field, json_data, path_pattern):
-    ops = {
-        "key": single_value_handler,
-        "summary": single_value_handler,
-        "biz_benefits": list_of_values_handler,
-        "changerequesttype": list_of_values_handler,
-        "biz_priority": list_of_values_handler,
-        "biz_division": list_of_values_handler,
-        "bizexpect_timeline": list_of_values_handler,
-        "created": single_value_handler,
-        "updated": single_value_handler,
-        "status": single_value_handler,
-        "requestor": single_value_handler,
-        "valid": single_value_handler,
-        "proposed_to_bom": list_of_values_handler,
-        "it_recommendation": single_value_handler,
-        "proposed_date": single_value_handler,
-        "bom_approval": single_value_handler,
-        "approval_date": single_value_handler,
-        "comments": single_value_handler,
-        "bom_decision": list_of_values_handler,
-        "bom_approval_date": list_of_values_handler,
-        "bom_proposed_date": list_of_values_handler,
-        "assignee": single_value_handler,
-        "timeoriginalestimate": single_value_handler,
-        "estimated_efforts": list_of_values_handler,
-        "start_date": list_of_values_handler,
-        "end_date": list_of_values_handler,
-        "delay_reason_type": list_of_values_handler,
-        "delay_reason_dtl": list_of_values_handler,
-        "resolutiondate": single_value_handler,
-        "histories": single_value_handler,
-        "changelog": single_value_handler,
-        "accountId": single_value_handler,
-        "expectedDate": single_value_handler,
-    }
-    # print(ops)
     # print("chosen_field", chosen_field)
-    chosen_operation_function = ops.get(chosen_field, invalid_field)
+    chosen_operation_function = FIELD_OPERATIONS.get(chosen_field, invalid_field)
 
     # print(chosen_operation_function)
 
     return chosen_operation_function(path_pattern, json_data)
 
 
+def single_value_extractor_compile(path_pattern):
+    find = jsonpath_first_compile(path_pattern)
+
+    def extract(json_data):
+        gotdata = find(json_data)
+        if gotdata is JSONPATH_NOT_FOUND:
+            return not_avail_value_assign(None)
+        gotdata = not_avail_value_assign(gotdata)
+        if isinstance(gotdata, dict):
+            gotdata = latest_comment_extract(gotdata)
+        return gotdata
+    return extract
+
+
+def list_of_values_extractor_compile(path_pattern):
+    plan = [(jsonpath_first_compile(item), PATH_POSTPROCESSORS.get(item, ()))
+            for item in path_pattern]
+
+    def extract(json_data):
+        gotdata = None
+        for find, steps in plan:
+            value = find(json_data)
+            if value is JSONPATH_NOT_FOUND:
+                gotdata = not_avail_value_assign(gotdata)
+                continue
+            gotdata, done = path_value_postprocess(value, steps)
+            if done:
+                return gotdata
+        return gotdata
+    return extract
+
+
+def field_extractor_compile(chosen_field, path_pattern):
+    """Compile one parsing-paths entry into a function of the issue JSON.
+
+    The function returns exactly what perform_operation(chosen_field,
+    json_data, path_pattern) would, but the paths are resolved once, plain
+    paths are read with direct accessors and the postprocessing of each
+    path is decided up front.
+    """
+    handler = FIELD_OPERATIONS.get(chosen_field, invalid_field)
+    if handler is single_value_handler and isinstance(path_pattern, str):
+        return single_value_extractor_compile(path_pattern)
+    if handler is list_of_values_handler and isinstance(path_pattern, list):
+        return list_of_values_extractor_compile(path_pattern)
+    return lambda json_data: handler(path_pattern, json_data)
+
+
+def field_extractors_compile(data):
+    """Compile every entry of a parsing-paths mapping, keyed by field."""
+    return {item: field_extractor_compile(item, data[item]) for item in data}
+
+
+def issue_row_extractor_compile(data, filters=None):
+    """Compile a parsing-paths mapping into one function from an issue to a row.
+
+    Without filters every field is extracted, otherwise only those listed,
+    in the order of the mapping, as jira_issue_parsed_data_get does.
+    """
+    extractors = [extract for item, extract in field_extractors_compile(data).items()
+                  if filters is None or item in filters]
+
+    def row_extract(json_data):
+        return [extract(json_data) for extract in extractors]
+    return row_extract
+
+
 def jira_cr_extract(jql):
-    jira = Jira(
-        url='https://fecredit.atlassian.net',
-        username='khoa.nguyen.24@fecredit.com.vn',
-        password='AEqPCgn5b5BSOArR0Aqu612D')  # password is a generated Token
+    # Imported here: common.jira_util imports this module
+    from common.jira_util import JIRA_DEFAULT_TEAM, jira_acct_get
+    jira = jira_acct_get(JIRA_DEFAULT_TEAM)
+    if jira is None:
+        return []
     issues = jira.jql_get_list_of_tickets(jql)
     json_object = json.dumps(issues, indent=4)
     json_data = json.loads(json_object)
@@ -0,0 +1,189 @@
+import hashlib
+import logging
+import os
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from atlassian import Jira
+
+from common.rate_limiter import AdaptiveRateLimiter, RateLimitedAdapter
+
+logger = logging.getLogger(__name__)
+
+CredentialsLoader = Callable[[], Tuple[Optional[str], Optional[str]]]
+
+
+def credentials_version_get(file_path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a credentials file, or None if it cannot be read."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def credentials_fingerprint(username: str, password: str) -> str:
+    """Digest identifying a username/password pair without keeping the password."""
+    return hashlib.sha256(f"{username}\0{password}".encode("utf-8")).hexdigest()
+
+
+class JiraClientRegistry:
+    """
+    Process-wide registry of Jira clients, one per team/credentials key.
+
+    Each client is backed by its own tuned ``requests.Session`` so repeated
+    calls reuse keep-alive connections instead of paying a new TLS handshake
+    and credentials file read per batch. Safe to share between threads.
+    When a rate limiter is given, every request of every pooled session goes
+    through it; ``max_in_flight`` caps concurrent requests across all of them.
+    Clients are created under a per-key lock, so a slow credentials read or
+    client setup for one key does not hold up the others, and a changed
+    credentials source (see ``version`` of client_get) is picked up without
+    a restart.
+    """
+
+    def __init__(self, pool_size: int = 10, timeout: int = 75,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 max_in_flight: Optional[int] = None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        # (url, key) -> (credentials version, credentials fingerprint, client)
+        self._clients: Dict[Tuple[str, str], Tuple[Hashable, str, Jira]] = {}
+        self._sessions: Dict[Tuple[str, str], requests.Session] = {}
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._clients_created = 0
+        self._client_hits = 0
+
+    def client_get(self, url: str, key: str, credentials_loader: CredentialsLoader,
+                   version: Hashable = None) -> Optional[Jira]:
+        """
+        Get the pooled Jira client for a team/credentials key.
+
+        Args:
+            url: Jira base URL
+            key: Team name or credentials file identifying the account
+            credentials_loader: Callable returning (username, password); only
+                called the first time the key is seen or when ``version`` changes
+            version: Version of the credentials source, such as
+                credentials_version_get of its file. When it changes the
+                credentials are read again, and a new client is created if
+                they differ from the pooled client's.
+
+        Returns:
+            Jira instance if credentials are available, None otherwise
+        """
+        registry_key = (url, key)
+        with self._lock:
+            entry = self._clients.get(registry_key)
+            if entry is not None and entry[0] == version:
+                self._client_hits += 1
+                return entry[2]
+            key_lock = self._key_locks.setdefault(registry_key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have loaded the key while this one waited
+            with self._lock:
+                entry = self._clients.get(registry_key)
+                if entry is not None and entry[0] == version:
+                    self._client_hits += 1
+                    return entry[2]
+
+            username, password = credentials_loader()
+            if not username or not password:
+                logger.error("No Jira credentials found for %s", key)
+                return None
+
+            fingerprint = credentials_fingerprint(username, password)
+            if entry is not None and entry[1] == fingerprint:
+                # The source changed but these credentials did not
+                with self._lock:
+                    self._clients[registry_key] = (version, fingerprint, entry[2])
+                    self._client_hits += 1
+                return entry[2]
+
+            session = self._session_create()
+            client = Jira(
+                url=url,
+                username=username,
+                password=password,
+                timeout=self.timeout,
+                session=session
+            )
+            with self._lock:
+                self._clients[registry_key] = (version, fingerprint, client)
+                self._sessions[registry_key] = session
+                self._clients_created += 1
+            if entry is not None:
+                logger.info("Jira credentials for %s changed, created a new client", key)
+            else:
+                logger.debug("Created pooled Jira client for %s", key)
+            return client
+
+    def _session_create(self) -> requests.Session:
+        """Create a keep-alive session with a connection pool of ``pool_size``."""
+        session = requests.Session()
+        if self.rate_limiter is not None or self.in_flight is not None:
+            adapter = RateLimitedAdapter(
+                self.rate_limiter,
+                in_flight=self.in_flight,
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size
+            )
+        else:
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size
+            )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report client and connection reuse counters.
+
+        Returns:
+            Dictionary with clients created, client cache hits, HTTP requests
+            sent, connections opened and requests served on reused connections
+        """
+        requests_sent = 0
+        connections_opened = 0
+        with self._lock:
+            sessions = list(self._sessions.values())
+            stats = {
+                "clients_created": self._clients_created,
+                "client_hits": self._client_hits,
+            }
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    requests_sent += pool.num_requests
+                    connections_opened += pool.num_connections
+
+        stats.update({
+            "requests": requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": max(requests_sent - connections_opened, 0),
+        })
+        return stats
+
+    def clear(self) -> None:
+        """Close every pooled session and forget all clients."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._clients.clear()
+            self._sessions.clear()
+            self._key_locks.clear()
+            self._clients_created = 0
+            self._client_hits = 0
@@ -1,22 +1,19 @@
 import json
 import csv
 from common.json_util import read_json_file, parse_json, parse_json_v2
-from atlassian import Jira
+from common.jira_util import JIRA_DEFAULT_TEAM, jira_acct_get
 from datetime import datetime
 import os
 
 from common.status_cr import biz_and_jira_mapped_status, status_details_and_jira_mapped_status
 
 
-jira = Jira(
-    url='https://fecredit.atlassian.net',
-    username='khoa.nguyen.24@fecredit.com.vn',
-    password='AEqPCgn5b5BSOArR0Aqu612D')  # password is a generated Token
-
-
 def jira_csv_extract(file_name, JQL, systemname):
     header = ['system_name', 'key', 'summary', 'change request type', 'created', 'month', 'created_in_dec_2021', 'created_in_jan_2022', 'created_in_feb_2022', 'year',
               'age_till_dec_2021', 'late_cr_in_dec_2021_flag', 'age_till_jan', 'late_cr_in_jan_flag', 'age_till_feb', 'late_cr_in_feb_flag', 'age_till_now', 'updated_date', 'days_since_updated', 'status', 'biz_status', 'it_status']
+    jira = jira_acct_get(JIRA_DEFAULT_TEAM)
+    if jira is None:
+        return
     issues = jira.jql_get_list_of_tickets(JQL)
     json_object = json.dumps(issues, indent=4)
     json_data = json.loads(json_object)
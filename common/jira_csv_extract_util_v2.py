@@ -5,31 +5,30 @@ from common.date_util import daysdiff_between_dates
 
 from common.csv_util import check_csv_empty
 
-from common.json_util import json_key_get
 
 from common.jira_util_v2 import *
+from common.jira_util import JIRA_DEFAULT_TEAM, jira_acct_get, jql_issues_cached_get
 from common.json_util import read_json_file, parse_json, parse_json_v2
-from atlassian import Jira
+from common.status_index import status_index_get
 from datetime import datetime
 # import os
 
 from common.status_cr import biz_and_jira_mapped_status, filtered_statuses_list_get, status_details_and_jira_mapped_status
-from common.issue_field_handler_v2 import perform_operation
+from common.issue_field_handler_v2 import field_extractors_compile
 from services.ruleengine_exec import rules_exec
 
-jira = Jira(
-    url='https://fecredit.atlassian.net',
-    username='khoa.nguyen.24@fecredit.com.vn',
-    password='AEqPCgn5b5BSOArR0Aqu612D')  # password is a generated Token
-
 
 def late_cr_v6_extract(file_name, JQL, systemname, parsing_file_path, p_status, p_fields):
     headers = ['system_name', 'key', 'current_status',
                'from_status', 'from_it_status', 'to_status', 'to_it_status', 'date_of_change', 'age_since_approval', 'age_since_deploy_date', 'reporter', 'accountid', 'need_to_remind_yn']
     # fields = ['key', 'status', 'changelog', 'created']
     # print(p_fields)
-    issues = jira.jql_get_list_of_tickets(
-        JQL, fields=p_fields, expand='changelog')
+    # Pooled, rate-limited client shared with the rest of the Jira traffic
+    jira = jira_acct_get(JIRA_DEFAULT_TEAM)
+    if jira is None:
+        return
+    issues = jql_issues_cached_get(
+        jira, JQL, fields=p_fields, expand='changelog')
     print("JQL:", JQL)
     print("Count: ", len(issues))
     json_object = json.dumps(issues, indent=4)
@@ -76,6 +75,7 @@ def csv_v5_initiate(file_name, header, json_data, data, systemname, p_status):
 
 def data_rows_prepare(json_data, data, systemname, it_stage, writer):
     counter = 0
+    extractors = field_extractors_compile(data)
     for json_item in json_data:
         # print("json_item:", json_item)
         # row = []
@@ -98,7 +98,7 @@ def data_rows_prepare(json_data, data, systemname, it_stage, writer):
         for item in data:
             # print('item', item)
             # key = None
-            l_obj = perform_operation(item, json_item, data[item])
+            l_obj = extractors[item](json_item)
             # print('item: ', item)
             # print('l_obj: ', l_obj)
             # print('item: ', item)
@@ -244,21 +244,11 @@ def reminder_send_check(p_days_since_approval, p_days_since_expected_date, p_thr
 def dtl_record_analysis_gen(row, item, l_obj):
     if l_obj != 'Not Available':
         if item == 'histories':
-            row.append(date_of_stage_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), it_stage)))
-            row.append(date_of_stage_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), it_stage)))
-            row.append(date_of_stage_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), it_stage)))
-            row.append(date_of_stage_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), it_stage)))
-            row.append(date_of_stage_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), it_stage)))
+            row.append(date_of_stage_get(l_obj, status_index_get().jira_statuses_get(it_stage)))
+            row.append(date_of_stage_get(l_obj, status_index_get().jira_statuses_get(it_stage)))
+            row.append(date_of_stage_get(l_obj, status_index_get().jira_statuses_get(it_stage)))
+            row.append(date_of_stage_get(l_obj, status_index_get().jira_statuses_get(it_stage)))
+            row.append(date_of_stage_get(l_obj, status_index_get().jira_statuses_get(it_stage)))
         elif item == 'created':
             row.append(datetime.strptime(
                 l_obj.rsplit("+", 1)[0], '%Y-%m-%dT%H:%M:%S.%f').strftime("%Y-%m-%d"))
@@ -270,56 +260,24 @@ def dtl_record_analysis_gen(row, item, l_obj):
             row.append(l_obj)
 
 
+TRANSITION_STAGES = [
+    '0. New/Open', '1. In Review', '2. In Security Review', '3. Waiting for Approval',
+    '4. Waiting for CAB Approval', '5. Approved', '9. In progress of Deployment',
+    '10. Deployed', '6. Done', '7. Canceled', '8. Rejected',
+]
+
+
 def dtl_transitions_gen(item, l_obj, it_stage=[]):
     # print("it_stage", it_stage)
     transtitions = []
     if item == 'histories':
-        if '0. New/Open' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '0. New/Open'))))
-        elif '1. In Review' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '1. In Review'))))
-        elif '2. In Security Review' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '2. In Security Review'))))
-        elif '3. Waiting for Approval' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '3. Waiting for Approval'))))
-        elif '4. Waiting for CAB Approval' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '4. Waiting for CAB Approval'))))
-        elif '5. Approved' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '5. Approved'))))
-        elif '9. In progress of Deployment' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '9. In progress of Deployment'))))
-        elif '10. Deployed' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '10. Deployed'))))
-        elif '6. Done' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '6. Done'))))
-        elif '7. Canceled' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '7. Canceled'))))
-        elif '8. Rejected' in it_stage:
-            transtitions.append(transition_dtl_extract(transitions_details_get(l_obj, json_key_get(
-                read_json_file(
-                    "config-pattern/jira_cr_statuses_obj.json"), '8. Rejected'))))
-        else:
-            pass
+        # Only the first (highest priority) stage present is reported
+        status_index = status_index_get()
+        for stage in TRANSITION_STAGES:
+            if stage in it_stage:
+                transtitions.append(transition_dtl_extract(transitions_details_get(
+                    l_obj, status_index.jira_status_set_get(stage))))
+                break
         # print("transtitions:", transtitions)
     return transtitions
 
@@ -1,7 +1,6 @@
 import json
 import csv
-from common.json_util import read_json_file, parse_json, parse_json_v2
-from atlassian import Jira
+from common.json_util import read_json_file, parse_json, parse_json_v2, row_extractor_compile
 from datetime import datetime
 import os
 from common.status_cr import biz_and_jira_mapped_status, status_details_and_jira_mapped_status
@@ -9,12 +8,6 @@ from common.it_project_mapping import project_categorize
 from common.project_type_mapping import project_type_categorize
 
 
-jira = Jira(
-    url='https://fecredit.atlassian.net',
-    username='khoa.nguyen.24@fecredit.com.vn',
-    password='AEqPCgn5b5BSOArR0Aqu612D')  # password is a generated Token
-
-
 def jira_csv_extract_v2(operation_name, headers, file_name_output, input_data, parsing_path):
     print(operation_name)
     if operation_name == "":
@@ -36,11 +29,10 @@ def jira_issue_data_write_v2(parsing_path, data, writer):
     parsing_path_data = read_json_file(parsing_path)
     print(parsing_path_data)
     counter = 0
+    row_extract = row_extractor_compile(parsing_path_data)
     for rec in data:
-        row = []
         division = ""
-        for json_path_item in parsing_path_data:
-            row.append(parse_json_v2(parsing_path_data[json_path_item], rec))
+        row = row_extract(rec)
         division = project_categorize(row[1])
         print(str(row[4]))
         print(project_type_categorize(str(row[4])))
@@ -1,10 +1,27 @@
 import json
 import csv
+import gzip
 import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
+from zoneinfo import ZoneInfo
+import requests
 from atlassian import Jira
 
+from common.acct_util import jira_accounts_retrieve, team_setting_retrieve
+from common.attachment_index import AttachmentIndex
+from common.issue_cache import FieldsSpec, IssueCache, issue_variant_get
+from common.issue_field_handler_v2 import issue_row_extractor_compile
+from common.json_util import read_json_file
+from common.jira_client_registry import JiraClientRegistry, credentials_version_get
+from common.rate_limiter import AdaptiveRateLimiter
+from common.ttl_cache import TTLCache
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -12,6 +29,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# JIRA_URL = 'https://royal-solution.atlassian.net'
+JIRA_URL = os.getenv("JIRA_URL", "https://fecredit.atlassian.net")
+JIRA_RATE_LIMIT_MAX = float(os.getenv("JIRA_RATE_LIMIT_MAX", "100"))
+# Start at the ceiling; the limiter only slows down after a real 429/503,
+# so concurrent paging is not capped before Jira pushes back.
+# After a halving, climb back by JIRA_RATE_LIMIT_INCREASE req/s per second;
+# a slow climb leaves the rate well under Jira's limit for most of a run.
+JIRA_RATE_LIMITER = AdaptiveRateLimiter(
+    rate=float(os.getenv("JIRA_RATE_LIMIT", str(JIRA_RATE_LIMIT_MAX))),
+    max_rate=JIRA_RATE_LIMIT_MAX,
+    increase_step=float(os.getenv("JIRA_RATE_LIMIT_INCREASE", "4"))
+)
+JIRA_CLIENTS = JiraClientRegistry(
+    pool_size=int(os.getenv("JIRA_POOL_SIZE", "10")),
+    rate_limiter=JIRA_RATE_LIMITER,
+    max_in_flight=int(os.getenv("JIRA_MAX_IN_FLIGHT", "8"))
+)
+CSV_EXPORT_PATH = "sr/jira.issueviews:searchrequest-csv-current-fields/temp/SearchRequest.csv"
+CSV_STREAM_CHUNK_SIZE = 64 * 1024
+ATTACHMENT_CHUNK_SIZE = 256 * 1024
+JQL_COUNT_CACHE = TTLCache(
+    ttl=float(os.getenv("JIRA_COUNT_CACHE_TTL", "60"))
+)
+ISSUE_CACHE = IssueCache(
+    os.getenv("ISSUE_CACHE_DB", "data/issue_cache.sqlite"),
+    max_bytes=int(os.getenv("ISSUE_CACHE_MAX_MB", "256")) * 1024 * 1024,
+    revalidate_after=float(os.getenv("ISSUE_CACHE_REVALIDATE_AFTER", "300"))
+)
+# Team whose pooled account the CR extractors query with
+JIRA_DEFAULT_TEAM = os.getenv("JIRA_DEFAULT_TEAM", "IT CM")
+ISSUE_KEY_CHUNK_SIZE = int(os.getenv("JIRA_KEY_CHUNK_SIZE", "100"))
+# Default page concurrency of get_jira_issues; 1 keeps sequential paging
+JIRA_PAGE_CONCURRENCY = int(os.getenv("JIRA_PAGE_CONCURRENCY", "1"))
+# Attempts per search page before get_jira_issues gives up, and the base delay
+# between them in seconds (multiplied by the attempt number)
+JIRA_PAGE_RETRIES = int(os.getenv("JIRA_PAGE_RETRIES", "3"))
+JIRA_PAGE_RETRY_DELAY = float(os.getenv("JIRA_PAGE_RETRY_DELAY", "1"))
+PARSING_PATHS_FILE = "parsing_paths_v9.json"
+# JQL date literals are read in the Jira account's timezone (IANA name, e.g.
+# Asia/Ho_Chi_Minh). Unset, watermarks are widened by the largest UTC offset
+# instead, and the extra issues re-exported are deduplicated on upsert.
+JIRA_TIMEZONE = os.getenv("JIRA_TIMEZONE")
+JQL_WATERMARK_OVERLAP = timedelta(hours=14)
+
 
 def find_current_state_issue(key: str, it_status: str, filename: str) -> Optional[Dict]:
     """
@@ -45,37 +106,180 @@ def jira_acct_get(team: str) -> Optional[Jira]:
         team: Team name to get credentials for
 
     Returns:
-        Jira instance if successful, None otherwise
+        Pooled Jira instance if successful, None otherwise
     """
-    try:
-        config_path = Path("config")
-        jira_accts_list = "jira_team_accounts.json"
-        jira_accounts = jira_accounts_retrieve(config_path / jira_accts_list)
-        jira_acct = team_setting_retrieve(team, jira_accounts)
+    accounts_file = Path("config") / "jira_team_accounts.json"
 
+    def team_credentials_load() -> Tuple[Optional[str], Optional[str]]:
+        jira_accounts = jira_accounts_retrieve(accounts_file)
+        jira_acct = team_setting_retrieve(team, jira_accounts)
         logger.debug("Team: %s, Account: %s", team, jira_acct.get('account'))
+        return jira_acct.get('account'), jira_acct.get('token')
 
-        return Jira(
-                                url='https://fecredit.atlassian.net',
-        # url='https://royal-solution.atlassian.net',
-            username=jira_acct.get('account'),
-            password=jira_acct.get('token')
-        )
+    try:
+        return JIRA_CLIENTS.client_get(JIRA_URL, f"team:{team}", team_credentials_load,
+                                       credentials_version_get(accounts_file))
     except Exception as e:
         logger.error("Failed to get Jira account: %s", str(e))
         return None
 
 
-def jira_issue_info_by_id_get(ticket: str, jira_acct: Jira) -> Optional[Dict]:
-    """Get issue information by ticket ID."""
+def jira_client_get(config_file: str) -> Optional[Jira]:
+    """
+    Get the pooled Jira client for the credentials in a config file.
+
+    The credentials file is read the first time it is seen and again after
+    it changes on disk; otherwise calls reuse the same client and its
+    keep-alive HTTP session.
+    """
+    return JIRA_CLIENTS.client_get(
+        JIRA_URL,
+        f"config:{config_file}",
+        lambda: get_jira_credentials(config_file),
+        credentials_version_get(config_file)
+    )
+
+
+def issue_fields_with_updated(fields: FieldsSpec) -> FieldsSpec:
+    """Make sure a restricted field list includes ``updated`` for cache validation."""
+    if fields is None or fields == "*all":
+        return fields
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    fields = list(fields)
+    if "updated" not in fields:
+        fields.append("updated")
+    return fields
+
+
+def jira_issue_info_by_id_get(
+    ticket: str,
+    jira_acct: Jira,
+    fields: FieldsSpec = None,
+    expand: Optional[str] = None,
+    use_cache: bool = True
+) -> Optional[Dict]:
+    """
+    Get issue information by ticket ID.
+
+    Issues are served from ISSUE_CACHE when unchanged: a cached copy checked
+    recently is returned as is, an older one is revalidated with a request
+    for ``fields.updated`` only, and the full issue is downloaded only when
+    it changed or was never cached.
+    """
+    fields = issue_fields_with_updated(fields)
+    variant = issue_variant_get(fields, expand)
     try:
-        issue = jira_acct.get_issue(ticket)
-        return json.loads(json.dumps(issue, indent=4))
+        if use_cache:
+            issue = ISSUE_CACHE.get(ticket, variant)
+            if issue is not None:
+                return issue
+            if ISSUE_CACHE.updated_get(ticket, variant) is not None:
+                current = jira_acct.get_issue(ticket, fields="updated")
+                ISSUE_CACHE.validate({ticket: current['fields'].get('updated')})
+                issue = ISSUE_CACHE.get(ticket, variant, fresh_only=False)
+                if issue is not None:
+                    return issue
+
+        issue = jira_acct.get_issue(ticket, fields=fields, expand=expand)
+        if use_cache:
+            ISSUE_CACHE.put(ticket, variant, issue)
+        return issue
     except Exception as e:
         logger.error("Failed to get issue info: %s", str(e))
         return None
 
 
+def issues_cache_revalidate(
+    jira_acct: Jira,
+    issue_keys: List[str],
+    chunk_size: int = ISSUE_KEY_CHUNK_SIZE
+) -> Dict[str, Optional[str]]:
+    """
+    Revalidate many cached issues at once with ``key in (...)`` JQL queries
+    returning only ``fields.updated``.
+
+    Keys Jira no longer knows are skipped with a warning instead of failing
+    their chunk, and their entries are dropped. A chunk whose query fails
+    (e.g. a timeout) leaves its entries cached but stale.
+
+    Returns:
+        Mapping of issue key to its current ``fields.updated`` (None when
+        Jira did not return the issue); keys of failed chunks are left out
+    """
+    updated_by_key: Dict[str, Optional[str]] = {}
+    for start in range(0, len(issue_keys), chunk_size):
+        chunk = issue_keys[start:start + chunk_size]
+        try:
+            result = jira_acct.jql(
+                f"key in ({','.join(chunk)})",
+                fields="updated",
+                limit=len(chunk),
+                validate_query="warn"
+            )
+        except Exception as e:
+            logger.error("Failed to revalidate issues %s..%s: %s", chunk[0], chunk[-1], str(e))
+            continue
+        found = {issue['key']: issue['fields'].get('updated')
+                 for issue in result.get('issues', [])}
+        for key in chunk:
+            updated_by_key[key] = found.get(key)
+    ISSUE_CACHE.validate(updated_by_key)
+    return updated_by_key
+
+
+def jql_issues_cached_get(
+    jira_acct: Jira,
+    jql: str,
+    fields: FieldsSpec = "*all",
+    expand: Optional[str] = None,
+    chunk_size: int = ISSUE_KEY_CHUNK_SIZE
+) -> List[Dict]:
+    """
+    Get the issues matching a JQL query, downloading in full only those that
+    changed since they were cached.
+
+    The query is first run for ``fields.updated`` only; every unchanged issue
+    is then served from ISSUE_CACHE and the rest are fetched with chunked
+    ``key in (...)`` queries.
+
+    Returns:
+        Issues in the order returned by the query
+    """
+    fields = issue_fields_with_updated(fields)
+    variant = issue_variant_get(fields, expand)
+    index = jira_acct.jql_get_list_of_tickets(jql, fields="updated")
+    ISSUE_CACHE.validate({issue['key']: issue['fields'].get('updated') for issue in index})
+
+    issues: Dict[str, Dict] = {}
+    missing = []
+    for entry in index:
+        cached = ISSUE_CACHE.get(entry['key'], variant, fresh_only=False)
+        if cached is None:
+            missing.append(entry['key'])
+        else:
+            issues[entry['key']] = cached
+
+    for start in range(0, len(missing), chunk_size):
+        chunk = missing[start:start + chunk_size]
+        try:
+            result = jira_acct.jql(
+                f"key in ({','.join(chunk)})",
+                fields=fields,
+                expand=expand,
+                limit=len(chunk),
+                validate_query="warn"
+            )
+        except Exception as e:
+            logger.error("Failed to fetch issues %s..%s: %s", chunk[0], chunk[-1], str(e))
+            continue
+        for issue in result.get('issues', []):
+            ISSUE_CACHE.put(issue['key'], variant, issue)
+            issues[issue['key']] = issue
+
+    return [issues[entry['key']] for entry in index if entry['key'] in issues]
+
+
 def jira_issue_parsed_data_get(
     json_data: Dict,
     data: Dict,
@@ -94,15 +298,13 @@ def jira_issue_parsed_data_get(
     Returns:
         List of parsed data objects
     """
-    filters = filters or []
-    row = []
-
-    for item in data:
-        if (applied_filter == 'Y' and item in filters) or applied_filter == 'N':
-            parsed_obj = perform_operation(item, json_data, data[item])
-            row.append(parsed_obj)
-
-    return row
+    if applied_filter == 'N':
+        filters = None
+    elif applied_filter == 'Y':
+        filters = filters or []
+    else:
+        filters = []
+    return issue_row_extractor_compile(data, filters)(json_data)
 
 
 def issue_data_extract(issue_id: str, team: str, filters: List[str]) -> List[Any]:
@@ -115,7 +317,7 @@ def issue_data_extract(issue_id: str, team: str, filters: List[str]) -> List[Any
     if not issue_json_data:
         return []
 
-    parsing_paths_data = path_parsing_data_get("parsing_paths_v9.json")
+    parsing_paths_data = path_parsing_data_get(PARSING_PATHS_FILE)
     return jira_issue_parsed_data_get(
         issue_json_data,
         parsing_paths_data,
@@ -124,6 +326,73 @@ def issue_data_extract(issue_id: str, team: str, filters: List[str]) -> List[Any
     )
 
 
+def parsing_paths_fields_get(
+    parsing_paths: Dict,
+    filters: List[str]
+) -> Tuple[List[str], Optional[str]]:
+    """
+    Work out which Jira fields and expansions the parsing paths of ``filters`` read.
+
+    Returns:
+        Tuple of (field ids, expand parameter or None)
+    """
+    fields = ["key", "updated"]
+    expand = None
+    for item in filters:
+        paths = parsing_paths.get(item, [])
+        for path in paths if isinstance(paths, list) else [paths]:
+            for field in re.findall(r"fields(?:\[\*\])?\.(\w+)", path):
+                if field not in fields:
+                    fields.append(field)
+            if "changelog" in path:
+                expand = "changelog"
+    return fields, expand
+
+
+def issues_data_extract_bulk(
+    issue_keys: List[str],
+    team: str,
+    filters: List[str],
+    chunk_size: int = ISSUE_KEY_CHUNK_SIZE
+) -> Dict[str, List[Any]]:
+    """
+    Extract filtered issue data for many issues at once.
+
+    Issues are fetched with ``key in (...)`` JQL queries of ``chunk_size``
+    keys, requesting only the fields the parsing paths of ``filters`` read,
+    instead of one full ``get_issue`` per key. Keys Jira did not return
+    (unknown or moved issues, failed chunks) are left out.
+
+    Returns:
+        Mapping of issue key to the same list issue_data_extract returns
+    """
+    jira_acct = jira_acct_get(team)
+    if not jira_acct:
+        return {}
+
+    parsing_paths_data = path_parsing_data_get(PARSING_PATHS_FILE)
+    fields, expand = parsing_paths_fields_get(parsing_paths_data, filters)
+    row_extract = issue_row_extractor_compile(parsing_paths_data, filters)
+    keys = list(dict.fromkeys(issue_keys))
+    parsed: Dict[str, List[Any]] = {}
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start:start + chunk_size]
+        try:
+            result = jira_acct.jql(
+                f"key in ({','.join(chunk)})",
+                fields=fields,
+                expand=expand,
+                limit=len(chunk),
+                validate_query="warn"
+            )
+        except Exception as e:
+            logger.error("Failed to fetch issues %s..%s: %s", chunk[0], chunk[-1], str(e))
+            continue
+        for issue in result.get('issues', []):
+            parsed[issue['key']] = row_extract(issue)
+    return parsed
+
+
 def jql_v2_print(jqltemplate_str: str, p_from: str, p_to: str) -> str:
     """Format JQL template with parameters."""
     return jqltemplate_str.format(p_from=p_from, p_to=p_to)
@@ -188,51 +457,229 @@ def get_jira_issues(
     config_file: str,
     max_results: int = 50,
     fields: Optional[List[str]] = None,
-    expand: Optional[str] = None
+    expand: Optional[str] = None,
+    concurrency: Optional[int] = None
 ) -> Tuple[List[Dict], int]:
-    """Get Jira issues with pagination."""
-    username, password = get_jira_credentials(config_file)
-    if not username or not password:
-        return [], 0
+    """
+    Get Jira issues with pagination.
 
+    Every page is retried up to JIRA_PAGE_RETRIES times; a page that still
+    fails raises instead of cutting the result short, so the issues returned
+    are always the complete result.
+
+    Args:
+        jql: JQL query string
+        config_file: Path to the JSON configuration file for credentials
+        max_results: Number of issues requested per page
+        fields: Fields to return for each issue
+        expand: Expand option passed to the search
+        concurrency: Maximum number of pages fetched at once; 1 walks the
+            pages sequentially. Defaults to JIRA_PAGE_CONCURRENCY.
+
+    Returns:
+        Tuple of (issues in result order, total records reported by Jira),
+        or ([], 0) if no Jira client could be created
+
+    Raises:
+        The last error of a page that failed on every attempt
+    """
     try:
-        jira = Jira(
-                    url='https://fecredit.atlassian.net',
-        # url='https://royal-solution.atlassian.net',
-            username=username,
-            password=password
-        )
+        jira = jira_client_get(config_file)
+    except Exception as e:
+        logger.error("Failed to initialize Jira client: %s", str(e))
+        return [], 0
+    if jira is None:
+        return [], 0
 
-        all_issues = []
-        start_at = 0
-        total_records = 0
+    if concurrency is None:
+        concurrency = JIRA_PAGE_CONCURRENCY
+    if concurrency > 1:
+        return jql_pages_concurrent_fetch(
+            jira, jql, max_results, fields, expand, concurrency)
 
-        while True:
-            try:
-                response = jira.jql(
-                    jql,
-                    start=start_at,
-                    limit=max_results,
-                    fields=fields,
-                    expand=expand
-                )
-                all_issues.extend(response['issues'])
-                total_records = response['total']
+    all_issues = []
+    start_at = 0
+
+    while True:
+        response = jql_page_fetch(jira, jql, start_at, max_results, fields, expand)
+        all_issues.extend(response['issues'])
+        total_records = response['total']
 
-                if len(response['issues']) < max_results:
-                    break
+        if len(response['issues']) < max_results:
+            break
 
-                start_at += max_results
+        start_at += max_results
 
+    return all_issues, total_records
+
+
+def jql_page_fetch(
+    jira: Jira,
+    jql: str,
+    start_at: int,
+    limit: int,
+    fields: Optional[List[str]],
+    expand: Optional[str]
+) -> Dict:
+    """
+    Fetch one page of a JQL search, retrying it up to JIRA_PAGE_RETRIES times.
+
+    HTTP 429/503 are already retried by the client's rate limiter; this
+    covers dropped connections, timeouts and malformed responses.
+
+    Raises:
+        The last error once every attempt has failed
+    """
+    for attempt in range(1, JIRA_PAGE_RETRIES + 1):
+        try:
+            response = jira.jql(
+                jql,
+                start=start_at,
+                limit=limit,
+                fields=fields,
+                expand=expand
+            )
+            # A response without these is as unusable as a failed request
+            response['issues'], response['total']
+            return response
+        except (KeyError, TypeError, OSError, requests.RequestException) as e:
+            if attempt == JIRA_PAGE_RETRIES:
+                logger.error("Error fetching issues at %d after %d attempts: %s",
+                             start_at, attempt, str(e))
+                raise
+            logger.warning("Error fetching issues at %d (attempt %d/%d): %s",
+                           start_at, attempt, JIRA_PAGE_RETRIES, str(e))
+            time.sleep(JIRA_PAGE_RETRY_DELAY * attempt)
+
+
+def jql_pages_concurrent_fetch(
+    jira: Jira,
+    jql: str,
+    max_results: int,
+    fields: Optional[List[str]],
+    expand: Optional[str],
+    concurrency: int
+) -> Tuple[List[Dict], int]:
+    """
+    Fetch every page of a JQL search using a bounded thread pool.
+
+    The first page is fetched on its own to learn the total and the page size
+    the server actually honours; the remaining offsets are then fanned out
+    across at most ``concurrency`` workers and reassembled in offset order.
+    Each page is retried by jql_page_fetch; if one still fails the pages not
+    yet started are cancelled and its error is raised.
+
+    Returns:
+        Tuple of (issues in result order, total records reported by Jira)
+    """
+    first_page = jql_page_fetch(jira, jql, 0, max_results, fields, expand)
+    all_issues = list(first_page['issues'])
+    total_records = first_page['total']
+
+    page_size = len(all_issues)
+    if page_size == 0 or page_size >= total_records:
+        return all_issues, total_records
+
+    offsets = range(page_size, total_records, page_size)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(
+                jql_page_fetch, jira, jql, start_at, page_size, fields, expand)
+            for start_at in offsets
+        ]
+        try:
+            for future in futures:
+                all_issues.extend(future.result()['issues'])
+        except Exception:
+            for pending in futures:
+                pending.cancel()
+            raise
+
+    return all_issues, total_records
+
+    offsets = range(page_size, total_records, page_size)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(
+                jira.jql,
+                jql,
+                start=start_at,
+                limit=page_size,
+                fields=fields,
+                expand=expand
+            )
+            for start_at in offsets
+        ]
+        for start_at, future in zip(offsets, futures):
+            try:
+                all_issues.extend(future.result()['issues'])
             except (KeyError, ConnectionError, TimeoutError) as e:
-                logger.error("Error fetching issues: %s", str(e))
+                logger.error("Error fetching issues at %d: %s", start_at, str(e))
+                for pending in futures:
+                    pending.cancel()
                 break
 
-        return all_issues, total_records
+    return all_issues, total_records
 
-    except Exception as e:
-        logger.error("Failed to initialize Jira client: %s", str(e))
-        return [], 0
+
+class CsvRecordCounter:
+    """
+    Count logical CSV records in a byte stream fed chunk by chunk.
+
+    Newlines inside quoted fields are not record boundaries. Works directly on
+    UTF-8 bytes, since multi-byte sequences never contain a newline or quote.
+    """
+
+    def __init__(self):
+        self.newlines = 0
+        self.in_quotes = False
+        self.last_byte = b''
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        if not self.in_quotes and b'"' not in chunk:
+            self.newlines += chunk.count(b'\n')
+        else:
+            parts = chunk.split(b'"')
+            for index, part in enumerate(parts):
+                if not self.in_quotes:
+                    self.newlines += part.count(b'\n')
+                if index < len(parts) - 1:
+                    self.in_quotes = not self.in_quotes
+        self.last_byte = chunk[-1:]
+
+    @property
+    def records(self) -> int:
+        """Number of records seen so far, including the header."""
+        unterminated = 1 if self.last_byte not in (b'', b'\n') else 0
+        return self.newlines + unterminated
+
+
+def jira_csv_stream_open(
+    jira: Jira,
+    jql: str,
+    max_results: int,
+    start_at: int,
+    delimiter: str
+) -> requests.Response:
+    """Open a streamed response for Jira's current-fields CSV export."""
+    params: Dict[str, Any] = {"jqlQuery": jql, "tempMax": max_results}
+    if start_at:
+        params["pager/start"] = start_at
+    if delimiter:
+        params["delimiter"] = delimiter
+    url = jira.url_joiner(jira.url, CSV_EXPORT_PATH)
+    response = jira.session.get(
+        url,
+        params=params,
+        headers={"Accept": "application/csv"},
+        stream=True,
+        timeout=jira.timeout,
+        verify=jira.verify_ssl
+    )
+    response.raise_for_status()
+    return response
 
 
 def export_issues_to_csv(
@@ -242,40 +689,56 @@ def export_issues_to_csv(
     output_file: str,
     max_results: int = 1000,
     start_at: int = 0,
-    delimiter: str = ','
+    delimiter: str = ',',
+    compress: bool = False
 ) -> Tuple[bool, int]:
-    """Export Jira issues to CSV file."""
-    username, password = get_jira_credentials(config_file)
-    if not username or not password:
-        logger.error("Invalid credentials")
-        return False, 0
-
-    try:
-        jira = Jira(
-                    url='https://fecredit.atlassian.net',
-        # url='https://royal-solution.atlassian.net',
-            username=username,
-            password=password
-        )
+    """
+    Export Jira issues to CSV file.
 
-        csv_data = jira.csv(
-            jql,
-            limit=max_results,
-            start=start_at,
-            all_fields=False,
-            delimiter=delimiter
-        )
-        csv_string = csv_data.decode('utf-8')
+    The export is streamed to disk in CSV_STREAM_CHUNK_SIZE chunks through a
+    temporary ``.part`` file, so memory use does not grow with the batch
+    size. Records are counted as they pass, so fields with embedded newlines
+    do not skew the count.
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            csvfile.write(csv_string)
+    Args:
+        jql: JQL query string
+        config_file: Path to the JSON configuration file for credentials
+        fields: Fields to export
+        output_file: Destination file path
+        max_results: Maximum number of issues in this batch
+        start_at: Offset of the first issue in this batch
+        delimiter: CSV delimiter
+        compress: Gzip the output on the fly
 
-        total_exported = len(csv_string.split('\n')) - 2
+    Returns:
+        Tuple of (success flag, number of exported issues)
+    """
+    part_file = f"{output_file}.part"
+    try:
+        jira = jira_client_get(config_file)
+        if jira is None:
+            logger.error("Invalid credentials")
+            return False, 0
+
+        counter = CsvRecordCounter()
+        opener = gzip.open if compress else open
+        with jira_csv_stream_open(jira, jql, max_results, start_at, delimiter) as response, \
+                opener(part_file, 'wb') as csvfile:
+            for chunk in response.iter_content(chunk_size=CSV_STREAM_CHUNK_SIZE):
+                counter.feed(chunk)
+                csvfile.write(chunk)
+        os.replace(part_file, output_file)
+
+        total_exported = max(counter.records - 1, 0)
         logger.info("Exported %d issues to %s", total_exported, output_file)
         return True, total_exported
 
     except Exception as e:
         logger.error("Failed to export issues: %s", str(e))
+        try:
+            os.remove(part_file)
+        except OSError:
+            pass
         return False, 0
 
 
@@ -289,28 +752,140 @@ def load_jql_queries(query_file: str) -> Optional[Dict]:
         return None
 
 
-def count_issues_in_project(jql, config_file, max_results=1000, page_size=100):
+def jql_normalize(jql: str) -> str:
+    """Collapse whitespace so equivalent JQL strings share one cache key."""
+    return " ".join(jql.split())
+
+
+def jql_total_probe(jira: Jira, jql: str) -> int:
+    """
+    Ask Jira for the total number of issues matching a JQL query.
+
+    Requests a single-result page with no fields and reads ``total`` from the
+    response instead of paging through every match.
+    """
+    response = jira.jql(jql, start=0, limit=1, fields="*none")
+    return int(response['total'])
+
+
+def jql_order_by_split(jql: str) -> Tuple[str, str]:
+    """Split a JQL query into its filter and its ORDER BY clause (if any)."""
+    parts = re.split(r'\s+ORDER\s+BY\s+', jql.strip(), maxsplit=1, flags=re.IGNORECASE)
+    if len(parts) == 2:
+        return parts[0], f"ORDER BY {parts[1]}"
+    return parts[0], ""
+
+
+def jql_watermark_format(watermark: str, timezone_name: Optional[str] = None) -> str:
     """
-    Count the total number of issues in a Jira project based on the provided JQL with pagination.
+    Format a watermark as a JQL ``yyyy-MM-dd HH:mm`` literal no later than it.
+
+    The watermark's own UTC offset is applied first. With ``timezone_name``
+    (the Jira account's timezone) the literal is that zone's wall time;
+    without it, the UTC wall time minus JQL_WATERMARK_OVERLAP, which is
+    early enough whatever timezone Jira reads it in.
+    """
+    since = datetime.strptime(watermark[:19], '%Y-%m-%dT%H:%M:%S')
+    offset = re.search(r'([+-])(\d{2}):?(\d{2})$', watermark[19:])
+    if offset:
+        sign = 1 if offset.group(1) == '+' else -1
+        since = since.replace(tzinfo=timezone(sign * timedelta(
+            hours=int(offset.group(2)), minutes=int(offset.group(3)))))
+    else:
+        since = since.replace(tzinfo=timezone.utc)
+    if timezone_name:
+        since = since.astimezone(ZoneInfo(timezone_name))
+    else:
+        since = since.astimezone(timezone.utc) - JQL_WATERMARK_OVERLAP
+    return since.strftime('%Y-%m-%d %H:%M')
+
+
+def jql_updated_since(jql: str, watermark: str, timezone_name: Optional[str] = JIRA_TIMEZONE) -> str:
+    """
+    Restrict a JQL query to issues updated at or after a watermark.
+
+    Args:
+        jql: JQL query string, optionally ending with an ORDER BY clause
+        watermark: Jira ``updated`` timestamp, e.g. 2024-09-01T10:00:00.000+0700
+        timezone_name: Timezone Jira reads JQL dates in; see jql_watermark_format
+
+    Returns:
+        JQL query with an ``updated >=`` clause added to its filter
+    """
+    jql_filter, order_by = jql_order_by_split(jql)
+    since = jql_watermark_format(watermark, timezone_name)
+    return f'({jql_filter}) AND updated >= "{since}" {order_by}'.strip()
+
+
+def jql_latest_updated_get(jql: str, config_file: str) -> Optional[str]:
+    """
+    Get the most recent ``updated`` timestamp among issues matching a JQL query.
+
+    Returns:
+        Jira ``updated`` timestamp string, or None if nothing matches or on error
+    """
+    jira = jira_client_get(config_file)
+    if jira is None:
+        return None
+
+    jql_filter, _ = jql_order_by_split(jql)
+    try:
+        response = jira.jql(
+            f"{jql_filter} ORDER BY updated DESC",
+            start=0,
+            limit=1,
+            fields="updated"
+        )
+        issues = response['issues']
+        return issues[0]['fields']['updated'] if issues else None
+    except Exception as e:
+        logger.error("Failed to get latest updated timestamp: %s", str(e))
+        return None
+
+
+def count_issues_in_project(jql, config_file, max_results=1000, page_size=100, total_only=True,
+                            use_cache=True):
+    """
+    Count the total number of issues in a Jira project based on the provided JQL.
+
+    By default the total is read from a single-result probe and cached for
+    JIRA_COUNT_CACHE_TTL seconds, keyed by the normalized JQL, so repeated or
+    concurrent counts of the same query within that window reuse one request.
+    Pass use_cache=False when the count sizes an export: the cached total can
+    be up to a TTL old, and issues created since would fall past the last
+    batch. The fresh total still refreshes the cache.
+    Pass total_only=False to page through every matching issue instead.
 
     :param jql: JQL query string to filter issues
     :param config_file: Path to the JSON configuration file for credentials
-    :param max_results: Maximum number of results to fetch per request
+    :param max_results: Maximum number of results to fetch per request when paging
     :param page_size: Number of records per page (default 100)
+    :param total_only: Read the total from a probe instead of paging (default True)
+    :param use_cache: Accept a cached total from the last JIRA_COUNT_CACHE_TTL seconds (default True)
     :return: Tuple of (total issues, total records, total pages) or (0, 0, 0) if an error occurs
     """
-    username, password = get_jira_credentials(config_file)
-    if username is None or password is None:
+    jira = jira_client_get(config_file)
+    if jira is None:
         return 0, 0, 0
 
-    jira = Jira(
-        url='https://fecredit.atlassian.net',
-        # url='https://royal-solution.atlassian.net',
-        username=username,
-        password=password
-    )
+    if total_only:
+        cache_key = (JIRA_URL, config_file, jql_normalize(jql))
+        if not use_cache:
+            JQL_COUNT_CACHE.invalidate(cache_key)
+        try:
+            total_records = JQL_COUNT_CACHE.get_or_load(
+                cache_key,
+                lambda: jql_total_probe(jira, jql)
+            )
+        except Exception as e:
+            logger.error("Failed to count issues: %s", str(e))
+            return 0, 0, 0
+        total_pages = (total_records + page_size - 1) // page_size
+        return total_records, total_records, total_pages
 
     total_issues = 0
+    total_records = 0
+    total_pages = 0
     start_at = 0
 
     while True:
@@ -337,66 +912,194 @@ def count_issues_in_project(jql, config_file, max_results=1000, page_size=100):
 
     return total_issues, total_records, total_pages
 
-def download_issue_attachments(issue_key: str, config_file: str, output_dir: str) -> List[str]:
+def issue_attachments_get(jira: Jira, issue_key: str) -> List[Dict]:
+    """Get the attachment metadata of a Jira issue, or [] if it cannot be read."""
+    try:
+        issue = jira.get_issue(issue_key, fields="attachment")
+    except Exception as e:
+        logger.error(f"Failed to get issue {issue_key}: {str(e)}")
+        return []
+    if not issue:
+        logger.error(f"Could not find issue {issue_key}")
+        return []
+    return issue.get('fields', {}).get('attachment') or []
+
+
+def attachment_stream_download(
+    jira: Jira,
+    attachment: Dict,
+    output_path: Path,
+    index: AttachmentIndex,
+    issue_key: str,
+    per_issue_dirs: bool = False
+) -> Optional[str]:
+    """
+    Stream one attachment to disk, skipping it if already downloaded.
+
+    Files go straight into ``output_path``. A file whose name is already
+    taken by another attachment is stored as ``<id>_<filename>`` instead of
+    overwriting it. With ``per_issue_dirs`` new files go to
+    ``output_path/<issue_key>/`` instead. The content is written in
+    ATTACHMENT_CHUNK_SIZE chunks to a ``.part`` file named after the
+    attachment id and renamed into place once complete, so an interrupted
+    download never leaves a truncated file behind.
+
+    Returns:
+        Path of the file on disk, or None if it was skipped as unsafe or failed
+    """
+    filename = attachment['filename']
+    relative_path = index.path_claim(attachment, issue_key if per_issue_dirs else "")
+    file_path = output_path / relative_path
+
+    # Ensure the file path is safe: directly in output_path or in the issue's directory
+    directory = os.path.dirname(relative_path)
+    expected_dir = (output_path / directory).resolve()
+    if directory not in ("", issue_key) or file_path.resolve().parent != expected_dir or \
+            (directory and expected_dir.parent != output_path.resolve()):
+        logger.warning(f"Skipping potentially unsafe path: {relative_path}")
+        return None
+
+    if index.is_complete(attachment, file_path):
+        logger.info(f"Attachment {filename} from issue {issue_key} already downloaded")
+        return str(file_path)
+
+    file_path.parent.mkdir(exist_ok=True)
+    part_file = file_path.parent / f".{attachment['id']}.part"
+    content_url = attachment.get('content') or jira.url_joiner(
+        jira.url, f"secure/attachment/{attachment['id']}/{filename}")
+    try:
+        size = 0
+        with jira.session.get(
+            content_url,
+            stream=True,
+            timeout=jira.timeout,
+            verify=jira.verify_ssl
+        ) as response:
+            response.raise_for_status()
+            with open(part_file, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=ATTACHMENT_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+        os.replace(part_file, file_path)
+        index.record(attachment, issue_key, size, relative_path)
+        logger.info(f"Downloaded attachment {filename} from issue {issue_key}")
+        return str(file_path)
+
+    except Exception as e:
+        logger.error(f"Failed to download attachment {filename} from issue {issue_key}: {str(e)}")
+        try:
+            os.remove(part_file)
+        except OSError:
+            pass
+        return None
+
+
+def download_issue_attachments(
+    issue_key: str,
+    config_file: str,
+    output_dir: str,
+    index: Optional[AttachmentIndex] = None,
+    per_issue_dirs: bool = False
+) -> List[str]:
     """
     Download all attachments from a Jira issue.
+
+    Attachments already recorded in the download index with a matching id and
+    size are not fetched again. Files go to ``downloads/`` under
+    ``output_dir``, or ``downloads/<issue_key>/`` with ``per_issue_dirs``.
     """
     try:
         # Create output directory if it doesn't exist
         output_path = Path(output_dir) / "downloads"  # Ensure we use downloads subdirectory
         output_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"Saving attachments to: {output_path}")
-        
-        # Get credentials
-        username, password = get_jira_credentials(config_file)
-        if not username or not password:
+
+        # Get the pooled Jira client for these credentials
+        jira = jira_client_get(config_file)
+        if jira is None:
             logger.error("Failed to get credentials from config file")
             return []
 
-        # Initialize Jira client and verify connection
-        jira = Jira(
-            # url='https://royal-solution.atlassian.net',
-            url='https://fecredit.atlassian.net',
-            username=username,
-            password=password
-        )
-        
-        # Get issue details
-        issue = jira.get_issue(issue_key)
-        if not issue:
-            logger.error(f"Could not find issue {issue_key}")
-            return []
-            
-        attachments = issue.get('fields', {}).get('attachment', [])
-        
+        attachments = issue_attachments_get(jira, issue_key)
         if not attachments:
             logger.info(f"No attachments found for issue {issue_key}")
             return []
 
+        index = index or AttachmentIndex(output_path)
         downloaded_files = []
-        
+
         # Download each attachment
         for attachment in attachments:
-            filename = attachment['filename']
-            file_path = output_path / filename
-            logger.info("file_path: %s", file_path.resolve())
-            
-            # Ensure the file path is safe
-            if not str(file_path).startswith(str(output_path)):
-                logger.warning(f"Skipping potentially unsafe path: {filename}")
-                continue
-                
-            content = jira.get_attachment_content(attachment['id'])
-            
-            # Save file
-            with open(file_path, 'wb') as f:
-                f.write(content)
-                
-            downloaded_files.append(str(file_path))
-            logger.info(f"Downloaded attachment {filename} from issue {issue_key}")
-            
+            file_path = attachment_stream_download(
+                jira, attachment, output_path, index, issue_key, per_issue_dirs)
+            if file_path:
+                downloaded_files.append(file_path)
+
         return downloaded_files
 
     except Exception as e:
         logger.error(f"Failed to download attachments for issue {issue_key}: {str(e)}")
         return []
+
+
+def download_attachments_bulk(
+    issue_keys: List[str],
+    config_file: str,
+    output_dir: str,
+    concurrency: int = 4,
+    per_issue_dirs: bool = False
+) -> List[str]:
+    """
+    Download the attachments of many Jira issues with a bounded worker pool.
+
+    Issue metadata and attachment downloads both run on at most
+    ``concurrency`` threads. Files already on disk with a matching id and size
+    are skipped, so rerunning after a crash only fetches what is missing.
+    An attachment that fails is logged and skipped; the rest still download.
+
+    Args:
+        issue_keys: Keys of the issues whose attachments should be downloaded
+        config_file: Path to the JSON configuration file for credentials
+        output_dir: Base directory; files go to ``downloads/`` under it
+        concurrency: Maximum number of concurrent requests
+        per_issue_dirs: Store new files in ``downloads/<issue_key>/`` instead
+            of directly in ``downloads/``. Files already downloaded stay
+            where they are.
+
+    Returns:
+        Paths of all attachments present on disk after the run
+    """
+    output_path = Path(output_dir) / "downloads"
+    output_path.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Saving attachments to: {output_path}")
+
+    jira = jira_client_get(config_file)
+    if jira is None:
+        logger.error("Failed to get credentials from config file")
+        return []
+
+    index = AttachmentIndex(output_path)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        issue_attachments = executor.map(
+            lambda issue_key: (issue_key, issue_attachments_get(jira, issue_key)),
+            issue_keys
+        )
+        futures = {
+            executor.submit(
+                attachment_stream_download, jira, attachment, output_path, index,
+                issue_key, per_issue_dirs): (issue_key, attachment)
+            for issue_key, attachments in issue_attachments
+            for attachment in attachments
+        }
+        downloaded_files = []
+        for future, (issue_key, attachment) in futures.items():
+            try:
+                file_path = future.result()
+            except Exception as e:
+                logger.error(f"Failed to download attachment {attachment.get('id')} "
+                             f"from issue {issue_key}: {str(e)}")
+                continue
+            if file_path:
+                downloaded_files.append(file_path)
+
+    return downloaded_files
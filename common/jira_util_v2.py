@@ -1,7 +1,7 @@
 from asyncore import read
 from datetime import datetime
 
-from .json_util import parse_json_v2, read_json_file
+from .json_util import read_json_file, row_extractor_compile
 # from types import NoneType
 # from atlassian import Jira
 import datetime
@@ -10,6 +10,7 @@ import csv
 # from s3_aws_cli_push import download_file_from_s3
 # from common.jira_csv_extract_util_v2 import check_csv_empty
 
+from common.changelog_index import changelog_index_get
 from common.status_cr import it_status_and_operation
 
 
@@ -42,10 +43,9 @@ def age_of_phase_increment(phase, updated_date_str, row):
 
 def json_to_row_data_convert(pasring_path_file, data):
     parsing_path_data = read_json_file(pasring_path_file)
+    row_extract = row_extractor_compile(parsing_path_data)
     for rec in data:
-        row = []
-        for json_path_item in parsing_path_data:
-            row.append(parse_json_v2(parsing_path_data[json_path_item], rec))
+        row = row_extract(rec)
     return row
 
 # Extract date of a specific stage from histories
@@ -74,45 +74,11 @@ def transitions_details_get(histories, current_stage):
 
 
 def date_of_changed_value_of_field_get(histories, field_name, current_stage):
-    created_date = None
-    for i in range(len(histories)):
-        items = parse_json_v2("$.items", histories[i])
-        for item in items:
-            field = parse_json_v2("$.field", item)
-            if field == field_name:
-                status = parse_json_v2("$.toString", item)
-                # print("status:", status)
-                if status in current_stage:
-                    created_date = datetime.datetime.strptime(
-                        parse_json_v2("$.created", histories[i]).rsplit("+", 1)[0], '%Y-%m-%dT%H:%M:%S.%f')
-
-    return created_date
+    return changelog_index_get(histories).last_change_date_get(field_name, current_stage)
 
 
 def dtl_date_of_changed_value_of_field_get(histories, field_name, current_stage):
-    created_date = None
-    transitions = []
-    for i in range(len(histories)):
-        items = parse_json_v2("$.items", histories[i])
-        for item in items:
-            field = parse_json_v2("$.field", item)
-            counter = 0
-            transition = None
-            if field == field_name:
-                to_status = parse_json_v2("$.toString", item)
-                # print("status:", status)
-                if to_status in current_stage:
-                    from_status = parse_json_v2("$.fromString", item)
-                    created_date = datetime.datetime.strptime(
-                        parse_json_v2("$.created", histories[i]).rsplit("+", 1)[0], '%Y-%m-%dT%H:%M:%S.%f')
-                    transition = {
-                        "from_status": from_status,
-                        "to_status": to_status,
-                        "date": created_date.strftime("%Y-%m-%d")
-                    }
-                    transitions.append(transition)
-                    counter = counter+1
-    return transitions
+    return changelog_index_get(histories).transitions_get(field_name, current_stage)
 
 # def cr_age_calculate(source_filename, target_filename):
 #     # if check_csv_empty("../data/output/CRs_of_Systems_short.csv") == True:
@@ -1,7 +1,113 @@
 # from asyncio.windows_events import NULL
 import json
+import os
+import re
+from functools import lru_cache, partial
 from jsonpath_ng import jsonpath, parse
 
+JSONPATH_CACHE_SIZE = int(os.getenv("JSONPATH_CACHE_SIZE", "512"))
+# Returned by compiled accessors when a path matches nothing
+JSONPATH_NOT_FOUND = object()
+SIMPLE_PATH_STEP = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[\*\]")
+JSONPATH_RESERVED_WORDS = ("where", "wherenot")
+
+
+@lru_cache(maxsize=JSONPATH_CACHE_SIZE)
+def jsonpath_compile(path_pattern):
+    """Compiled JSONPath expression for a path string, kept in a bounded LRU cache.
+
+    Call jsonpath_compile.cache_info() for hit/miss statistics.
+    """
+    return parse(path_pattern)
+
+
+def simple_path_steps(path_pattern):
+    """Split a plain ``$.a[*].b`` chain into its steps (None for ``[*]``).
+
+    Returns None when the path uses anything else and needs full JSONPath.
+    """
+    if not isinstance(path_pattern, str) or not path_pattern.startswith("$"):
+        return None
+    steps = []
+    position = 1
+    for match in SIMPLE_PATH_STEP.finditer(path_pattern, 1):
+        if match.start() != position or match.group(1) in JSONPATH_RESERVED_WORDS:
+            return None
+        steps.append(match.group(1))
+        position = match.end()
+    if position != len(path_pattern):
+        return None
+    return tuple(steps)
+
+
+def simple_path_first(steps, value, position=0):
+    """First match of a simple path, with jsonpath_ng's semantics.
+
+    Like jsonpath_ng, ``[*]`` yields nothing for None, treats dicts and
+    scalars as a one-element list, and fields are only read from dicts.
+    """
+    for index in range(position, len(steps)):
+        step = steps[index]
+        if step is None:
+            if value is None:
+                return JSONPATH_NOT_FOUND
+            if isinstance(value, (dict, int, float, str, bool)):
+                continue
+            for element in value:
+                found = simple_path_first(steps, element, index + 1)
+                if found is not JSONPATH_NOT_FOUND:
+                    return found
+            return JSONPATH_NOT_FOUND
+        try:
+            value = value.get(step, JSONPATH_NOT_FOUND)
+        except (TypeError, AttributeError):
+            return JSONPATH_NOT_FOUND
+        if value is JSONPATH_NOT_FOUND:
+            return JSONPATH_NOT_FOUND
+    return value
+
+
+def jsonpath_first(expr, json_data):
+    value = expr.find(json_data)
+    return value[0].value if len(value) > 0 else JSONPATH_NOT_FOUND
+
+
+@lru_cache(maxsize=JSONPATH_CACHE_SIZE)
+def jsonpath_first_compile(path_pattern):
+    """Compile a path into a function returning its first match.
+
+    Plain chains of fields and ``[*]`` become direct dict/list accessors;
+    anything else goes through the compiled JSONPath expression. The
+    function returns JSONPATH_NOT_FOUND when nothing matches.
+    """
+    steps = simple_path_steps(path_pattern)
+    if steps is None:
+        return partial(jsonpath_first, jsonpath_compile(path_pattern))
+    return partial(simple_path_first, steps)
+
+
+def row_extractor_compile(parsing_path_data):
+    """Compile a parsing-paths mapping into a function turning a record into a row.
+
+    Each value is the first match of its path, or 0 when nothing matches,
+    exactly as parse_json_v2 returns it.
+    """
+    extractors = []
+    for json_path_item in parsing_path_data:
+        path_pattern = parsing_path_data[json_path_item]
+        if isinstance(path_pattern, str):
+            extractors.append(jsonpath_first_compile(path_pattern))
+        else:
+            extractors.append(partial(parse_json_v2, path_pattern))
+
+    def row_extract(rec):
+        row = []
+        for extract in extractors:
+            value = extract(rec)
+            row.append(0 if value is JSONPATH_NOT_FOUND else value)
+        return row
+    return row_extract
+
 
 def parse_json(path_pattern, json_data):
     data = change_type_parse(path_pattern, json_data)
@@ -10,7 +116,7 @@ def parse_json(path_pattern, json_data):
 
 def change_type_parse(path_pattern, json_data):
     gotdata = "Not Available"
-    status_jsonpath_expr = parse(path_pattern)
+    status_jsonpath_expr = jsonpath_compile(path_pattern)
     value = status_jsonpath_expr.find(json_data)
     change_type_field_array = [
         "$.fields[*].customfield_13805[*].value",
@@ -29,12 +135,10 @@ def change_type_parse(path_pattern, json_data):
 
 def json_to_row_data_convert(pasring_path_file, data):
     parsing_path_data = read_json_file(pasring_path_file)
+    row_extract = row_extractor_compile(parsing_path_data)
     rows = []
     for rec in data:
-        row = []
-        for json_path_item in parsing_path_data:
-            row.append(parse_json_v2(parsing_path_data[json_path_item], rec))
-        rows.append(row)
+        rows.append(row_extract(rec))
     return rows
 
 
@@ -46,7 +150,7 @@ def not_avail_change_type_assign(path_pattern, gotdata, change_type_field_array)
 
 def parse_json_v2(path_pattern, json_data):
     gotdata = 0
-    status_jsonpath_expr = parse(path_pattern)
+    status_jsonpath_expr = jsonpath_compile(path_pattern)
     value = status_jsonpath_expr.find(json_data)
     try:
         gotdata = value[0].value
@@ -57,7 +161,7 @@ def parse_json_v2(path_pattern, json_data):
 
 def parse_json_v3(path_pattern, json_data):
     gotdata = 0
-    status_jsonpath_expr = parse(path_pattern)
+    status_jsonpath_expr = jsonpath_compile(path_pattern)
     value = status_jsonpath_expr.find(json_data)
     try:
         gotdata = value[0].value
@@ -85,9 +189,8 @@ def biz_benefits_check(p_input_paragraph):
 
 def read_json_file(file_path):
     # print(file_path)
-    f = open(file_path)
-    # print(f)
-    data = json.load(f)
+    with open(file_path) as f:
+        data = json.load(f)
     return data
 
 
@@ -1,11 +1,12 @@
-from common.json_util import parse_json_v2, read_json_file
+from common.config_registry import config_json_get
+from common.json_util import parse_json_v2
 
 
 CONFIG_FILE_PATH = 'config/message_templates.json'
 
 
 def message_template_file_config_load():
-    data = read_json_file(CONFIG_FILE_PATH)
+    data = config_json_get(CONFIG_FILE_PATH)
     # print("data", data)
     return parse_json_v2("$.message_list", data)
 
@@ -0,0 +1,176 @@
+import logging
+import random
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 503)
+
+
+def retry_after_parse(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds.
+
+    Accepts both the delay-seconds and the HTTP-date forms; returns None when
+    the header is missing or unreadable.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by every request to one server, with an adaptive rate.
+
+    Each throttling episode multiplies the rate by ``decrease_factor`` and
+    pauses all callers until the server's Retry-After (plus jitter) has
+    passed; each success adds roughly ``increase_step`` requests/sec per
+    second of traffic. The rate therefore saw-tooths below the server's
+    limit: throughput averages somewhat less than the limit, by an amount
+    that depends on how fast ``increase_step`` climbs back and how long each
+    pause lasts, in exchange for 429s only at the peaks.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 100.0,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        max_jitter: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.max_jitter = max_jitter
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled_count = 0
+        self.wait_time = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until the caller may send one request."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests += 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+                self.wait_time += wait
+            self._sleep(wait)
+
+    def succeeded(self) -> None:
+        """Additively raise the rate after a request that was not throttled."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+
+    def throttled(self, retry_after: Optional[float], attempt: int = 0) -> float:
+        """
+        Record a throttled response and pause every caller.
+
+        Args:
+            retry_after: Delay requested by the server, if any
+            attempt: Zero-based retry attempt, used for backoff without Retry-After
+
+        Returns:
+            Seconds all callers will wait before the next request
+        """
+        delay = retry_after if retry_after is not None else min(2 ** attempt, 60)
+        delay += random.uniform(0, self.max_jitter)
+        with self._lock:
+            self.throttled_count += 1
+            # Requests already in flight when the pause began are throttled
+            # together; count them as one signal instead of compounding.
+            if self._clock() >= self._blocked_until:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = 0
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+        logger.warning("Jira throttled the request; pausing %.1fs, rate now %.1f req/s",
+                       delay, self.rate)
+        return delay
+
+    def stats(self) -> Dict[str, float]:
+        """Report the current rate and request/throttle/wait counters."""
+        with self._lock:
+            return {
+                "rate": round(self.rate, 2),
+                "requests": self.requests,
+                "throttled": self.throttled_count,
+                "wait_time": round(self.wait_time, 2),
+            }
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that sends every request through an AdaptiveRateLimiter and
+    retries throttled responses (429/503) after the advertised Retry-After.
+
+    When ``in_flight`` is given, it is held while a request is being sent
+    (until the response headers arrive), so a semaphore shared by several
+    adapters caps the number of concurrent requests across all of them.
+    """
+
+    def __init__(self, rate_limiter: Optional[AdaptiveRateLimiter], max_throttle_retries: int = 5,
+                 in_flight: Optional[threading.BoundedSemaphore] = None, **kwargs):
+        self.rate_limiter = rate_limiter
+        self.max_throttle_retries = max_throttle_retries
+        self.in_flight = in_flight
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            with self.in_flight or nullcontext():
+                response = super().send(request, **kwargs)
+            if self.rate_limiter is None:
+                return response
+            if response.status_code not in RETRY_STATUS_CODES:
+                self.rate_limiter.succeeded()
+                return response
+            self.rate_limiter.throttled(
+                retry_after_parse(response.headers.get("Retry-After")), attempt)
+            if attempt >= self.max_throttle_retries:
+                logger.error("Giving up on %s after %d throttled attempts",
+                             request.url, attempt + 1)
+                return response
+            response.close()
+            attempt += 1
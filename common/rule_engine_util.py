@@ -1,5 +1,6 @@
 import configparser
 import json
+import time
 import rule_engine
 from common.json_util import read_json_file
 from common.json_util import parse_json_v2
@@ -8,6 +9,7 @@ from domain.conditions.condition_obj import Condition
 from domain.rules.rule_obj import ExtRule
 from common.conditions_enum import equation_operators, logical_operators
 from common.util import cfg_read
+from common.rule_profiler import RULE_PROFILER
 
 
 def rules_set_cfg_read():
@@ -206,8 +208,12 @@ def rule_run(rule, data):
     tmp_action = ""
     tmp_weight = 0
     tmp_point = 0
+    error = None
+    profiling = RULE_PROFILER.enabled
+    if profiling:
+        started = time.perf_counter()
     try:
-        print("rule[\"condition\"]", rule["condition"])
+        # print("rule[\"condition\"]", rule["condition"])
         l_rule = rule_engine.Rule(rule["condition"])
         rs = l_rule.matches(data)
         # print(rs)
@@ -218,8 +224,13 @@ def rule_run(rule, data):
             tmp_weight = float(rule['weight'])
         else:
             tmp_action = '-'
-    except:
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
         tmp_action = '-'
+    if profiling:
+        # Keyed by rule id, as CompiledRuleset records it
+        RULE_PROFILER.rule_record(rule.get("id"), time.perf_counter() - started,
+                                  tmp_action != '-', error)
     return {
         "action_result": tmp_action,
         "rule_point": tmp_point,
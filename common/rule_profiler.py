@@ -0,0 +1,146 @@
+import atexit
+import json
+import logging
+import os
+import random
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+RULE_PROFILING = os.getenv("RULE_PROFILING", "false").lower() == "true"
+RULE_PROFILE_FILE = os.getenv("RULE_PROFILE_FILE")
+PROFILE_SAMPLE_SIZE = 2048
+
+
+class EvaluationStats:
+    """
+    Counters and timings of one rule or condition.
+
+    Durations are kept in a fixed-size reservoir sample, so the p95 covers
+    the whole run in bounded memory.
+    """
+
+    __slots__ = ("evaluations", "matches", "errors", "first_error", "total_seconds",
+                 "samples", "_seen", "_rng")
+
+    def __init__(self):
+        self.evaluations = 0
+        self.matches = 0
+        self.errors = 0
+        self.first_error: Optional[str] = None
+        self.total_seconds = 0.0
+        self.samples = []
+        self._seen = 0
+        self._rng = random.Random(0)
+
+    def add(self, seconds: float, matched: bool, error: Optional[str]) -> None:
+        self.evaluations += 1
+        self.total_seconds += seconds
+        if matched:
+            self.matches += 1
+        if error is not None:
+            self.errors += 1
+            if self.first_error is None:
+                self.first_error = error
+        self._seen += 1
+        if len(self.samples) < PROFILE_SAMPLE_SIZE:
+            self.samples.append(seconds)
+        else:
+            slot = self._rng.randrange(self._seen)
+            if slot < PROFILE_SAMPLE_SIZE:
+                self.samples[slot] = seconds
+
+    def add_many(self, evaluations: int, matches: int, seconds: float) -> None:
+        # Batch evaluation: counts and cumulative time only, no per-row samples
+        self.evaluations += evaluations
+        self.matches += matches
+        self.total_seconds += seconds
+
+    def report(self) -> Dict[str, Any]:
+        samples = sorted(self.samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else None
+        return {
+            "evaluations": self.evaluations,
+            "matches": self.matches,
+            "errors": self.errors,
+            "first_error": self.first_error,
+            "total_ms": self.total_seconds * 1000,
+            "mean_us": self.total_seconds * 1e6 / self.evaluations if self.evaluations else None,
+            "p95_us": p95 * 1e6 if p95 is not None else None,
+        }
+
+
+class RuleProfiler:
+    """
+    Per-rule and per-condition evaluation statistics of the rule engine.
+
+    Disabled by default; evaluation code checks ``enabled`` once per row
+    and takes an uninstrumented path when it is off. Rules are keyed by
+    rule id, conditions by their text; a rule's time includes the
+    conditions it evaluated first (outcomes reused from earlier rules are
+    not re-timed).
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._rules: Dict[str, EvaluationStats] = {}
+        self._conditions: Dict[str, EvaluationStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats_get(self, table: Dict[str, EvaluationStats], key: str) -> EvaluationStats:
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = EvaluationStats()
+        return stats
+
+    def rule_record(self, rule_id: str, seconds: float, matched: bool,
+                    error: Optional[str] = None) -> None:
+        with self._lock:
+            self._stats_get(self._rules, rule_id).add(seconds, matched, error)
+
+    def rule_batch_record(self, rule_id: str, evaluations: int, matches: int, seconds: float) -> None:
+        with self._lock:
+            self._stats_get(self._rules, rule_id).add_many(evaluations, matches, seconds)
+
+    def condition_record(self, condition: str, seconds: float, matched: bool,
+                         error: Optional[str] = None) -> None:
+        with self._lock:
+            self._stats_get(self._conditions, condition).add(seconds, matched, error)
+
+    def first_error_needed(self, kind: str, key: str) -> bool:
+        """Whether a "rule" or "condition" has no error message yet (worth computing one)."""
+        stats = (self._rules if kind == "rule" else self._conditions).get(key)
+        return stats is None or stats.first_error is None
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "rules": {key: stats.report() for key, stats in self._rules.items()},
+                "conditions": {key: stats.report() for key, stats in self._conditions.items()},
+            }
+
+    def dump(self, file_path: Union[str, Path]) -> Path:
+        """Write report() as JSON, atomically."""
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+        with open(part, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, indent=2)
+        os.replace(part, path)
+        logger.info("Rule profile written to %s", path)
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rules.clear()
+            self._conditions.clear()
+
+
+RULE_PROFILER = RuleProfiler(enabled=RULE_PROFILING)
+
+if RULE_PROFILING and RULE_PROFILE_FILE:
+    # Dump after the run of whichever entry point evaluated rules
+    atexit.register(RULE_PROFILER.dump, RULE_PROFILE_FILE)
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from common.compiled_ruleset import CompiledRuleset, ruleset_compile, ruleset_get
+from common.config_registry import json_config_parse
+from common.json_util import parse_json_v2
+from common.s3_aws_util import config_file_read
+from common.util import cfg_read
+
+logger = logging.getLogger(__name__)
+
+RULESET_SOURCE = os.getenv("RULESET_SOURCE", "file")
+RULESET_S3_RULES_FILE = os.getenv("RULESET_S3_RULES_FILE", "rules_config/rules_config_v1.json")
+RULESET_S3_CONDITIONS_FILE = os.getenv(
+    "RULESET_S3_CONDITIONS_FILE", "rules_config/conditions_config_v1.json")
+RULESET_POLL_SECONDS = float(os.getenv("RULESET_POLL_SECONDS", "30"))
+
+# (rules_set, conditions_set, patterns) config nodes. Sources provide a
+# fingerprint() of their current content and load() the content it describes.
+RulesetConfig = Tuple[Any, Any, Any]
+
+
+class FileRulesetSource:
+    """Rules and conditions files named in config.ini, checked by mtime and size."""
+
+    def __init__(self):
+        self.description = "file"
+        self._files: Tuple[str, str] = ("", "")
+
+    def fingerprint(self) -> Any:
+        self._files = (cfg_read("RULE", "file_name"), cfg_read("CONDITIONS", "file_name"))
+        self.description = "file:" + ",".join(self._files)
+        stats = [os.stat(path) for path in self._files]
+        return tuple((path, stat.st_mtime_ns, stat.st_size) for path, stat in zip(self._files, stats))
+
+    def load(self) -> RulesetConfig:
+        rules_cfg = json_config_parse(self._files[0])
+        conditions_cfg = json_config_parse(self._files[1])
+        return (
+            parse_json_v2("$.rules_set", rules_cfg),
+            parse_json_v2("$.conditions_set", conditions_cfg),
+            parse_json_v2("$.patterns", rules_cfg))
+
+
+class S3RulesetSource:
+    """Rules and conditions files in the rule-config S3 bucket, checked by content hash."""
+
+    def __init__(self, rules_file: str = RULESET_S3_RULES_FILE,
+                 conditions_file: str = RULESET_S3_CONDITIONS_FILE):
+        self.rules_file = rules_file
+        self.conditions_file = conditions_file
+        self.description = f"s3:{rules_file},{conditions_file}"
+        self._contents: Tuple[str, str] = ("", "")
+
+    def fingerprint(self) -> Any:
+        self._contents = (config_file_read("S3", self.rules_file),
+                          config_file_read("S3", self.conditions_file))
+        return hashlib.sha256("\0".join(self._contents).encode("utf-8")).hexdigest()
+
+    def load(self) -> RulesetConfig:
+        rules_cfg = json.loads(self._contents[0])
+        return (
+            parse_json_v2("$.rules_set", rules_cfg),
+            parse_json_v2("$.conditions_set", json.loads(self._contents[1])),
+            parse_json_v2("$.patterns", rules_cfg))
+
+
+def ruleset_validate(ruleset: CompiledRuleset) -> None:
+    """Raise ValueError if a compiled ruleset should not replace a working one."""
+    if not ruleset.rules:
+        raise ValueError("Ruleset has no rules")
+    broken = [rule.rule_id for rule in ruleset.rules if rule.matcher is None]
+    if broken:
+        raise ValueError(f"Rules do not compile: {', '.join(map(str, broken))}")
+    if not isinstance(ruleset.patterns, dict) or not ruleset.patterns:
+        raise ValueError("Ruleset has no action patterns")
+    # Missing attributes must not escape evaluation; not counted as traffic
+    ruleset.evaluate({}, record=False)
+
+
+class RulesetManager:
+    """
+    Keeps the active CompiledRuleset of a long-running process current.
+
+    A background thread polls the source every ``poll_seconds``; when the
+    rules or conditions changed it compiles and validates a new ruleset and
+    swaps it in with a single reference assignment. Evaluations that already
+    hold the previous ruleset finish on it, and requests never wait for a
+    compile. A ruleset that fails to load or validate is logged and the
+    active one is kept.
+    """
+
+    def __init__(self, source=None, poll_seconds: float = RULESET_POLL_SECONDS):
+        self.source = source if source is not None else FileRulesetSource()
+        self.poll_seconds = poll_seconds
+        self._active: Optional[CompiledRuleset] = None
+        self._fingerprint: Any = None
+        self._failed_fingerprint: Any = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.activated_at: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def active(self) -> CompiledRuleset:
+        """The ruleset to evaluate with; loaded synchronously only before the first refresh."""
+        ruleset = self._active
+        if ruleset is None:
+            self.refresh()
+            ruleset = self._active
+            if ruleset is None:
+                raise RuntimeError(f"No ruleset could be loaded: {self.last_error}")
+        return ruleset
+
+    def refresh(self) -> bool:
+        """Compile and swap in the source's ruleset if it changed. True if swapped."""
+        with self._refresh_lock:
+            self.checked_at = time.time()
+            fingerprint = None
+            try:
+                fingerprint = self.source.fingerprint()
+                if fingerprint == self._fingerprint or fingerprint == self._failed_fingerprint:
+                    return False
+                ruleset = ruleset_compile(*self.source.load())
+                try:
+                    ruleset_validate(ruleset)
+                except ValueError:
+                    if self._active is not None:
+                        raise
+                    logger.warning("Activating ruleset v%s that failed validation, "
+                                   "no previous ruleset to keep", ruleset.version, exc_info=True)
+            except Exception as e:
+                # Not retried until the source changes again
+                self._failed_fingerprint = fingerprint
+                self.failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.error("Ruleset reload from %s failed, keeping v%s: %s", self.source.description,
+                             self._active.version if self._active else None, self.last_error)
+                return False
+            self._fingerprint = fingerprint
+            self._active = ruleset
+            self.activated_at = time.time()
+            self.reloads += 1
+            self.last_error = None
+        logger.info("Activated ruleset v%s from %s", ruleset.version, self.source.description)
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            self.refresh()
+
+    def start(self) -> None:
+        """Load the ruleset now and keep polling for changes in the background."""
+        if self.running:
+            return
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ruleset-manager", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def status(self) -> Dict[str, Any]:
+        """Active version and when/how long it took to compile, plus reload history."""
+        ruleset = self._active
+        return {
+            "source": self.source.description,
+            "running": self.running,
+            "version": ruleset.version if ruleset else None,
+            "compile_seconds": ruleset.compile_seconds if ruleset else None,
+            "rules": len(ruleset.rules) if ruleset else 0,
+            "activated_at": self.activated_at,
+            "checked_at": self.checked_at,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+RULESET_MANAGER = RulesetManager(
+    S3RulesetSource() if RULESET_SOURCE.lower() == "s3" else FileRulesetSource())
+
+
+def ruleset_active_get() -> CompiledRuleset:
+    """Ruleset of the running RulesetManager, or of the config files otherwise."""
+    if RULESET_MANAGER.running:
+        return RULESET_MANAGER.active()
+    return ruleset_get()
@@ -1,4 +1,23 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
 import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+logger = logging.getLogger(__name__)
+
+S3_CONFIG_BUCKET = "rule-config-file"
+S3_CONFIG_CACHE_DIR = os.getenv("S3_CONFIG_CACHE_DIR", "data/s3_config_cache")
+S3_CONFIG_REVALIDATE_SECONDS = float(os.getenv("S3_CONFIG_REVALIDATE_SECONDS", "60"))
+
+# S3 answers that mean the object itself is gone, not that S3 is unreachable
+MISSING_OBJECT_CODES = {"NoSuchKey", "NoSuchBucket", "404"}
 
 
 def aws_s3_config_file_read(bucket, config_file):
@@ -9,8 +28,170 @@ def aws_s3_config_file_read(bucket, config_file):
     return obj['Body'].read().decode()
 
 
+class S3ConfigCache:
+    """
+    Local copies of S3 config files, revalidated with conditional GETs.
+
+    Each object is kept on disk (content plus ETag/Last-Modified metadata)
+    and in memory, keyed by bucket and key. A copy confirmed less than
+    ``revalidate_after`` seconds ago is served without contacting S3; an
+    older one is revalidated with If-None-Match (or If-Modified-Since when
+    S3 gave no ETag), so unchanged files are not downloaded again. When S3
+    cannot be reached the cached copy is served, a warning logged and S3
+    left alone for another interval; a deleted object raises. The disk copy
+    survives restarts.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = S3_CONFIG_CACHE_DIR,
+                 revalidate_after: float = S3_CONFIG_REVALIDATE_SECONDS,
+                 client_factory: Optional[Callable[[], Any]] = None):
+        self.cache_dir = Path(cache_dir)
+        self.revalidate_after = revalidate_after
+        self._client_factory = client_factory or (lambda: boto3.client('s3'))
+        self._client = None
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.not_modified = 0
+        self.downloads = 0
+        self.fallbacks = 0
+
+    def _client_get(self):
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def _paths_get(self, bucket: str, key: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(f"{bucket}/{key}".encode("utf-8")).hexdigest()[:16]
+        name = f"{digest}_{os.path.basename(key) or 'object'}"
+        return self.cache_dir / name, self.cache_dir / (name + ".meta.json")
+
+    def _disk_load(self, bucket: str, key: str) -> Optional[Dict[str, Any]]:
+        content_path, meta_path = self._paths_get(bucket, key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+            with open(content_path, 'r', encoding='utf-8') as file:
+                entry["content"] = file.read()
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def _disk_save(self, bucket: str, key: str, entry: Dict[str, Any]) -> None:
+        content_path, meta_path = self._paths_get(bucket, key)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta = {name: value for name, value in entry.items() if name != "content"}
+        for path, text in ((content_path, entry["content"]), (meta_path, json.dumps(meta))):
+            part = path.with_name(path.name + ".part")
+            with open(part, 'w', encoding='utf-8') as file:
+                file.write(text)
+            os.replace(part, path)
+
+    def read(self, bucket: str, key: str) -> str:
+        """Content of s3://bucket/key, from the local copy while it is current."""
+        cache_key = (bucket, key)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(cache_key)
+            if entry is None:
+                entry = self._disk_load(bucket, key)
+                if entry is not None:
+                    with self._lock:
+                        self._entries[cache_key] = entry
+            if entry is not None and \
+                    time.time() - entry.get("checked_at", entry["validated_at"]) < self.revalidate_after:
+                # Reads of different objects run concurrently
+                with self._lock:
+                    self.hits += 1
+                return entry["content"]
+            return self._fetch(bucket, key, entry)
+
+    def _fetch(self, bucket: str, key: str, entry: Optional[Dict[str, Any]]) -> str:
+        request = {"Bucket": bucket, "Key": key}
+        if entry is not None:
+            if entry.get("etag"):
+                request["IfNoneMatch"] = entry["etag"]
+            elif entry.get("last_modified"):
+                request["IfModifiedSince"] = entry["last_modified"]
+        try:
+            response = self._client_get().get_object(**request)
+            content = response['Body'].read().decode()
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if entry is not None and (status == 304 or error.get("Code") in ("304", "NotModified")):
+                with self._lock:
+                    self.not_modified += 1
+                entry["validated_at"] = entry["checked_at"] = time.time()
+                self._disk_save_safe(bucket, key, entry)
+                return entry["content"]
+            if entry is None or error.get("Code") in MISSING_OBJECT_CODES:
+                raise
+            return self._fallback(bucket, key, entry, e)
+        except BotoCoreError as e:
+            if entry is None:
+                raise
+            return self._fallback(bucket, key, entry, e)
+        last_modified = response.get("LastModified")
+        now = time.time()
+        entry = {
+            "etag": response.get("ETag"),
+            "last_modified": last_modified.isoformat()
+            if hasattr(last_modified, "isoformat") else last_modified,
+            "validated_at": now,
+            "checked_at": now,
+            "content": content,
+        }
+        with self._lock:
+            self.downloads += 1
+            self._entries[(bucket, key)] = entry
+        self._disk_save_safe(bucket, key, entry)
+        return content
+
+    def _disk_save_safe(self, bucket: str, key: str, entry: Dict[str, Any]) -> None:
+        # The disk copy is optional; S3 already answered, so keep serving
+        try:
+            self._disk_save(bucket, key, entry)
+        except OSError as e:
+            logger.warning("Could not write cache copy of s3://%s/%s to %s: %s",
+                           bucket, key, self.cache_dir, e)
+
+    def _fallback(self, bucket: str, key: str, entry: Dict[str, Any], error: Exception) -> str:
+        # Try S3 again only after another revalidation interval
+        entry["checked_at"] = time.time()
+        with self._lock:
+            self.fallbacks += 1
+        logger.warning("S3 unreachable for s3://%s/%s, serving cached copy validated at %s: %s",
+                       bucket, key, time.strftime("%Y-%m-%d %H:%M:%S",
+                                                  time.localtime(entry["validated_at"])), error)
+        return entry["content"]
+
+    def invalidate(self, bucket: Optional[str] = None, key: Optional[str] = None) -> None:
+        """Force revalidation of one object, or of every cached object."""
+        with self._lock:
+            for cache_key, entry in self._entries.items():
+                if bucket is None or cache_key == (bucket, key):
+                    entry["checked_at"] = 0.0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "not_modified": self.not_modified,
+                "downloads": self.downloads,
+                "fallbacks": self.fallbacks,
+                "entries": len(self._entries),
+            }
+
+
+S3_CONFIG_CACHE = S3ConfigCache()
+
+
 def config_file_read(location, config_file):
     if location == "S3":
-        bucket = "rule-config-file"
-        obj = aws_s3_config_file_read(bucket, config_file)
+        bucket = S3_CONFIG_BUCKET
+        obj = S3_CONFIG_CACHE.read(bucket, config_file)
         return obj
@@ -1,4 +1,3 @@
-import configparser
 from datetime import datetime
 import ssl
 from slack_sdk import WebClient
@@ -7,13 +6,13 @@ from datetime import timezone
 import pytz
 from pytz import timezone, utc
 
+from common.config_registry import config_ini_get
+
 SLACK_CFG_INI_PATH = 'cfg/cfg.ini'
 
 
 def slack_cfg_load(slack_ini_file_path):
-    config = configparser.ConfigParser()
-    config.read(slack_ini_file_path)
-    return config['SLACK']
+    return config_ini_get(slack_ini_file_path)['SLACK']
 
 
 def slack_token_get():
@@ -0,0 +1,111 @@
+import logging
+import operator
+import threading
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from common.config_registry import CR_STATUSES_FILE, config_json_get
+
+logger = logging.getLogger(__name__)
+
+BIZ_STATUSES_FILE = "config-pattern/jira_biz_statuses_obj.json"
+IT_STATUS_OPERATIONS_FILE = "config-pattern/it_status_operations_obj.json"
+STATUS_NOT_MAPPED = "nothing"
+OPERATION_NOT_MAPPED = "Invalid IT status"
+
+
+class StatusIndex:
+    """
+    Status mappings indexed for constant-time lookups in both directions.
+
+    Built from three config mappings: Jira status to IT stage, Jira status
+    to business status (Open/Closed) and IT status to phase operation.
+    Reverse lookups return the Jira statuses of a stage in config order, or
+    as a precomputed frozenset for changelog filtering. New statuses are
+    added by editing the config files.
+    """
+
+    def __init__(
+        self,
+        it_stages: Mapping[str, str],
+        biz_statuses: Mapping[str, str],
+        operations: Mapping[str, str]
+    ):
+        self._it_stages = dict(it_stages)
+        self._biz_statuses = dict(biz_statuses)
+        self._operations = dict(operations)
+        self._stage_statuses: Dict[str, Tuple[str, ...]] = {}
+        for jira_status, it_stage in self._it_stages.items():
+            self._stage_statuses[it_stage] = self._stage_statuses.get(it_stage, ()) + (jira_status,)
+        self._stage_status_sets = {
+            it_stage: frozenset(statuses) for it_stage, statuses in self._stage_statuses.items()}
+        self._biz_jira_statuses: Dict[str, Tuple[str, ...]] = {}
+        for jira_status, biz_status in self._biz_statuses.items():
+            self._biz_jira_statuses[biz_status] = \
+                self._biz_jira_statuses.get(biz_status, ()) + (jira_status,)
+        self._operation_it_statuses = {
+            operation: it_status for it_status, operation in self._operations.items()}
+
+    def it_stage_get(self, jira_status: str) -> str:
+        """IT stage of a Jira status, e.g. "In Review" -> "1. In Review"."""
+        return self._it_stages.get(jira_status, STATUS_NOT_MAPPED)
+
+    def biz_status_get(self, jira_status: str) -> str:
+        """Business status (Open/Closed) of a Jira status."""
+        return self._biz_statuses.get(jira_status, STATUS_NOT_MAPPED)
+
+    def phase_operation_get(self, it_status: str) -> str:
+        """Phase operation of an IT status, e.g. "4. UAT" -> "uat"."""
+        return self._operations.get(it_status, OPERATION_NOT_MAPPED)
+
+    def jira_statuses_get(self, it_stage: str) -> List[str]:
+        """Jira statuses mapped to an IT stage, in config order."""
+        return list(self._stage_statuses.get(it_stage, ()))
+
+    def jira_status_set_get(self, it_stage: str) -> FrozenSet[str]:
+        """Jira statuses mapped to an IT stage, for membership tests."""
+        return self._stage_status_sets.get(it_stage, frozenset())
+
+    def biz_jira_statuses_get(self, biz_status: str) -> List[str]:
+        """Jira statuses mapped to a business status, in config order."""
+        return list(self._biz_jira_statuses.get(biz_status, ()))
+
+    def it_status_get(self, operation: str) -> Optional[str]:
+        """IT status of a phase operation, e.g. "uat" -> "4. UAT"."""
+        return self._operation_it_statuses.get(operation)
+
+
+# (config snapshots it was built from, index)
+_STATUS_INDEX: Optional[Tuple[Tuple[Any, ...], StatusIndex]] = None
+_STATUS_INDEX_LOCK = threading.Lock()
+
+
+def status_index_get() -> StatusIndex:
+    """
+    Shared StatusIndex of the current status config files.
+
+    Every call asks the registry for the three files, which only stats them
+    while they are unchanged and hands back the same snapshots; the index is
+    rebuilt when any snapshot differs from the ones it was built from.
+    """
+    global _STATUS_INDEX
+    sources = (
+        config_json_get(CR_STATUSES_FILE),
+        config_json_get(BIZ_STATUSES_FILE),
+        config_json_get(IT_STATUS_OPERATIONS_FILE)
+    )
+    entry = _STATUS_INDEX
+    if entry is not None and all(map(operator.is_, entry[0], sources)):
+        return entry[1]
+    with _STATUS_INDEX_LOCK:
+        entry = _STATUS_INDEX
+        if entry is None or not all(map(operator.is_, entry[0], sources)):
+            entry = _STATUS_INDEX = (sources, StatusIndex(*sources))
+        return entry[1]
+
+
+def status_index_reload(file_path: Optional[str] = None) -> None:
+    """Drop the shared StatusIndex so the next lookup rebuilds it from config."""
+    global _STATUS_INDEX
+    with _STATUS_INDEX_LOCK:
+        _STATUS_INDEX = None
+    logger.debug("Status index invalidated by %s", file_path or "explicit reload")
@@ -0,0 +1,51 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_WATERMARK_LOCK = threading.Lock()
+
+
+def watermarks_load(watermark_file: Path) -> Dict:
+    """Load every stored sync watermark, or an empty mapping if none exist."""
+    try:
+        with open(watermark_file, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error("Failed to read watermarks from %s: %s", watermark_file, str(e))
+        return {}
+
+
+def watermark_get(watermark_file: Path, query_type: str) -> Optional[str]:
+    """
+    Get the last ``updated`` timestamp synced for a query type.
+
+    Returns:
+        Jira ``updated`` timestamp string, or None if the query was never synced
+    """
+    return watermarks_load(watermark_file).get(query_type, {}).get("updated")
+
+
+def watermark_set(watermark_file: Path, query_type: str, updated: str) -> None:
+    """
+    Persist the ``updated`` watermark for a query type atomically.
+
+    Safe to call from query types processed concurrently.
+    """
+    with _WATERMARK_LOCK:
+        watermarks = watermarks_load(watermark_file)
+        watermarks[query_type] = {
+            "updated": updated,
+            "synced_at": datetime.now().isoformat(timespec='seconds')
+        }
+        part_file = f"{watermark_file}.part"
+        with open(part_file, 'w', encoding='utf-8') as file:
+            json.dump(watermarks, file, indent=2)
+        os.replace(part_file, watermark_file)
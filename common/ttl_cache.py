@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache whose entries expire after ``ttl`` seconds.
+
+    Concurrent callers asking for the same missing key share a single load:
+    the first caller runs the loader while the others wait for its result.
+    A loader that raises leaves nothing cached.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh_get(self, key: Hashable) -> Optional[tuple]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, loading it with ``loader`` when
+        it is missing or expired.
+        """
+        with self._lock:
+            entry = self._fresh_get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._fresh_get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry[1]
+
+            try:
+                value = loader()
+            except BaseException:
+                # Nothing gets stored, so nothing would evict the key's lock
+                with self._lock:
+                    if key not in self._entries and self._key_locks.get(key) is key_lock:
+                        del self._key_locks[key]
+                raise
+
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted_key, _ = self._entries.popitem(last=False)
+                    self._key_locks.pop(evicted_key, None)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or every entry when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._key_locks.clear()
+            else:
+                self._entries.pop(key, None)
+                self._key_locks.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Report hit/miss counters and the number of live entries."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
@@ -1,7 +1,8 @@
-import configparser
 from business_calendar import Calendar, MO, TU, WE, TH, FR
 import datetime
 
+from common.config_registry import CONFIG_INI_FILE, config_ini_get
+
 BIZ_CAL = Calendar(workdays=[MO, TU, WE, TH, FR])
 
 
@@ -37,10 +38,8 @@ def biz_days_check(input_date):
 
 
 def cfg_read(section, parameter):
-    config = configparser.ConfigParser()
-    config.read('config/config.ini')
-    config.sections()
-    return config[f'{section}'][f'{parameter}']
+    config = config_ini_get(CONFIG_INI_FILE)
+    return config[f'{section}'][f'{parameter}'.lower()]
 
 
 if __name__ == "__main__":
@@ -28,6 +28,9 @@ class Config:
         'jira_closed_tickets': TABLE_NAME,
         'jira_in_progress_tickets': TABLE_NAME
     }
+    # Batches of a full export, or of the n-th incremental delta set
+    EXPORT_FILE_PATTERN = re.compile(
+        r'^.+_tickets(?P<delta>_delta(?:_(?P<sequence>\d+))?)?_batch_(?P<batch>\d+)\.csv$')
     DB_CONFIG = {
         'dbname': os.getenv('DB_NAME', 'fecops'),
         'user': os.getenv('DB_USER', 'fecops-admin'),
@@ -296,6 +299,22 @@ class DataImporter:
         self.db.cursor.execute(insert_query, tuple(normalized_row.values()))
 
 
+def import_order_key(file_path: Path) -> Tuple:
+    """Sort key applying a full export before its delta sets, oldest delta first.
+
+    Rows are upserted, so the last file to contain an issue wins; other CSV
+    files keep name order ahead of the exports.
+    """
+    match = Config.EXPORT_FILE_PATTERN.match(file_path.name)
+    if match is None:
+        return (0, 0, 0, file_path.name)
+    if match.group('delta') is None:
+        sequence = -1
+    else:
+        sequence = int(match.group('sequence') or 0)
+    return (1, sequence, int(match.group('batch')), file_path.name)
+
+
 def execute_import(filename: Optional[str] = None):
     """Main execution function
     Args:
@@ -339,7 +358,7 @@ def execute_import(filename: Optional[str] = None):
                     break
         else:
             # Original logic for processing all files
-            for file_path in Config.DATA_DIR.glob('*.csv'):
+            for file_path in sorted(Config.DATA_DIR.glob('*.csv'), key=import_order_key):
                 for file_type, target_table in Config.VALID_FILE_TYPES.items():
                     if file_type in file_path.name:
                         try:
@@ -1,18 +1,24 @@
+import argparse
 import json
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from atlassian import Jira
 from datetime import datetime, timedelta
 
 from common.jira_util import (
+    download_attachments_bulk,
     download_issue_attachments,
     jql_v2_print,
     load_jql_queries,
     count_issues_in_project,
-    export_issues_to_csv
+    jql_latest_updated_get,
+    jql_updated_since
 )
+from common.batch_export import ExportManifest, batch_set_remove, batches_export, delta_sets_get
+from common.sync_watermark import watermark_get, watermark_set
 import pandas as pd
 # Configure logging
 logging.basicConfig(
@@ -30,6 +36,11 @@ class QueryConfig:
     QUERIES_FILE = Path("config/queries_v2.json")
     EXPORT_BATCH_SIZE = 1000
     DATA_DIR = Path("data")
+    WATERMARK_FILE = DATA_DIR / "sync_watermarks.json"
+    DOWNLOAD_CONCURRENCY = 4
+    # Store attachments in data/downloads/<issue_key>/ instead of data/downloads/
+    DOWNLOAD_PER_ISSUE_DIRS = False
+    QUERY_CONCURRENCY = 4
 
     @classmethod
     def ensure_directories(cls) -> None:
@@ -41,24 +52,71 @@ def process_query_type(
     query_type: str,
     jql_query: str,
     config: QueryConfig,
-    stats: Dict
+    stats: Dict,
+    incremental: bool = False,
+    resume: bool = False,
+    watermark_key: Optional[str] = None
 ) -> bool:
     """
     Process a specific query type (closed or canceled tickets).
 
+    In incremental mode the query is restricted to issues updated since the
+    stored watermark for this query type, and only those are written to a
+    new delta set ``jira_{query_type}_tickets_delta_{n}_batch_*.csv``;
+    db_import upserts the full export first and then the delta sets in
+    order, so newer rows always win. A full export removes the delta sets
+    it supersedes. The first incremental run, with no watermark yet, does a
+    full export.
+
+    Every completed batch is checkpointed with its offset, row count and
+    checksum in ``{file_prefix}_manifest.json``; failed batches are retried
+    with exponential backoff. With ``resume``, batches already exported
+    intact by a previous run of the same query are skipped.
+
     Args:
         query_type: Type of query (closed/canceled)
         jql_query: JQL query string
         config: QueryConfig instance
         stats: Dictionary to store statistics
+        incremental: Only export tickets updated since the last run
+        resume: Keep completed batches from the previous run and re-fetch the rest
+        watermark_key: Configured query name the sync watermark is stored
+            under; query types can be shared by queries with different JQL.
+            Defaults to query_type.
 
     Returns:
         bool: True if processing was successful
     """
     try:
-        # Get statistics for the query type
+        watermark = None
+        latest_updated = None
+        watermark_key = watermark_key or query_type
+        if incremental:
+            watermark = watermark_get(config.WATERMARK_FILE, watermark_key)
+            latest_updated = jql_latest_updated_get(
+                jql_query, str(config.CONFIG_FILE))
+
+        if watermark:
+            logger.info(f"Exporting {query_type} tickets updated since {watermark}")
+            export_query = jql_updated_since(jql_query, watermark)
+            delta_sets = delta_sets_get(config.DATA_DIR, query_type)
+            sequence = delta_sets[-1] + 1 if delta_sets else 1
+            if resume and delta_sets:
+                # The watermark only advances on success, so an unfinished
+                # last delta set still has the same query
+                previous = ExportManifest.load(
+                    config.DATA_DIR / f'jira_{query_type}_tickets_delta_{delta_sets[-1]}_manifest.json')
+                if previous is not None and previous.jql == export_query:
+                    sequence = delta_sets[-1]
+            file_prefix = f'jira_{query_type}_tickets_delta_{sequence}'
+        else:
+            export_query = jql_query
+            file_prefix = f'jira_{query_type}_tickets'
+
+        # Get statistics for the query type; the count sizes the export
+        # batches, so it must not come from the count cache
         total, records, pages = count_issues_in_project(
-            jql_query, str(config.CONFIG_FILE))
+            export_query, str(config.CONFIG_FILE), use_cache=False)
 
         # Store statistics
         stats[query_type] = {
@@ -72,37 +130,32 @@ def process_query_type(
             logger.info(f"No {query_type} tickets found to export")
             return True
 
-        # Export tickets in batches
-        # Remove existing files for this query type
-        existing_files = list(config.DATA_DIR.glob(f'jira_{query_type}_tickets_batch_*.csv'))
-        if existing_files:
-            logger.info(f"Removing {len(existing_files)} existing {query_type} ticket files")
-            for file in existing_files:
-                try:
-                    file.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to remove file {file}: {str(e)}")
-
-        for batch in range(0, records, config.EXPORT_BATCH_SIZE):
-            output_file = config.DATA_DIR / \
-                f'jira_{query_type}_tickets_batch_{batch // config.EXPORT_BATCH_SIZE + 1}.csv'
-
-            success, count = export_issues_to_csv(
-                jql_query,
-                str(config.CONFIG_FILE),
-                config.FIELDS,
-                str(output_file),
-                max_results=config.EXPORT_BATCH_SIZE,
-                start_at=batch
-            )
-
-            if not success:
-                logger.error(
-                    f"Failed to export {query_type} tickets batch starting at {batch}")
-                return False
-
-            logger.info(
-                f"Exported {count:,} {query_type} tickets to {output_file}")
+        if not watermark:
+            # Older delta sets would overwrite the fresh full export on import
+            for sequence in delta_sets_get(config.DATA_DIR, query_type):
+                batch_set_remove(config.DATA_DIR, f'jira_{query_type}_tickets_delta_{sequence}')
+            batch_set_remove(config.DATA_DIR, f'jira_{query_type}_tickets_delta')
+
+        # Export tickets in batches, checkpointed so a rerun with resume
+        # only re-fetches batches that are missing or failed
+        success, _ = batches_export(
+            export_query,
+            str(config.CONFIG_FILE),
+            config.FIELDS,
+            config.DATA_DIR,
+            file_prefix,
+            records,
+            config.EXPORT_BATCH_SIZE,
+            resume
+        )
+        if not success:
+            logger.error(
+                f"Failed to export some {query_type} ticket batches; rerun with --resume")
+            return False
+
+        if incremental and latest_updated:
+            watermark_set(config.WATERMARK_FILE, watermark_key, latest_updated)
+            logger.info(f"Advanced {query_type} watermark to {latest_updated}")
 
         return True
 
@@ -128,13 +181,89 @@ def print_statistics(stats: Dict) -> None:
     logger.info(f"Total tickets processed: {total_records:,}")
 
 
-def main(query_name: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None):
+def queries_concurrent_run(
+    queries: Dict,
+    config: QueryConfig,
+    stats: Dict,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    incremental: bool = False,
+    resume: bool = False
+) -> List[str]:
+    """
+    Process every configured query type concurrently.
+
+    Each query type runs in its own worker, so the run takes about as long as
+    the slowest query instead of the sum of all of them. Jira traffic stays
+    bounded by the shared client pool's in-flight cap and rate limiter. A
+    failing query type is logged and does not stop the others.
+
+    Args:
+        queries: Queries loaded from the queries configuration file
+        config: QueryConfig instance
+        stats: Dictionary to store merged statistics
+        from_date: Start date for date range queries (optional)
+        to_date: End date for date range queries (optional)
+        incremental: Only export tickets updated since the last run
+        resume: Only re-fetch batches missing or failed in the last run
+
+    Returns:
+        List of query types that failed
+
+    Raises:
+        ValueError: If two queries map to the same query type
+    """
+    jobs = {}
+    for query_name, query_cfg in queries.items():
+        if not query_cfg.get("query"):
+            logger.warning(f"No query found for {query_name} in configuration")
+            continue
+        # Same query type derivation as a single-query run; it names the
+        # output files, so two queries sharing one would overwrite each other
+        query_type = query_name.split("_tickets")[0]
+        if query_type in jobs:
+            raise ValueError(
+                f"Queries {jobs[query_type]} and {query_name} share query type {query_type}")
+        jobs[query_type] = query_name
+
+    def query_type_run(query_type: str, query_name: str) -> Tuple[bool, Dict]:
+        query = queries[query_name]["query"]
+        if from_date is not None and to_date is not None and "date_range" in query_name:
+            query = jql_v2_print(query, from_date, to_date)
+        query_stats = {}
+        return process_query_type(
+            query_type, query, config, query_stats, incremental, resume, query_name), query_stats
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=config.QUERY_CONCURRENCY) as executor:
+        futures = {
+            query_type: executor.submit(query_type_run, query_type, query_name)
+            for query_type, query_name in jobs.items()
+        }
+        for query_type, future in futures.items():
+            try:
+                success, query_stats = future.result()
+            except Exception as e:
+                logger.error(f"Error processing {query_type} tickets: {str(e)}")
+                success, query_stats = False, {}
+            stats.update(query_stats)
+            if not success:
+                logger.error(f"Failed to process {query_type} tickets")
+                failed.append(query_type)
+    return failed
+
+
+def main(query_name: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None,
+         incremental: bool = False, resume: bool = False, concurrent: bool = False):
     """Main execution function
     
     Args:
         query_name: Name of specific query to run (optional)
         from_date: Start date for date range queries (optional) 
         to_date: End date for date range queries (optional)
+        incremental: Only export tickets updated since the last run (optional)
+        resume: Only re-fetch batches missing or failed in the last run (optional)
+        concurrent: Run every configured query concurrently (optional)
     """
     try:
         config = QueryConfig()
@@ -160,10 +289,21 @@ def main(query_name: Optional[str] = None, from_date: Optional[str] = None, to_d
                 query = jql_v2_print(query, from_date, to_date)
                 
             query_type = query_name.split("_tickets")[0]
-            if not process_query_type(query_type, query, config, stats):
+            if not process_query_type(query_type, query, config, stats, incremental, resume, query_name):
                 logger.error(f"Failed to process {query_type} tickets")
                 return 1
                 
+        # Run every configured query type concurrently
+        elif concurrent:
+            failed = queries_concurrent_run(
+                queries, config, stats, from_date, to_date, incremental, resume)
+            if stats:
+                print_statistics(stats)
+            if failed:
+                logger.error(f"Failed query types: {', '.join(failed)}")
+                return 1
+            return 0
+
         # Otherwise run all configured queries
         else:
             # Process closed tickets if query exists
@@ -176,7 +316,10 @@ def main(query_name: Optional[str] = None, from_date: Optional[str] = None, to_d
                     "closed",
                     closed_query,
                     config,
-                    stats
+                    stats,
+                    incremental,
+                    resume,
+                    "closed_tickets_date_range"
                 ):
                     logger.error("Failed to process closed tickets")
                     return 1
@@ -193,7 +336,10 @@ def main(query_name: Optional[str] = None, from_date: Optional[str] = None, to_d
                     "canceled",
                     canceled_query,
                     config,
-                    stats
+                    stats,
+                    incremental,
+                    resume,
+                    "canceled_tickets_date_range"
                 ):
                     logger.error("Failed to process canceled tickets")
                     return 1
@@ -204,7 +350,10 @@ def main(query_name: Optional[str] = None, from_date: Optional[str] = None, to_d
                     "in_progress",
                     queries["in_progress_tickets"]["query"],
                     config,
-                    stats
+                    stats,
+                    incremental,
+                    resume,
+                    "in_progress_tickets"
                 ):
                     logger.error("Failed to process in progress tickets")
                     return 1
@@ -216,7 +365,10 @@ def main(query_name: Optional[str] = None, from_date: Optional[str] = None, to_d
                     "royal",
                     queries["royalty_tickets"]["query"],
                     config,
-                    stats
+                    stats,
+                    incremental,
+                    resume,
+                    "royalty_tickets"
                 ):
                     logger.error("Failed to process royalty tickets")
                     return 1
@@ -299,25 +451,18 @@ def download_main():
                 logger.error("CSV file must contain a 'key' column with Jira issue keys")
                 return 1
                 
-            downloaded_files = []
-            
-            # Process each issue key and download attachments
-            for issue_key in issues_df["Issue key"].unique():
-                logger.info(f"Downloading attachments for issue {issue_key}")
-                
-                # Download attachments for current issue
-                issue_files = download_issue_attachments(
-                    issue_key,
-                    str(config.CONFIG_FILE),
-                    str(data_dir)
-                )
-                
-                if issue_files:
-                    downloaded_files.extend(issue_files)
-                    logger.info(f"Downloaded {len(issue_files)} files for issue {issue_key}")
-                else:
-                    logger.warning(f"No attachments found for issue {issue_key}")
-                    
+            issue_keys = list(issues_df["Issue key"].unique())
+            logger.info(f"Downloading attachments for {len(issue_keys)} issues")
+
+            # Download attachments for all issues with a bounded worker pool
+            downloaded_files = download_attachments_bulk(
+                issue_keys,
+                str(config.CONFIG_FILE),
+                str(data_dir),
+                concurrency=config.DOWNLOAD_CONCURRENCY,
+                per_issue_dirs=config.DOWNLOAD_PER_ISSUE_DIRS
+            )
+
         except FileNotFoundError:
             logger.error(f"Could not find issues CSV file at {data_dir / 'issues.csv'}")
             return 1
@@ -405,6 +550,18 @@ def attachment_replace_main():
         return 1
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export Jira tickets to CSV")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only export tickets updated since the last run")
+    parser.add_argument("--resume", action="store_true",
+                        help="only re-fetch batches missing or failed in the last run")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="run every configured query concurrently")
+    args = parser.parse_args()
+
     to_date = datetime.now().strftime("%Y-%m-%d")
     from_date = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
-    sys.exit(main(from_date=from_date, to_date=to_date, query_name="closed_tickets_date_range"))
\ No newline at end of file
+    query_name = None if args.concurrent else "closed_tickets_date_range"
+    sys.exit(main(from_date=from_date, to_date=to_date, query_name=query_name,
+                  incremental=args.incremental, resume=args.resume,
+                  concurrent=args.concurrent))
\ No newline at end of file
@@ -1,29 +1,47 @@
+import os
+
 from common.json_util import *
 from common.conditions_enum import *
 from common.rule_engine_util import *
+from common.compiled_ruleset import RuleDecisionCache
+from common.ruleset_manager import ruleset_active_get
+from common.rule_profiler import RULE_PROFILER
+
+# Opt-in memoization of rule decisions (RULES_MEMOIZE=true)
+RULES_MEMOIZE = os.getenv("RULES_MEMOIZE", "false").lower() == "true"
+RULE_DECISION_CACHE = RuleDecisionCache(int(os.getenv("RULE_DECISION_CACHE_SIZE", "4096")))
+
+
+def rules_exec(data, memoize=None):
+    # Rules are compiled once and recompiled only when their config changes;
+    # in the API process the RulesetManager swaps new versions in
+    if memoize is None:
+        memoize = RULES_MEMOIZE
+    if memoize:
+        return RULE_DECISION_CACHE.evaluate(ruleset_active_get(), data)
+    return ruleset_active_get().evaluate(data)
+
+
+def rules_batch_exec(rows):
+    # Same result as rules_exec for each of many rows (list of dicts or DataFrame)
+    return ruleset_active_get().evaluate_batch(rows)
+
+
+def rules_condition_report():
+    # Per-condition and per-rule hit rates of the active ruleset (counted while RULE_PROFILING is on)
+    return ruleset_active_get().condition_report()
+
+
+def rules_decision_cache_stats():
+    # Hit rate of the rule decision memoization
+    return RULE_DECISION_CACHE.stats()
 
 
-def rules_exec(data):
-    rules_list = []
-    rules_list.sort(key=sort_fn)
-    results = []
-    executed_rules = 0
-    sum = 0
-    rules_list = rules_set_setup(rules_set_cfg_read())
-    for rule in rules_list:
-        print("rule", rule)
-        result = rule_run(rule, data)
-        executed_rules = executed_rules+1
-        sum = sum + (float(result["rule_point"]) * float(result["weight"]))
-        results.append(result["action_result"])
-    tmp_str = str("".join(results))
-    tmp_action = rule_action_handle(actions_set_cfg_read(), tmp_str)
-    rs = {
-        "total_points": sum,
-        "pattern_result": tmp_str,
-        "action_recommendation": tmp_action
-    }
-    return rs
+def rules_profile_report(file_path=None):
+    # Per-rule and per-condition timings (RULE_PROFILING=true); written as JSON if file_path is given
+    if file_path is not None:
+        RULE_PROFILER.dump(file_path)
+    return RULE_PROFILER.report()
 
 
 if __name__ == "__main__":
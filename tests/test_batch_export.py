@@ -0,0 +1,85 @@
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from common import batch_export
+from common.batch_export import ExportManifest, batches_export
+
+JQL = "project = BO ORDER BY key"
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """Fake export_issues_to_csv recording the offsets it was asked for."""
+    calls = []
+    failing_offsets = set()
+
+    def export(jql, config_file, fields, output_file, max_results, start_at):
+        calls.append(start_at)
+        if start_at in failing_offsets:
+            return False, 0
+        with open(output_file, 'w') as file:
+            file.write("Issue key\n" + "".join(f"BO-{start_at + n}\n" for n in range(max_results)))
+        return True, max_results
+
+    monkeypatch.setattr(batch_export, "export_issues_to_csv", export)
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    return SimpleNamespace(calls=calls, failing_offsets=failing_offsets)
+
+
+def run(tmp_path, resume, jql=JQL):
+    return batches_export(jql, "config.json", [], tmp_path, "jira_bo_tickets", 25, 10, resume)
+
+
+def test_full_run_checkpoints_every_batch(tmp_path, exporter):
+    success, files = run(tmp_path, resume=False)
+    assert success
+    assert [path.rsplit("/", 1)[1] for path in files] == [
+        "jira_bo_tickets_batch_1.csv", "jira_bo_tickets_batch_2.csv", "jira_bo_tickets_batch_3.csv"]
+    assert exporter.calls == [0, 10, 20]
+    manifest = ExportManifest.load(tmp_path / "jira_bo_tickets_manifest.json")
+    assert manifest.matches(JQL, 10, 25)
+    assert all(manifest.batch_done(number) for number in (1, 2, 3))
+
+
+def test_resume_fetches_only_failed_batches(tmp_path, exporter):
+    exporter.failing_offsets.add(10)
+    success, _ = run(tmp_path, resume=False)
+    assert not success
+    # The failing batch was retried, the others still ran
+    assert exporter.calls == [0] + [10] * (batch_export.BATCH_RETRIES + 1) + [20]
+    saved = json.loads((tmp_path / "jira_bo_tickets_manifest.json").read_text())
+    assert saved["batches"]["2"]["status"] == "failed"
+
+    exporter.failing_offsets.clear()
+    exporter.calls.clear()
+    success, _ = run(tmp_path, resume=True)
+    assert success
+    assert exporter.calls == [10]
+
+
+def test_resume_refetches_batch_whose_file_changed(tmp_path, exporter):
+    run(tmp_path, resume=False)
+    (tmp_path / "jira_bo_tickets_batch_3.csv").write_text("Issue key\n")
+    (tmp_path / "jira_bo_tickets_batch_1.csv").unlink()
+    exporter.calls.clear()
+    run(tmp_path, resume=True)
+    assert exporter.calls == [0, 20]
+
+
+def test_resume_of_different_query_starts_over(tmp_path, exporter):
+    run(tmp_path, resume=False)
+    exporter.calls.clear()
+    run(tmp_path, resume=True, jql="project = BO AND status = Open ORDER BY key")
+    assert exporter.calls == [0, 10, 20]
+
+
+def test_without_resume_everything_is_fetched_again(tmp_path, exporter):
+    run(tmp_path, resume=False)
+    (tmp_path / "jira_bo_tickets_batch_9.csv").write_text("stale")
+    exporter.calls.clear()
+    run(tmp_path, resume=False)
+    assert exporter.calls == [0, 10, 20]
+    assert not (tmp_path / "jira_bo_tickets_batch_9.csv").exists()
@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from benchmarks.rules_batch_benchmark import reminder_rows_build
+from common.compiled_ruleset import ruleset_compile, ruleset_get
+from common.rule_profiler import RULE_PROFILER
+from common.rule_engine_util import (
+    actions_set_cfg_read, rule_action_handle, rule_run, rules_set_cfg_read, rules_set_setup)
+
+EDGE_ROWS = [
+    {},
+    {'result_of_modulus': 0},
+    {'p_days_since_start_review': 'late', 'result_of_modulus': 0},
+    {'p_days_since_approval': None, 'p_days_since_expected_date': 3, 'result_of_modulus': 0},
+    {'p_days_since_start_review': 7.0, 'result_of_modulus': 1.0},
+]
+
+
+@pytest.fixture(scope="module")
+def legacy_rules_exec():
+    """The rule_engine_util path rules_exec took before rules were compiled."""
+    rules = rules_set_setup(rules_set_cfg_read())
+    actions = actions_set_cfg_read()
+
+    def rules_exec(data):
+        total_points = 0
+        results = []
+        for rule in rules:
+            result = rule_run(rule, data)
+            total_points += float(result["rule_point"]) * float(result["weight"])
+            results.append(result["action_result"])
+        pattern_result = "".join(results)
+        return {
+            "total_points": total_points,
+            "pattern_result": pattern_result,
+            "action_recommendation": rule_action_handle(actions, pattern_result)
+        }
+
+    return rules_exec
+
+
+def test_compiled_ruleset_matches_rule_engine_util(legacy_rules_exec):
+    ruleset = ruleset_get()
+    rows = reminder_rows_build(1000) + EDGE_ROWS
+    assert [ruleset.evaluate(row) for row in rows] == [legacy_rules_exec(row) for row in rows]
+
+
+def test_reminder_rows_reach_every_rule():
+    # Guards the comparison above against rows that never match anything
+    ruleset = ruleset_get()
+    patterns = {ruleset.evaluate(row)["pattern_result"] for row in reminder_rows_build(1000)}
+    for position in range(len(ruleset.rules)):
+        assert any(pattern[position] != "-" for pattern in patterns)
+
+
+def test_ruleset_is_compiled_once_while_config_unchanged():
+    assert ruleset_get() is ruleset_get()
+
+
+def condition(condition_id, attribute, equation, constant):
+    return {"condition_id": condition_id, "condition_name": condition_id, "attribute": attribute,
+            "equation": equation, "constant": constant}
+
+
+def rule(rule_id, mode, items, action_result, rule_point, weight):
+    return {"id": rule_id, "rule_name": rule_id, "type": "complex", "description": rule_id,
+            "result": action_result, "action_result": action_result, "rule_point": rule_point,
+            "weight": weight, "priority": 1, "conditions": {"mode": mode, "items": items}}
+
+
+def exclusive_ruleset_config():
+    """An "or" rule, where a missing attribute only matters once it is reached."""
+    conditions = [condition("C1", "a", "greater_than", 5), condition("C2", "b", "equal", 0),
+                  condition("C3", "c", "less_than_or_equal", 1)]
+    rules = [rule("R1", "exclusive", ["C1", "C2"], "A", 10, 0.5),
+             rule("R2", "inclusive", ["C2", "C3"], "B", 3, 1)]
+    return rules, conditions, {"AB": "both", "A-": "first", "--": "none"}
+
+
+@pytest.fixture(scope="module")
+def exclusive_ruleset():
+    return ruleset_compile(*exclusive_ruleset_config())
+
+
+BATCH_ROWS = [
+    {"a": 9},
+    {"a": 1},
+    {"b": 0, "c": 1},
+    {"a": 1, "b": 0, "c": 2},
+    {"a": "x", "b": 0, "c": 0},
+    {"a": 7.5, "b": 0.0, "c": -1},
+    {},
+]
+
+
+def frame_records(result):
+    # pandas may store a missing recommendation as NaN
+    return result.astype(object).where(result.notna(), None).to_dict("records")
+
+
+def test_evaluate_batch_matches_evaluate(exclusive_ruleset):
+    assert exclusive_ruleset.evaluate_batch(BATCH_ROWS) == [
+        exclusive_ruleset.evaluate(row) for row in BATCH_ROWS]
+
+
+def test_evaluate_batch_of_dataframe_treats_nan_as_missing(exclusive_ruleset):
+    frame = pd.DataFrame(BATCH_ROWS, index=[f"BO-{n}" for n in range(len(BATCH_ROWS))])
+    result = exclusive_ruleset.evaluate_batch(frame)
+    assert list(result.index) == list(frame.index)
+    assert frame_records(result) == [exclusive_ruleset.evaluate(row) for row in BATCH_ROWS]
+
+
+def test_evaluate_batch_of_reminder_rows_matches_evaluate():
+    ruleset = ruleset_get()
+    rows = reminder_rows_build(1000) + EDGE_ROWS
+    expected = [ruleset.evaluate(row) for row in rows]
+    assert ruleset.evaluate_batch(rows) == expected
+    assert frame_records(ruleset.evaluate_batch(pd.DataFrame(rows))) == expected
+
+
+def test_hit_counters_only_kept_while_profiling(monkeypatch):
+    ruleset = ruleset_compile(*exclusive_ruleset_config())
+    for row in BATCH_ROWS:
+        ruleset.evaluate(row)
+    assert [rule["evaluations"] for rule in ruleset.condition_report()["rules"]] == [0, 0]
+
+    monkeypatch.setattr(RULE_PROFILER, "enabled", True)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(ruleset.evaluate, BATCH_ROWS * 200))
+    RULE_PROFILER.reset()
+    report = ruleset.condition_report()
+    rows = len(BATCH_ROWS) * 200
+    assert [rule["evaluations"] for rule in report["rules"]] == [rows, rows]
+    assert [rule["matches"] for rule in report["rules"]] == [
+        sum(ruleset.evaluate(row, record=False)["pattern_result"][position] != "-"
+            for row in BATCH_ROWS) * 200 for position in range(2)]
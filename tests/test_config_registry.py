@@ -0,0 +1,67 @@
+import json
+import os
+
+import pytest
+
+from common.config_registry import ConfigRegistry
+
+
+def json_write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "statuses.json"
+    json_write(path, {"Open": "initiation", "Done": "done"}, mtime_ns=1_000_000_000)
+    return path
+
+
+def test_unchanged_file_is_served_from_cache(config_file):
+    registry = ConfigRegistry()
+    first = registry.json_get(str(config_file))
+    assert registry.json_get(str(config_file)) is first
+    assert registry.stats() == {"cache_hits": 1, "loads": 1, "files": 1}
+
+
+def test_mtime_change_is_picked_up(config_file):
+    registry = ConfigRegistry()
+    registry.json_get(str(config_file))
+    # Same size, new mtime: only the mtime tells the versions apart
+    json_write(config_file, {"Open": "analysis", "Done": "done"}, mtime_ns=2_000_000_000)
+    assert registry.json_get(str(config_file))["Open"] == "analysis"
+    assert registry.stats()["loads"] == 2
+
+
+def test_size_change_is_picked_up_within_same_mtime(config_file):
+    registry = ConfigRegistry()
+    registry.json_get(str(config_file))
+    json_write(config_file, {"Open": "initiation", "Done": "done", "Hold": "hold"},
+               mtime_ns=1_000_000_000)
+    assert "Hold" in registry.json_get(str(config_file))
+
+
+def test_snapshots_are_read_only(config_file):
+    snapshot = ConfigRegistry().json_get(str(config_file))
+    with pytest.raises(TypeError):
+        snapshot["Open"] = "done"
+
+
+def test_reload_hooks_run_on_change_and_forced_reload(config_file):
+    registry = ConfigRegistry()
+    reloaded = []
+    registry.on_reload(reloaded.append)
+    registry.json_get(str(config_file))
+    assert reloaded == []
+    json_write(config_file, {"Open": "analysis"}, mtime_ns=2_000_000_000)
+    registry.json_get(str(config_file))
+    registry.reload(str(config_file))
+    assert reloaded == [os.path.abspath(config_file)] * 2
+
+
+def test_ini_snapshot(tmp_path):
+    path = tmp_path / "config.ini"
+    path.write_text("[jira]\nURL = https://jira.test\n")
+    assert ConfigRegistry().ini_get(str(path))["jira"]["url"] == "https://jira.test"
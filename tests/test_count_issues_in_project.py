@@ -0,0 +1,17 @@
+from common import jira_util
+
+
+def test_export_count_bypasses_the_count_cache(monkeypatch):
+    totals = iter([100, 250])
+    monkeypatch.setattr(jira_util, "jira_client_get", lambda config_file: object())
+    monkeypatch.setattr(jira_util, "jql_total_probe", lambda jira, jql: next(totals))
+    jira_util.JQL_COUNT_CACHE.invalidate()
+
+    assert jira_util.count_issues_in_project("project = BO", "config.json") == (100, 100, 1)
+    # Display counts within the TTL reuse the probe
+    assert jira_util.count_issues_in_project("project  =  BO", "config.json") == (100, 100, 1)
+    # A count that sizes an export probes again, and refreshes the cache
+    assert jira_util.count_issues_in_project(
+        "project = BO", "config.json", use_cache=False) == (250, 250, 3)
+    assert jira_util.count_issues_in_project("project = BO", "config.json") == (250, 250, 3)
+    jira_util.JQL_COUNT_CACHE.invalidate()
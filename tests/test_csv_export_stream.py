@@ -0,0 +1,85 @@
+import csv
+import gzip
+import io
+
+import pytest
+
+from common import jira_util
+from common.jira_util import CsvRecordCounter
+
+CSV_BODY = (
+    b'Issue key,Summary,Description\n'
+    b'BO-1,Plain,one line\n'
+    b'BO-2,"Quoted, comma","first line\nsecond line"\n'
+    b'BO-3,"Has ""quotes""","\xe1\xbb\x87 utf-8\n"\n'
+)
+
+
+class FakeStream:
+    def __init__(self, body, chunk_size, fail_after=None):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size):
+        for number, start in enumerate(range(0, len(self.body), self.chunk_size)):
+            if self.fail_after is not None and number >= self.fail_after:
+                raise ConnectionError("connection reset")
+            yield self.body[start:start + self.chunk_size]
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    monkeypatch.setattr(jira_util, "jira_client_get", lambda config_file: object())
+
+    def stream_set(body, chunk_size=7, fail_after=None):
+        monkeypatch.setattr(
+            jira_util, "jira_csv_stream_open",
+            lambda *args: FakeStream(body, chunk_size, fail_after))
+
+    return stream_set
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+def test_record_counter_ignores_newlines_in_quotes(chunk_size):
+    counter = CsvRecordCounter()
+    for start in range(0, len(CSV_BODY), chunk_size):
+        counter.feed(CSV_BODY[start:start + chunk_size])
+    assert counter.records == len(list(csv.reader(io.StringIO(CSV_BODY.decode()))))
+
+
+def test_record_counter_counts_unterminated_last_record():
+    counter = CsvRecordCounter()
+    counter.feed(b'Issue key\nBO-1\nBO-2')
+    assert counter.records == 3
+
+
+def test_export_streams_to_file_and_counts_issues(tmp_path, stream):
+    stream(CSV_BODY)
+    output_file = tmp_path / "batch_1.csv"
+    assert jira_util.export_issues_to_csv("project = BO", "config.json", [], str(output_file)) == \
+        (True, 3)
+    assert output_file.read_bytes() == CSV_BODY
+    assert not (tmp_path / "batch_1.csv.part").exists()
+
+
+def test_export_compressed(tmp_path, stream):
+    stream(CSV_BODY)
+    output_file = tmp_path / "batch_1.csv.gz"
+    assert jira_util.export_issues_to_csv(
+        "project = BO", "config.json", [], str(output_file), compress=True) == (True, 3)
+    assert gzip.decompress(output_file.read_bytes()) == CSV_BODY
+
+
+def test_interrupted_export_leaves_no_file(tmp_path, stream):
+    stream(CSV_BODY, fail_after=2)
+    output_file = tmp_path / "batch_1.csv"
+    assert jira_util.export_issues_to_csv(
+        "project = BO", "config.json", [], str(output_file)) == (False, 0)
+    assert list(tmp_path.iterdir()) == []
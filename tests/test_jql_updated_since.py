@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from common.jira_util import jql_updated_since, jql_watermark_format
+
+WATERMARK = "2024-09-01T10:00:00.000+0700"
+WATERMARK_UTC = datetime(2024, 9, 1, 3, 0, tzinfo=timezone.utc)
+
+
+def test_watermark_in_account_timezone():
+    assert jql_watermark_format(WATERMARK, "Asia/Ho_Chi_Minh") == "2024-09-01 10:00"
+    assert jql_watermark_format(WATERMARK, "UTC") == "2024-09-01 03:00"
+    assert jql_watermark_format(WATERMARK, "America/New_York") == "2024-08-31 23:00"
+
+
+def test_watermark_without_timezone_is_never_late():
+    literal = datetime.strptime(jql_watermark_format(WATERMARK), "%Y-%m-%d %H:%M")
+    # Whatever timezone Jira reads the literal in, it must not be after the watermark
+    for zone in ("Etc/GMT+12", "UTC", "Asia/Ho_Chi_Minh", "Pacific/Kiritimati"):
+        assert literal.replace(tzinfo=ZoneInfo(zone)) <= WATERMARK_UTC
+    assert WATERMARK_UTC - literal.replace(tzinfo=timezone.utc) <= timedelta(hours=14)
+
+
+def test_updated_clause_keeps_order_by():
+    assert jql_updated_since("project = BO ORDER BY key", WATERMARK, "Asia/Ho_Chi_Minh") == \
+        '(project = BO) AND updated >= "2024-09-01 10:00" ORDER BY key'
@@ -0,0 +1,67 @@
+import pytest
+
+from benchmarks.synthetic_issues import PARSING_PATHS, synthetic_cr_issues_build
+from common.issue_field_handler_v2 import issue_row_extractor_compile, perform_operation
+from common.json_util import (
+    JSONPATH_NOT_FOUND, jsonpath_first_compile, parse_json_v2, row_extractor_compile,
+    simple_path_steps)
+
+RAW_PATHS = {item: path for item, path in PARSING_PATHS.items() if isinstance(path, str)}
+
+EDGE_DOCUMENTS = [
+    {},
+    None,
+    [],
+    {"fields": None},
+    {"fields": {"customfield_13805": None}},
+    {"fields": {"customfield_13805": [{"value": 0}, {"value": "Second"}]}},
+    {"fields": {"customfield_13805": {"value": ""}}},
+    {"fields": {"customfield_13805": "scalar"}},
+    {"fields": [{"customfield_13805": [{"other": 1}, {"value": False}]}]},
+    {"fields": {"status": {"name": "Open"}, "summary": ""}},
+]
+
+
+@pytest.mark.parametrize("path, steps", [
+    ("$.fields.summary", ("fields", "summary")),
+    ("$.fields[*].customfield_13805[*].value", ("fields", None, "customfield_13805", None, "value")),
+    ("$.fields.comment.comments[-1:]", None),
+    ("$.fields[?(@.x)]", None),
+    ("$..value", None),
+])
+def test_simple_path_steps(path, steps):
+    assert simple_path_steps(path) == steps
+
+
+@pytest.mark.parametrize("document", EDGE_DOCUMENTS)
+@pytest.mark.parametrize("path", [
+    "$.fields.summary",
+    "$.fields.status.name",
+    "$.fields[*].customfield_13805[*].value",
+    "$.fields.customfield_13805[*].value",
+    "$.fields[*].customfield_13805",
+])
+def test_compiled_accessor_matches_jsonpath(path, document):
+    value = jsonpath_first_compile(path)(document)
+    assert (0 if value is JSONPATH_NOT_FOUND else value) == parse_json_v2(path, document)
+
+
+def test_row_extractor_matches_parse_json_v2():
+    row_extract = row_extractor_compile(RAW_PATHS)
+    for issue in synthetic_cr_issues_build(200) + EDGE_DOCUMENTS[:1]:
+        assert row_extract(issue) == [parse_json_v2(path, issue) for path in RAW_PATHS.values()]
+
+
+def test_issue_row_extractor_matches_perform_operation():
+    row_extract = issue_row_extractor_compile(PARSING_PATHS)
+    for issue in synthetic_cr_issues_build(200):
+        assert row_extract(issue) == [
+            perform_operation(item, issue, PARSING_PATHS[item]) for item in PARSING_PATHS]
+
+
+def test_issue_row_extractor_filters_keep_mapping_order():
+    issue = synthetic_cr_issues_build(1)[0]
+    fields = list(PARSING_PATHS)
+    filters = [fields[2], fields[0]]
+    assert issue_row_extractor_compile(PARSING_PATHS, filters)(issue) == [
+        perform_operation(item, issue, PARSING_PATHS[item]) for item in fields[:3:2]]
@@ -0,0 +1,113 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from common.rate_limiter import AdaptiveRateLimiter, RateLimitedAdapter, retry_after_parse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def limiter_build(clock, **kwargs):
+    return AdaptiveRateLimiter(rate=10.0, burst=1.0, max_jitter=0.0,
+                               clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def response_build(status_code, retry_after=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b""
+    response._content_consumed = True
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+def adapter_scripted(monkeypatch, limiter, status_codes, **kwargs):
+    # Replace the network send with canned responses, one per attempt
+    responses = iter(status_codes)
+    sent = []
+
+    def send(self, request, **send_kwargs):
+        sent.append(request.url)
+        status_code, retry_after = next(responses)
+        return response_build(status_code, retry_after)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    return RateLimitedAdapter(limiter, **kwargs), sent
+
+
+def test_retry_after_parse():
+    assert retry_after_parse("3") == 3.0
+    assert retry_after_parse("-1") == 0.0
+    assert retry_after_parse("Mon, 01 Jan 2001 00:00:00 GMT") == 0.0
+    assert retry_after_parse(None) is None
+    assert retry_after_parse("soon") is None
+
+
+def test_throttle_backs_off_and_pauses_every_caller():
+    clock = FakeClock()
+    limiter = limiter_build(clock)
+    limiter.acquire()
+    assert limiter.throttled(2.0) == 2.0
+    assert limiter.rate == 5.0
+    limiter.acquire()
+    # Nothing is sent before the Retry-After has passed
+    assert clock.now >= 2.0
+
+
+def test_throttles_in_one_pause_count_as_one_signal():
+    clock = FakeClock()
+    limiter = limiter_build(clock)
+    limiter.throttled(1.0)
+    limiter.throttled(1.0)
+    assert limiter.rate == 5.0
+    assert limiter.stats()["throttled"] == 2
+
+
+def test_success_raises_rate_up_to_the_ceiling():
+    clock = FakeClock()
+    limiter = limiter_build(clock, max_rate=10.5)
+    limiter.succeeded()
+    assert limiter.rate == 10.1
+    for _ in range(20):
+        limiter.succeeded()
+    assert limiter.rate == 10.5
+
+
+def test_adapter_retries_429_and_503(monkeypatch):
+    clock = FakeClock()
+    limiter = limiter_build(clock)
+    adapter, sent = adapter_scripted(
+        monkeypatch, limiter, [(429, "2"), (503, "1"), (200, None)])
+    request = requests.Request("GET", "http://jira.test/rest/api/2/search").prepare()
+
+    response = adapter.send(request)
+
+    assert response.status_code == 200
+    assert len(sent) == 3
+    assert limiter.stats()["throttled"] == 2
+    # Each retry waited at least the Retry-After the server asked for
+    assert clock.now >= 3.0
+
+
+def test_adapter_gives_up_after_max_retries(monkeypatch):
+    clock = FakeClock()
+    limiter = limiter_build(clock)
+    adapter, sent = adapter_scripted(
+        monkeypatch, limiter, [(429, "0")] * 3, max_throttle_retries=2)
+    request = requests.Request("GET", "http://jira.test/rest/api/2/search").prepare()
+
+    response = adapter.send(request)
+
+    assert response.status_code == 429
+    assert len(sent) == 3
@@ -0,0 +1,120 @@
+import pytest
+
+from common.compiled_ruleset import RuleDecisionCache, ruleset_compile
+from common.ruleset_manager import RulesetManager, ruleset_validate
+
+CONDITIONS = [
+    {"condition_id": "C1", "condition_name": "C1", "attribute": "days", "equation": "greater_than",
+     "constant": 3},
+    {"condition_id": "C2", "condition_name": "C2", "attribute": "days", "equation": "greater_than",
+     "constant": 10},
+]
+PATTERNS = {"Y": "remind", "-": "no_need_to_send"}
+
+
+def rule(items, rule_id="R1"):
+    return {"id": rule_id, "rule_name": rule_id, "type": "complex", "description": rule_id,
+            "result": "Y", "action_result": "Y", "rule_point": 20, "weight": 0.1, "priority": 1,
+            "conditions": {"mode": "inclusive", "items": items}}
+
+
+class FakeSource:
+    """Ruleset source serving whatever config the test sets, fingerprinted by a counter."""
+
+    def __init__(self, rules_set):
+        self.description = "fake"
+        self.version = 1
+        self.config = (rules_set, CONDITIONS, PATTERNS)
+        self.error = None
+        self.loads = 0
+
+    def publish(self, rules_set=None, patterns=PATTERNS, error=None):
+        self.version += 1
+        self.config = (rules_set, CONDITIONS, patterns)
+        self.error = error
+
+    def fingerprint(self):
+        return self.version
+
+    def load(self):
+        self.loads += 1
+        if self.error is not None:
+            raise self.error
+        return self.config
+
+
+@pytest.fixture
+def source():
+    return FakeSource([rule(["C1"])])
+
+
+@pytest.fixture
+def manager(source):
+    return RulesetManager(source, poll_seconds=3600)
+
+
+def test_unchanged_source_is_not_recompiled(manager, source):
+    first = manager.active()
+    assert not manager.refresh()
+    assert manager.active() is first
+    assert source.loads == 1
+
+
+def test_changed_source_is_swapped_in(manager, source):
+    before = manager.active()
+    assert before.evaluate({"days": 5})["pattern_result"] == "Y"
+    source.publish([rule(["C2"])])
+    assert manager.refresh()
+    after = manager.active()
+    assert after.version > before.version
+    assert after.evaluate({"days": 5})["pattern_result"] == "-"
+    assert manager.status()["reloads"] == 2
+
+
+@pytest.mark.parametrize("change", [
+    dict(error=ValueError("Expecting value: line 1 column 1")),
+    dict(rules_set=[]),
+    dict(rules_set=[rule(["C1"]), rule(["C9"], "R2")]),
+    dict(rules_set=[rule(["C1"])], patterns={}),
+])
+def test_failed_reload_keeps_active_ruleset(manager, source, change):
+    before = manager.active()
+    source.publish(**change)
+    assert not manager.refresh()
+    assert manager.active() is before
+    assert manager.failures == 1
+    assert manager.last_error
+    # The broken version is not retried until the source changes again
+    loads = source.loads
+    assert not manager.refresh()
+    assert source.loads == loads
+    source.publish([rule(["C2"])])
+    assert manager.refresh()
+    assert manager.active() is not before
+    assert manager.last_error is None
+
+
+def test_first_load_failure_raises(source):
+    source.error = OSError("rules file missing")
+    manager = RulesetManager(source, poll_seconds=3600)
+    with pytest.raises(RuntimeError, match="rules file missing"):
+        manager.active()
+
+
+def test_validate_rejects_rules_with_unknown_conditions():
+    with pytest.raises(ValueError, match="R2"):
+        ruleset_validate(ruleset_compile([rule(["C1"]), rule(["C9"], "R2")], CONDITIONS, PATTERNS))
+
+
+def test_decision_cache_invalidated_on_reload(manager, source):
+    cache = RuleDecisionCache()
+    before = manager.active()
+    assert cache.evaluate(before, {"days": 5})["pattern_result"] == "Y"
+    assert cache.evaluate(before, {"days": 5})["pattern_result"] == "Y"
+    assert cache.stats()["hits"] == 1
+
+    source.publish([rule(["C2"])])
+    manager.refresh()
+    assert cache.evaluate(manager.active(), {"days": 5})["pattern_result"] == "-"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
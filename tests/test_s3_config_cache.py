@@ -0,0 +1,90 @@
+import boto3
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from moto import mock_aws
+
+from common.s3_aws_util import S3ConfigCache
+
+BUCKET = "rule-config-file"
+KEY = "rules/rules_set.json"
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        client.put_object(Bucket=BUCKET, Key=KEY, Body=b'{"version": 1}')
+        yield client
+
+
+def cache_build(tmp_path, s3):
+    return S3ConfigCache(tmp_path, revalidate_after=60, client_factory=lambda: s3)
+
+
+def test_served_from_memory_within_interval(tmp_path, s3):
+    cache = cache_build(tmp_path, s3)
+    assert cache.read(BUCKET, KEY) == '{"version": 1}'
+    assert cache.read(BUCKET, KEY) == '{"version": 1}'
+    assert cache.stats()["downloads"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_unchanged_object_is_revalidated_not_downloaded(tmp_path, s3):
+    cache = cache_build(tmp_path, s3)
+    cache.read(BUCKET, KEY)
+    cache.invalidate()
+    assert cache.read(BUCKET, KEY) == '{"version": 1}'
+    assert cache.stats()["not_modified"] == 1
+    assert cache.stats()["downloads"] == 1
+
+
+def test_changed_object_is_downloaded_again(tmp_path, s3):
+    cache = cache_build(tmp_path, s3)
+    cache.read(BUCKET, KEY)
+    s3.put_object(Bucket=BUCKET, Key=KEY, Body=b'{"version": 2}')
+    cache.invalidate(BUCKET, KEY)
+    assert cache.read(BUCKET, KEY) == '{"version": 2}'
+    assert cache.stats()["downloads"] == 2
+
+
+def test_disk_copy_survives_restart(tmp_path, s3):
+    cache_build(tmp_path, s3).read(BUCKET, KEY)
+    restarted = cache_build(tmp_path, s3)
+    assert restarted.read(BUCKET, KEY) == '{"version": 1}'
+    assert restarted.stats()["hits"] == 1
+    assert restarted.stats()["downloads"] == 0
+
+
+def test_cached_copy_served_when_s3_unreachable(tmp_path, s3, monkeypatch):
+    cache = cache_build(tmp_path, s3)
+    cache.read(BUCKET, KEY)
+
+    def unreachable(**kwargs):
+        raise EndpointConnectionError(endpoint_url="https://s3.amazonaws.com")
+
+    monkeypatch.setattr(s3, "get_object", unreachable)
+    cache.invalidate()
+    assert cache.read(BUCKET, KEY) == '{"version": 1}'
+    assert cache.stats()["fallbacks"] == 1
+    # S3 is left alone for another interval
+    assert cache.read(BUCKET, KEY) == '{"version": 1}'
+    assert cache.stats()["fallbacks"] == 1
+
+
+def test_deleted_object_raises(tmp_path, s3):
+    cache = cache_build(tmp_path, s3)
+    cache.read(BUCKET, KEY)
+    s3.delete_object(Bucket=BUCKET, Key=KEY)
+    cache.invalidate()
+    with pytest.raises(ClientError) as error:
+        cache.read(BUCKET, KEY)
+    assert error.value.response["Error"]["Code"] == "NoSuchKey"
+
+
+def test_missing_object_without_copy_raises(tmp_path, s3):
+    with pytest.raises(ClientError):
+        cache_build(tmp_path, s3).read(BUCKET, "rules/unknown.json")
@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from common import status_index
+from common.status_index import (
+    OPERATION_NOT_MAPPED, STATUS_NOT_MAPPED, StatusIndex, status_index_get)
+
+IT_STAGES = {"Registered": "0. New", "Rolled back": "9. Deployment", "In Deployment": "9. Deployment"}
+BIZ_STATUSES = {"Registered": "Open", "Closed": "Closed", "In Deployment": "Open"}
+OPERATIONS = {"0. New/Open": "initiation", "4. UAT": "uat"}
+
+
+@pytest.fixture
+def index():
+    return StatusIndex(IT_STAGES, BIZ_STATUSES, OPERATIONS)
+
+
+def test_forward_lookups(index):
+    assert index.it_stage_get("Rolled back") == "9. Deployment"
+    assert index.biz_status_get("Closed") == "Closed"
+    assert index.phase_operation_get("4. UAT") == "uat"
+    assert index.it_stage_get("Unknown") == STATUS_NOT_MAPPED
+    assert index.biz_status_get("Unknown") == STATUS_NOT_MAPPED
+    assert index.phase_operation_get("Unknown") == OPERATION_NOT_MAPPED
+
+
+def test_reverse_lookups_keep_config_order(index):
+    assert index.jira_statuses_get("9. Deployment") == ["Rolled back", "In Deployment"]
+    assert index.jira_status_set_get("9. Deployment") == {"Rolled back", "In Deployment"}
+    assert index.biz_jira_statuses_get("Open") == ["Registered", "In Deployment"]
+    assert index.it_status_get("uat") == "4. UAT"
+    assert index.jira_statuses_get("Unknown") == []
+    assert index.it_status_get("unknown") is None
+
+
+def test_reverse_lookup_results_are_copies(index):
+    index.jira_statuses_get("9. Deployment").append("Closed")
+    assert index.jira_statuses_get("9. Deployment") == ["Rolled back", "In Deployment"]
+
+
+@pytest.fixture
+def status_files(tmp_path, monkeypatch):
+    paths = {}
+    for name, data in (("CR_STATUSES_FILE", IT_STAGES), ("BIZ_STATUSES_FILE", BIZ_STATUSES),
+                       ("IT_STATUS_OPERATIONS_FILE", OPERATIONS)):
+        path = tmp_path / f"{name.lower()}.json"
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        monkeypatch.setattr(status_index, name, str(path))
+        paths[name] = path
+    monkeypatch.setattr(status_index, "_STATUS_INDEX", None)
+    return paths
+
+
+def test_shared_index_is_reused_while_config_unchanged(status_files):
+    assert status_index_get() is status_index_get()
+
+
+def test_shared_index_rebuilt_when_config_changes(status_files):
+    before = status_index_get()
+    path = status_files["CR_STATUSES_FILE"]
+    path.write_text(json.dumps(dict(IT_STAGES, Registered="1. Analysis")))
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    after = status_index_get()
+    assert after is not before
+    assert after.it_stage_get("Registered") == "1. Analysis"
+    assert after.jira_statuses_get("1. Analysis") == ["Registered"]
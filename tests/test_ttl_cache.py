@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from common.ttl_cache import TTLCache
+
+
+def test_loader_runs_once_per_key_within_ttl():
+    cache = TTLCache(ttl=60)
+    calls = []
+    assert cache.get_or_load("q", lambda: calls.append(1) or 42) == 42
+    assert cache.get_or_load("q", lambda: calls.append(1) or 43) == 42
+    assert len(calls) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_entries_expire():
+    cache = TTLCache(ttl=0.01)
+    cache.get_or_load("q", lambda: 1)
+    time.sleep(0.02)
+    assert cache.get_or_load("q", lambda: 2) == 2
+
+
+def test_concurrent_callers_share_one_load():
+    cache = TTLCache(ttl=60)
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "total"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("q", loader)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == ["total"] * 8
+    assert len(calls) == 1
+
+
+def test_failed_load_caches_nothing_and_releases_the_key_lock():
+    cache = TTLCache(ttl=60)
+
+    def failing():
+        raise RuntimeError("Jira down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("q", failing)
+    assert cache._key_locks == {}
+    assert cache.stats()["entries"] == 0
+    # The next caller loads again instead of blocking or seeing the failure
+    assert cache.get_or_load("q", lambda: 7) == 7
+
+
+def test_invalidate_drops_entry_and_key_lock():
+    cache = TTLCache(ttl=60)
+    cache.get_or_load("a", lambda: 1)
+    cache.get_or_load("b", lambda: 2)
+    cache.invalidate("a")
+    assert "a" not in cache._key_locks
+    assert cache.get_or_load("a", lambda: 3) == 3
+    cache.invalidate()
+    assert cache._key_locks == {}
+    assert cache.stats()["entries"] == 0
+
+
+def test_oldest_entries_evicted_past_max_entries():
+    cache = TTLCache(ttl=60, max_entries=2)
+    for key in "abc":
+        cache.get_or_load(key, lambda: key)
+    assert cache.stats()["entries"] == 2
+    assert set(cache._key_locks) == {"b", "c"}